@@ -0,0 +1,175 @@
+"""
+메모 통계 집계
+카테고리 × 부동산 유형 × 우선순위 × 지역(시/군/구) × 작성 주 조합별 메모 수를 카운터로 유지하고
+메모 변경 이벤트마다 해당 조합만 더하고 빼서 대시보드가 전체 메모를 다시 훑지 않게 합니다.
+"""
+from collections import Counter
+from datetime import date, timedelta
+from typing import List, Optional, Dict, Any, Tuple
+
+from location_index import parse_location
+from memo_model import MemoModel
+
+
+# 집계 차원 (카운터 키의 순서)
+DIMENSIONS = ("category", "property_type", "priority", "region", "week")
+
+# 대시보드 차원 이름
+DIMENSION_LABELS = {
+    "category": "카테고리",
+    "property_type": "유형",
+    "priority": "우선순위",
+    "region": "지역",
+    "week": "작성 주"
+}
+
+AggregateKey = Tuple[str, str, str, str, str]
+
+
+def week_start(value: str) -> str:
+    """
+    ISO 시각 문자열이 속한 주의 월요일을 구합니다.
+    
+    Args:
+        value (str): ISO 형식 시각
+        
+    Returns:
+        str: 월요일 날짜 (YYYY-MM-DD, 형식이 잘못되면 빈 문자열)
+    """
+    try:
+        day = date.fromisoformat((value or "")[:10])
+    except ValueError:
+        return ""
+    return (day - timedelta(days=day.weekday())).isoformat()
+
+
+def aggregate_key(memo: Dict[str, Any]) -> AggregateKey:
+    """
+    메모가 속한 집계 조합을 구합니다.
+    
+    Args:
+        memo (Dict[str, Any]): 메모 데이터
+        
+    Returns:
+        AggregateKey: DIMENSIONS 순서의 값 (지역은 "시/도 시/군/구")
+    """
+    sido, sigungu, _ = parse_location(memo.get("location", ""))
+    region = " ".join(name for name in (sido, sigungu) if name)
+    return (memo.get("category", ""), memo.get("property_type", ""), memo.get("priority", ""),
+            region, week_start(memo.get("created_at", "")))
+
+
+class MemoAggregates:
+    """메모 변경 이벤트로 점진적으로 갱신되는 다차원 메모 수 집계"""
+    
+    def __init__(self, memo_model: MemoModel):
+        """
+        집계 초기화 (로드된 메모로 한 번 집계)
+        
+        Args:
+            memo_model (MemoModel): 집계할 메모 모델
+        """
+        self.memo_model = memo_model
+        self.counts: Counter = Counter()
+        self.build()
+        memo_model.add_change_listener(self.on_memo_changed)
+    
+    def build(self) -> None:
+        """전체 메모로 집계를 새로 만듭니다."""
+        self.counts = Counter(aggregate_key(memo) for memo in self.memo_model.get_all_memos())
+    
+    def _adjust(self, key: AggregateKey, delta: int) -> None:
+        """조합의 메모 수를 바꿉니다 (0이 되면 지움)."""
+        self.counts[key] += delta
+        if self.counts[key] <= 0:
+            del self.counts[key]
+    
+    def on_memo_changed(self, event: str, memo: Dict[str, Any],
+                        previous: Optional[Dict[str, Any]] = None) -> None:
+        """
+        MemoModel 변경 이벤트 리스너 - 메모 하나의 조합만 갱신합니다.
+        
+        Args:
+            event (str): 변경 이벤트 종류
+            memo (Dict[str, Any]): 변경된 메모
+            previous (Optional[Dict[str, Any]]): 변경 전 메모
+        """
+        # 휴지통으로 옮길 때 이미 빠졌으므로 "purged"는 무시합니다
+        if event in ("created", "restored"):
+            self._adjust(aggregate_key(memo), 1)
+        elif event == "deleted":
+            self._adjust(aggregate_key(memo), -1)
+        elif event == "updated" and previous is not None:
+            old_key, new_key = aggregate_key(previous), aggregate_key(memo)
+            if old_key != new_key:
+                self._adjust(old_key, -1)
+                self._adjust(new_key, 1)
+    
+    def _matching(self, filters: Dict[str, str]):
+        """필터(차원별 값)에 맞는 (조합, 메모 수)를 가져옵니다."""
+        positions = [(DIMENSIONS.index(dimension), value)
+                     for dimension, value in filters.items() if value is not None]
+        for key, count in self.counts.items():
+            if all(key[position] == value for position, value in positions):
+                yield key, count
+    
+    def count(self, **filters: str) -> int:
+        """
+        필터에 맞는 메모 수를 가져옵니다.
+        
+        Args:
+            **filters (str): 차원별 값 (예: priority="높음", property_type="아파트")
+            
+        Returns:
+            int: 메모 수
+        """
+        return sum(count for _, count in self._matching(filters))
+    
+    def breakdown(self, dimension: str, **filters: str) -> List[Tuple[str, int]]:
+        """
+        필터에 맞는 메모 수를 한 차원의 값별로 나눕니다.
+        
+        메모가 아닌 조합 수만큼만 훑으므로 메모 수와 상관없이 빠릅니다.
+        
+        Args:
+            dimension (str): 나눌 차원 (DIMENSIONS 중 하나)
+            **filters (str): 차원별 값
+            
+        Returns:
+            List[Tuple[str, int]]: (값, 메모 수) 리스트 (많은 순)
+        """
+        position = DIMENSIONS.index(dimension)
+        totals: Counter = Counter()
+        for key, count in self._matching(filters):
+            totals[key[position]] += count
+        return sorted(totals.items(), key=lambda item: (-item[1], item[0]))
+    
+    def weekly_counts(self, start: date, weeks: int, **filters: str) -> List[Tuple[date, int]]:
+        """
+        주별 새 메모 수를 가져옵니다.
+        
+        Args:
+            start (date): 첫 주에 포함되는 날짜 (해당 주의 월요일로 맞춤)
+            weeks (int): 주 수
+            **filters (str): 차원별 값
+            
+        Returns:
+            List[Tuple[date, int]]: (주 시작일, 메모 수) 리스트
+        """
+        totals = dict(self.breakdown("week", **filters))
+        monday = start - timedelta(days=start.weekday())
+        days = [monday + timedelta(weeks=offset) for offset in range(weeks)]
+        return [(day, totals.get(day.isoformat(), 0)) for day in days]
+    
+    def values(self, dimension: str) -> List[str]:
+        """
+        차원에 나타나는 값을 가져옵니다 (빈 값 제외).
+        
+        Args:
+            dimension (str): 차원 이름
+            
+        Returns:
+            List[str]: 값 리스트 (가나다순)
+        """
+        position = DIMENSIONS.index(dimension)
+        return sorted({key[position] for key in self.counts if key[position]})
@@ -0,0 +1,200 @@
+"""
+오래된 메모 압축 보관소
+오랫동안 수정되지 않은 메모 본문을 블록 단위로 zlib 압축해 보관하고,
+본문을 열 때만 해당 블록을 풀어 최근에 푼 블록 몇 개를 캐시합니다.
+"""
+from collections import OrderedDict
+from typing import List, Dict, Any, Tuple
+import json
+import os
+import zlib
+
+
+# 한 블록에 묶는 메모 수
+ARCHIVE_BLOCK_SIZE = 64
+
+# 압축을 풀어 메모리에 보관하는 최대 블록 수
+ARCHIVE_CACHE_BLOCKS = 8
+
+
+class ArchiveStore:
+    """메모 본문을 압축 블록으로 저장하는 보관소 클래스"""
+    
+    def __init__(self, data_path: str, index_path: str,
+                 cache_blocks: int = ARCHIVE_CACHE_BLOCKS):
+        """
+        보관소 초기화
+        
+        Args:
+            data_path (str): 압축 블록을 저장할 파일 경로
+            index_path (str): 블록 위치와 보관된 메모 메타데이터를 저장할 JSON 파일 경로
+            cache_blocks (int): 압축을 풀어 캐시할 최대 블록 수
+        """
+        self.data_path = data_path
+        self.index_path = index_path
+        self.cache_blocks = cache_blocks
+        self.blocks: List[List[int]] = []
+        self._cache: "OrderedDict[int, Dict[str, str]]" = OrderedDict()
+    
+    def load(self) -> List[Dict[str, Any]]:
+        """
+        블록 색인과 보관된 메모의 메타데이터를 로드합니다.
+        
+        Returns:
+            List[Dict[str, Any]]: 보관된 메모 메타데이터 (본문 제외) 리스트
+        """
+        self._cache.clear()
+        try:
+            if os.path.exists(self.index_path):
+                with open(self.index_path, 'r', encoding='utf-8') as file:
+                    index = json.load(file)
+                self.blocks = index.get("blocks", [])
+                return index.get("memos", [])
+        except (json.JSONDecodeError, OSError) as e:
+            print(f"보관소 색인 로드 중 오류 발생: {e}")
+        self.blocks = []
+        return []
+    
+    def save(self, memos: List[Dict[str, Any]]) -> bool:
+        """
+        블록 색인과 보관된 메모의 메타데이터를 저장합니다.
+        
+        Args:
+            memos (List[Dict[str, Any]]): 보관된 메모 메타데이터 리스트
+            
+        Returns:
+            bool: 저장 성공 여부
+        """
+        temp_path = self.index_path + ".tmp"
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as file:
+                json.dump({"blocks": self.blocks, "memos": memos}, file, ensure_ascii=False)
+            os.replace(temp_path, self.index_path)
+            return True
+        except OSError as e:
+            print(f"보관소 색인 저장 중 오류 발생: {e}")
+            return False
+    
+    def write_block(self, contents: Dict[int, str]) -> int:
+        """
+        메모 본문 묶음을 압축해 파일 끝에 블록으로 추가합니다.
+        
+        Args:
+            contents (Dict[int, str]): 메모 ID별 본문
+            
+        Returns:
+            int: 블록 번호
+        """
+        data = zlib.compress(json.dumps({str(memo_id): content for memo_id, content
+                                         in contents.items()}, ensure_ascii=False).encode('utf-8'))
+        with open(self.data_path, 'ab') as file:
+            offset = file.seek(0, os.SEEK_END)
+            file.write(data)
+        self.blocks.append([offset, len(data), len(contents)])
+        return len(self.blocks) - 1
+    
+    def _load_block(self, block: int) -> Dict[str, str]:
+        """블록의 압축을 풀어 가져옵니다 (최근에 푼 블록은 캐시에서)."""
+        if block in self._cache:
+            self._cache.move_to_end(block)
+            return self._cache[block]
+        
+        offset, length, _ = self.blocks[block]
+        with open(self.data_path, 'rb') as file:
+            file.seek(offset)
+            contents = json.loads(zlib.decompress(file.read(length)).decode('utf-8'))
+        self._cache[block] = contents
+        if len(self._cache) > self.cache_blocks:
+            self._cache.popitem(last=False)
+        return contents
+    
+    def read_block(self, block: int) -> Dict[int, str]:
+        """
+        블록의 본문을 모두 읽습니다. 검색처럼 블록을 한 번씩 훑을 때 쓰며,
+        메모를 열 때 쓰는 캐시는 거치지도 채우지도 않습니다.
+        
+        Args:
+            block (int): 블록 번호
+            
+        Returns:
+            Dict[int, str]: 메모 ID별 본문 (읽을 수 없으면 빈 딕셔너리)
+        """
+        try:
+            if block in self._cache:
+                contents = self._cache[block]
+            else:
+                offset, length, _ = self.blocks[block]
+                with open(self.data_path, 'rb') as file:
+                    file.seek(offset)
+                    contents = json.loads(zlib.decompress(file.read(length)).decode('utf-8'))
+            return {int(memo_id): content for memo_id, content in contents.items()}
+        except (OSError, IndexError, ValueError, zlib.error) as e:
+            print(f"보관된 메모 본문 로드 중 오류 발생: {e}")
+            return {}
+    
+    def read(self, block: int, memo_id: int) -> str:
+        """
+        보관된 메모 본문을 읽습니다.
+        
+        Args:
+            block (int): 블록 번호
+            memo_id (int): 메모 ID
+            
+        Returns:
+            str: 본문 (읽을 수 없으면 빈 문자열)
+        """
+        try:
+            return self._load_block(block).get(str(memo_id), "")
+        except (OSError, IndexError, ValueError, zlib.error) as e:
+            print(f"보관된 메모 본문 로드 중 오류 발생: {e}")
+            return ""
+    
+    def garbage_ratio(self, live_blocks: Dict[int, int]) -> float:
+        """
+        더 이상 보관되지 않은 메모(다시 수정된 메모)가 차지하는 비율을 계산합니다.
+        
+        Args:
+            live_blocks (Dict[int, int]): 보관 중인 메모 ID별 블록 번호
+            
+        Returns:
+            float: 0.0 ~ 1.0 사이의 비율 (메모 수 기준)
+        """
+        total = sum(count for _, _, count in self.blocks)
+        if total == 0:
+            return 0.0
+        return max(0.0, 1.0 - len(live_blocks) / total)
+    
+    def rewrite(self, live_blocks: Dict[int, int]) -> Dict[int, int]:
+        """
+        보관 중인 본문만 모아 블록을 다시 만듭니다. 호출한 쪽에서 save()로 색인을 저장해야 합니다.
+        
+        Args:
+            live_blocks (Dict[int, int]): 보관 중인 메모 ID별 현재 블록 번호
+            
+        Returns:
+            Dict[int, int]: 메모 ID별 새 블록 번호
+        """
+        pending: List[Tuple[int, str]] = [(memo_id, self.read(block, memo_id))
+                                          for memo_id, block in sorted(live_blocks.items(),
+                                                                       key=lambda item: item[1])]
+        old_blocks = self.blocks
+        old_path = self.data_path
+        self.data_path = old_path + ".tmp"
+        self.blocks = []
+        try:
+            if os.path.exists(self.data_path):
+                os.remove(self.data_path)
+            new_blocks = {}
+            for start in range(0, len(pending), ARCHIVE_BLOCK_SIZE):
+                chunk = dict(pending[start:start + ARCHIVE_BLOCK_SIZE])
+                block = self.write_block(chunk)
+                for memo_id in chunk:
+                    new_blocks[memo_id] = block
+            os.replace(self.data_path, old_path)
+        except OSError:
+            self.blocks = old_blocks
+            raise
+        finally:
+            self.data_path = old_path
+            self._cache.clear()
+        return new_blocks
@@ -0,0 +1,149 @@
+"""
+첨부 파일 저장소
+매물 사진, 계약서 등 첨부 파일을 내용의 SHA-256 해시 이름으로 저장해 같은 파일은 한 번만 보관합니다.
+메모에는 해시와 원래 파일 이름, 크기만 참조로 남깁니다.
+"""
+from typing import List, Dict, Any, Set
+import hashlib
+import os
+import shutil
+import time
+
+
+# 해시 계산과 복사에 사용하는 읽기 단위 (바이트)
+ATTACHMENT_CHUNK_SIZE = 1024 * 1024
+
+# 이 시간이 지나지 않은 파일은 참조가 없어도 지우지 않습니다 (초)
+# 첨부 직후 메모가 저장되기 전에 정리 작업이 돌아도 파일이 사라지지 않게 합니다
+ATTACHMENT_GC_GRACE = 24 * 60 * 60
+
+
+def file_sha256(file_path: str) -> str:
+    """
+    파일 내용의 SHA-256 해시를 계산합니다.
+    
+    Args:
+        file_path (str): 파일 경로
+        
+    Returns:
+        str: 16진수 해시
+    """
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as file:
+        for chunk in iter(lambda: file.read(ATTACHMENT_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class AttachmentStore:
+    """첨부 파일을 해시 이름으로 보관하는 내용 주소 저장소 클래스"""
+    
+    def __init__(self, root_dir: str):
+        """
+        첨부 파일 저장소 초기화
+        
+        Args:
+            root_dir (str): 첨부 파일을 보관할 폴더 경로
+        """
+        self.root_dir = root_dir
+    
+    def get_path(self, file_hash: str) -> str:
+        """
+        해시에 해당하는 보관 파일 경로를 만듭니다 (해시 앞 두 글자로 하위 폴더를 나눔).
+        
+        Args:
+            file_hash (str): SHA-256 해시
+            
+        Returns:
+            str: 보관 파일 경로
+        """
+        return os.path.join(self.root_dir, file_hash[:2], file_hash)
+    
+    def add(self, source_path: str) -> Dict[str, Any]:
+        """
+        파일을 저장소에 추가합니다. 같은 내용의 파일이 이미 있으면 복사하지 않습니다.
+        
+        Args:
+            source_path (str): 첨부할 파일 경로
+            
+        Returns:
+            Dict[str, Any]: 메모에 저장할 참조 {"hash", "name", "size"}
+            
+        Raises:
+            OSError: 파일을 읽거나 복사할 수 없는 경우
+        """
+        file_hash = file_sha256(source_path)
+        target_path = self.get_path(file_hash)
+        if os.path.exists(target_path):
+            # 다시 첨부된 파일은 정리 대상에서 한동안 빠지도록 시각을 갱신합니다
+            os.utime(target_path)
+        else:
+            os.makedirs(os.path.dirname(target_path), exist_ok=True)
+            temp_path = target_path + ".tmp"
+            shutil.copyfile(source_path, temp_path)
+            os.replace(temp_path, target_path)
+        
+        return {
+            "hash": file_hash,
+            "name": os.path.basename(source_path),
+            "size": os.path.getsize(target_path)
+        }
+    
+    def exists(self, file_hash: str) -> bool:
+        """해시에 해당하는 파일이 보관되어 있는지 확인합니다."""
+        return os.path.exists(self.get_path(file_hash))
+    
+    def export(self, ref: Dict[str, Any], target_dir: str) -> str:
+        """
+        보관된 파일을 원래 이름으로 복사합니다 (다른 프로그램으로 열 때).
+        
+        Args:
+            ref (Dict[str, Any]): 첨부 참조
+            target_dir (str): 복사할 폴더
+            
+        Returns:
+            str: 복사된 파일 경로
+            
+        Raises:
+            OSError: 파일을 복사할 수 없는 경우
+        """
+        os.makedirs(target_dir, exist_ok=True)
+        target_path = os.path.join(target_dir, os.path.basename(ref["name"]) or ref["hash"])
+        shutil.copyfile(self.get_path(ref["hash"]), target_path)
+        return target_path
+    
+    def _list_hashes(self) -> List[str]:
+        """보관된 파일의 해시 목록을 가져옵니다."""
+        if not os.path.isdir(self.root_dir):
+            return []
+        hashes = []
+        for prefix in os.listdir(self.root_dir):
+            folder = os.path.join(self.root_dir, prefix)
+            if os.path.isdir(folder):
+                hashes.extend(name for name in os.listdir(folder) if not name.endswith(".tmp"))
+        return hashes
+    
+    def collect_garbage(self, live_hashes: Set[str], grace: int = ATTACHMENT_GC_GRACE) -> int:
+        """
+        어떤 메모도 참조하지 않는 파일을 지웁니다.
+        
+        Args:
+            live_hashes (Set[str]): 메모(휴지통 포함)가 참조하는 해시 집합
+            grace (int): 최근에 추가된 파일을 남겨 둘 기간 (초)
+            
+        Returns:
+            int: 지운 파일 수
+        """
+        cutoff = time.time() - grace
+        removed = 0
+        for file_hash in self._list_hashes():
+            if file_hash in live_hashes:
+                continue
+            path = self.get_path(file_hash)
+            try:
+                if os.path.getmtime(path) < cutoff:
+                    os.remove(path)
+                    removed += 1
+            except OSError as e:
+                print(f"첨부 파일 정리 중 오류 발생: {e}")
+        return removed
@@ -0,0 +1,228 @@
+"""
+입력 자동 완성
+카테고리, 부동산 유형, 위치 값을 사용 빈도 가중치 접두사 트라이로 색인하고
+노드마다 상위 k개 후보를 미리 계산해 두어 저장소 크기와 상관없이 바로 제안합니다.
+"""
+from typing import List, Optional, Dict, Any, Set
+
+from memo_model import MemoModel
+
+
+# 자동 완성을 제공하는 메모 필드
+AUTOCOMPLETE_FIELDS = ("category", "property_type", "location")
+
+# 접두사마다 미리 계산해 두는 후보 수
+DEFAULT_TOP_K = 10
+
+# 한글 초성 (가 ~ 힣 음절 순서)
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+
+
+def get_choseong(text: str) -> str:
+    """
+    한글 음절을 초성으로 바꿉니다 (예: "강남구" → "ㄱㄴㄱ"). 한글이 아닌 글자는 그대로 둡니다.
+    
+    Args:
+        text (str): 변환할 문자열
+        
+    Returns:
+        str: 초성 문자열
+    """
+    result = []
+    for char in text:
+        code = ord(char) - 0xAC00
+        result.append(CHOSEONG[code // 588] if 0 <= code < 11172 else char)
+    return "".join(result)
+
+
+class _TrieNode:
+    """트라이 노드 (이 노드에서 끝나는 값과 하위 전체의 상위 후보를 보관)"""
+    
+    __slots__ = ("children", "terms", "top")
+    
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.terms: Set[str] = set()
+        self.top: List[str] = []
+
+
+class PrefixTrie:
+    """사용 빈도 가중치를 가진 접두사 트라이"""
+    
+    def __init__(self, top_k: int = DEFAULT_TOP_K):
+        """
+        접두사 트라이 초기화
+        
+        Args:
+            top_k (int): 노드마다 보관할 상위 후보 수
+        """
+        self.top_k = top_k
+        self.counts: Dict[str, int] = {}
+        self._root = _TrieNode()
+    
+    def _rank(self, term: str):
+        """후보 정렬 기준 (사용 횟수 내림차순, 같으면 가나다순)"""
+        return -self.counts.get(term, 0), term
+    
+    @staticmethod
+    def _keys(term: str) -> Set[str]:
+        """
+        값을 찾을 수 있는 검색 키를 만듭니다.
+        
+        단어마다 그 단어부터 시작하는 키와 초성 키를 만들어
+        "강남", "역삼", "ㄱㄴ"으로도 "서울 강남구 역삼동"을 찾을 수 있게 합니다.
+        """
+        words = term.lower().split()
+        keys = set()
+        for i in range(len(words)):
+            key = " ".join(words[i:])
+            keys.add(key)
+            keys.add(get_choseong(key))
+        return keys
+    
+    def adjust(self, term: str, delta: int) -> None:
+        """
+        값의 사용 횟수를 바꾸고 경로상의 상위 후보를 갱신합니다.
+        
+        Args:
+            term (str): 값
+            delta (int): 사용 횟수 변화량 (추가 +1, 제거 -1)
+        """
+        term = (term or "").strip()
+        if not term or delta == 0:
+            return
+        
+        count = max(0, self.counts.get(term, 0) + delta)
+        if count:
+            self.counts[term] = count
+        else:
+            self.counts.pop(term, None)
+        
+        for key in self._keys(term):
+            path = [self._root]
+            for char in key:
+                node = path[-1].children.get(char)
+                if node is None:
+                    if not count:
+                        break
+                    node = path[-1].children[char] = _TrieNode()
+                path.append(node)
+            else:
+                if count:
+                    path[-1].terms.add(term)
+                else:
+                    path[-1].terms.discard(term)
+                self._update_path(key, path, term, delta)
+    
+    def _update_path(self, key: str, path: List[_TrieNode], term: str, delta: int) -> None:
+        """검색 키 경로의 노드들을 아래에서부터 갱신합니다."""
+        count = self.counts.get(term, 0)
+        for depth in range(len(path) - 1, -1, -1):
+            node = path[depth]
+            if not count and depth > 0 and not node.terms and not node.children:
+                # 값이 모두 빠진 노드는 지웁니다
+                del path[depth - 1].children[key[depth - 1]]
+            elif term in node.top:
+                if delta > 0:
+                    # 이미 후보인 값의 횟수가 늘면 순서만 바뀝니다
+                    node.top.sort(key=self._rank)
+                else:
+                    # 횟수가 줄면 밖에 있던 값이 올라올 수 있어 다시 계산합니다
+                    self._recompute(node)
+            elif count and (len(node.top) < self.top_k or
+                            self._rank(term) < self._rank(node.top[-1])):
+                node.top.append(term)
+                node.top.sort(key=self._rank)
+                del node.top[self.top_k:]
+    
+    def _recompute(self, node: _TrieNode) -> None:
+        """자식 노드의 후보를 합쳐 노드의 상위 후보를 다시 계산합니다."""
+        candidates = set(node.terms)
+        for child in node.children.values():
+            candidates.update(child.top)
+        node.top = sorted(candidates, key=self._rank)[:self.top_k]
+    
+    def suggest(self, prefix: str, limit: Optional[int] = None) -> List[str]:
+        """
+        접두사로 시작하는 값을 사용 빈도순으로 가져옵니다.
+        
+        Args:
+            prefix (str): 입력 중인 접두사 (초성도 가능)
+            limit (Optional[int]): 최대 개수 (기본값: top_k)
+            
+        Returns:
+            List[str]: 후보 값 리스트
+        """
+        node = self._root
+        for char in prefix.strip().lower():
+            node = node.children.get(char)
+            if node is None:
+                return []
+        return node.top[:limit or self.top_k]
+    
+    def __len__(self) -> int:
+        return len(self.counts)
+
+
+class AutocompleteService:
+    """메모 변경 이벤트로 점진적으로 갱신되는 필드별 자동 완성 서비스"""
+    
+    def __init__(self, memo_model: MemoModel, top_k: int = DEFAULT_TOP_K):
+        """
+        자동 완성 서비스 초기화
+        
+        Args:
+            memo_model (MemoModel): 값을 모을 메모 모델
+            top_k (int): 제안할 최대 후보 수
+        """
+        self.memo_model = memo_model
+        self.tries = {field: PrefixTrie(top_k) for field in AUTOCOMPLETE_FIELDS}
+        self.build()
+        memo_model.add_change_listener(self.on_memo_changed)
+    
+    def build(self) -> None:
+        """전체 메모로 트라이를 새로 만듭니다."""
+        self.tries = {field: PrefixTrie(trie.top_k) for field, trie in self.tries.items()}
+        for memo in self.memo_model.get_all_memos():
+            self._adjust(memo, 1)
+    
+    def _adjust(self, memo: Dict[str, Any], delta: int) -> None:
+        """메모의 모든 자동 완성 필드 값의 사용 횟수를 바꿉니다."""
+        for field, trie in self.tries.items():
+            trie.adjust(memo.get(field, ""), delta)
+    
+    def on_memo_changed(self, event: str, memo: Dict[str, Any],
+                        previous: Optional[Dict[str, Any]] = None) -> None:
+        """
+        MemoModel 변경 이벤트 리스너 - 바뀐 필드 값의 사용 횟수만 갱신합니다.
+        
+        Args:
+            event (str): 변경 이벤트 종류
+            memo (Dict[str, Any]): 변경된 메모
+            previous (Optional[Dict[str, Any]]): 변경 전 메모
+        """
+        # 휴지통으로 옮길 때 이미 빠졌으므로 "purged"는 무시합니다
+        if event in ("created", "restored"):
+            self._adjust(memo, 1)
+        elif event == "deleted":
+            self._adjust(memo, -1)
+        elif event == "updated" and previous is not None:
+            for field, trie in self.tries.items():
+                if previous.get(field) != memo.get(field):
+                    trie.adjust(previous.get(field, ""), -1)
+                    trie.adjust(memo.get(field, ""), 1)
+    
+    def suggest(self, field: str, prefix: str, limit: Optional[int] = None) -> List[str]:
+        """
+        필드 값 후보를 사용 빈도순으로 가져옵니다.
+        
+        Args:
+            field (str): 필드 이름 ("category", "property_type", "location")
+            prefix (str): 입력 중인 접두사 (빈 문자열이면 가장 많이 쓰인 값)
+            limit (Optional[int]): 최대 개수
+            
+        Returns:
+            List[str]: 후보 값 리스트
+        """
+        trie = self.tries.get(field)
+        return trie.suggest(prefix, limit) if trie else []
@@ -8,16 +8,61 @@ import subprocess
 import shutil
 from pathlib import Path
 
-def build_exe():
-    """EXE 파일 빌드 함수"""
+APP_NAME = '공인중개사메모관리시스템'
+
+# 앱에서 사용하지 않는 Qt 모듈 (빠른 시작 빌드에서 제외)
+EXCLUDED_QT_MODULES = [
+    'PySide6.QtNetwork', 'PySide6.QtQml', 'PySide6.QtQuick', 'PySide6.QtQuickWidgets',
+    'PySide6.QtWebEngineCore', 'PySide6.QtWebEngineWidgets', 'PySide6.QtWebChannel',
+    'PySide6.QtMultimedia', 'PySide6.QtMultimediaWidgets', 'PySide6.QtSql',
+    'PySide6.QtTest', 'PySide6.QtOpenGL', 'PySide6.QtOpenGLWidgets', 'PySide6.QtPdf',
+    'PySide6.QtPdfWidgets', 'PySide6.QtSvg', 'PySide6.QtSvgWidgets', 'PySide6.QtCharts',
+    'PySide6.QtDataVisualization', 'PySide6.Qt3DCore', 'PySide6.QtBluetooth',
+    'PySide6.QtPositioning', 'PySide6.QtSerialPort', 'PySide6.QtDesigner',
+    'PySide6.QtHelp', 'PySide6.QtXml', 'tkinter', 'unittest', 'pydoc'
+]
+
+# 빠른 시작 빌드에 남겨 둘 Qt 플러그인 폴더 (나머지는 삭제)
+KEPT_QT_PLUGINS = ['platforms', 'styles', 'imageformats']
+
+# 빠른 시작 빌드의 스플래시 이미지 (있는 경우에만 사용)
+SPLASH_IMAGE = 'splash.png'
+
+
+def prune_qt_files(app_dir):
+    """빠른 시작 빌드 폴더에서 사용하지 않는 Qt 플러그인과 번역 파일 삭제"""
+    removed = 0
+    for qt_dir in app_dir.rglob('PySide6'):
+        plugins_dir = qt_dir / 'plugins'
+        if plugins_dir.is_dir():
+            for plugin_dir in plugins_dir.iterdir():
+                if plugin_dir.is_dir() and plugin_dir.name not in KEPT_QT_PLUGINS:
+                    shutil.rmtree(plugin_dir)
+                    removed += 1
+        for unused_dir in [qt_dir / 'translations', qt_dir / 'qml']:
+            if unused_dir.is_dir():
+                shutil.rmtree(unused_dir)
+                removed += 1
+    print(f"사용하지 않는 Qt 파일 정리: {removed}개 폴더 삭제")
+
+def build_exe(fast_start=False, use_splash=False):
+    """
+    EXE 파일 빌드 함수
+    
+    Args:
+        fast_start (bool): 빠른 시작 빌드 여부 (단일 파일 대신 폴더 배포, 미사용 Qt 제외)
+        use_splash (bool): 빠른 시작 빌드에 스플래시 화면 표시 여부
+    """
     print("공인중개사 메모 관리 시스템 EXE 빌드 시작...")
+    if fast_start:
+        print("빠른 시작 모드: 폴더 배포, 미사용 Qt 모듈 제외")
     
     # 현재 디렉토리 확인
     current_dir = Path.cwd()
     print(f"작업 디렉토리: {current_dir}")
     
     # 필요한 파일들 확인
-    required_files = ['main.py', 'memo_model.py', 'styles.css', 'memos.json']
+    required_files = ['main.py', 'memo_model.py', 'startup_probe.py', 'styles.css', 'memos.json']
     missing_files = []
     
     for file in required_files:
@@ -51,6 +96,16 @@ def build_exe():
         pyinstaller_cmd = [cmd for cmd in pyinstaller_cmd if not cmd.startswith('--icon')]
         print("아이콘 파일이 없어 기본 아이콘을 사용합니다.")
     
+    # 빠른 시작 모드: 실행할 때마다 임시 폴더에 압축을 풀지 않도록 폴더로 배포
+    if fast_start:
+        pyinstaller_cmd[pyinstaller_cmd.index('--onefile')] = '--onedir'
+        pyinstaller_cmd[-1:-1] = [f'--exclude-module={module}' for module in EXCLUDED_QT_MODULES]
+        if use_splash:
+            if Path(SPLASH_IMAGE).exists():
+                pyinstaller_cmd.insert(-1, f'--splash={SPLASH_IMAGE}')
+            else:
+                print(f"스플래시 이미지({SPLASH_IMAGE})가 없어 스플래시 화면 없이 빌드합니다.")
+    
     print("PyInstaller 실행 중...")
     print(f"명령어: {' '.join(pyinstaller_cmd)}")
     
@@ -61,7 +116,13 @@ def build_exe():
         
         # 빌드 결과 확인
         dist_dir = Path('dist')
-        exe_file = dist_dir / '공인중개사메모관리시스템.exe'
+        if fast_start:
+            app_dir = dist_dir / APP_NAME
+            exe_file = app_dir / f'{APP_NAME}.exe'
+            if app_dir.exists():
+                prune_qt_files(app_dir)
+        else:
+            exe_file = dist_dir / f'{APP_NAME}.exe'
         
         if exe_file.exists():
             file_size = exe_file.stat().st_size / (1024 * 1024)  # MB 단위
@@ -73,9 +134,15 @@ def build_exe():
             deploy_dir = Path('배포용')
             deploy_dir.mkdir(exist_ok=True)
             
-            # exe 파일 복사
-            deploy_exe = deploy_dir / '공인중개사메모관리시스템.exe'
-            shutil.copy2(exe_file, deploy_exe)
+            # exe 파일 복사 (빠른 시작 빌드는 폴더 전체 복사)
+            if fast_start:
+                deploy_app_dir = deploy_dir / APP_NAME
+                if deploy_app_dir.exists():
+                    shutil.rmtree(deploy_app_dir)
+                shutil.copytree(app_dir, deploy_app_dir)
+            else:
+                deploy_exe = deploy_dir / f'{APP_NAME}.exe'
+                shutil.copy2(exe_file, deploy_exe)
             
             # README 파일 생성
             readme_content = """# 공인중개사 메모 관리 시스템
@@ -91,6 +158,10 @@ def build_exe():
 - ⚡ 우선순위 설정
 - 💾 자동 저장 기능
 
+## 시작 시간 측정
+- 명령 프롬프트에서 '공인중개사메모관리시스템.exe --startup-probe'로 실행하면
+  압축 풀기와 인터프리터 시작, 임포트, 메모 로드, 첫 화면 표시 시간을 측정해 startup_times.jsonl에 기록하고 종료합니다.
+
 ## 시스템 요구사항
 - Windows 10 이상
 - 별도의 소프트웨어 설치 불필요
@@ -146,11 +217,14 @@ if __name__ == "__main__":
     print("공인중개사 메모 관리 시스템 EXE 빌더")
     print("=" * 60)
     
-    success = build_exe()
+    # --fast: 빠른 시작 빌드, --splash: 스플래시 화면 포함
+    success = build_exe(fast_start='--fast' in sys.argv, use_splash='--splash' in sys.argv)
     
     if success:
         print("\n빌드 완료!")
         print("'배포용' 폴더에서 exe 파일을 확인하세요.")
+        if '--fast' in sys.argv:
+            print(f"빠른 시작 빌드는 '{APP_NAME}' 폴더째로 배포해야 합니다.")
         
         # 정리 여부 확인
         cleanup_choice = input("\n임시 파일을 정리하시겠습니까? (y/n): ").lower()
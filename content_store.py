@@ -0,0 +1,92 @@
+"""
+메모 본문 저장소
+긴 메모 본문을 목록 메타데이터와 분리해 추가 전용(append-only) 파일에 저장합니다.
+"""
+from typing import List, Dict
+import os
+
+
+class ContentStore:
+    """메모 본문을 [오프셋, 바이트 길이] 참조로 저장하는 클래스"""
+    
+    def __init__(self, file_path: str):
+        """
+        본문 저장소 초기화
+        
+        Args:
+            file_path (str): 본문을 저장할 파일 경로
+        """
+        self.file_path = file_path
+    
+    def write(self, content: str) -> List[int]:
+        """
+        본문을 파일 끝에 추가합니다.
+        
+        Args:
+            content (str): 저장할 본문
+            
+        Returns:
+            List[int]: [오프셋, 바이트 길이] 형식의 참조
+        """
+        data = content.encode('utf-8')
+        with open(self.file_path, 'ab') as file:
+            offset = file.seek(0, os.SEEK_END)
+            file.write(data)
+        return [offset, len(data)]
+    
+    def read(self, ref: List[int]) -> str:
+        """
+        참조가 가리키는 본문을 읽습니다.
+        
+        Args:
+            ref (List[int]): write()가 반환한 참조
+            
+        Returns:
+            str: 본문 (읽을 수 없으면 빈 문자열)
+        """
+        offset, length = ref
+        try:
+            with open(self.file_path, 'rb') as file:
+                file.seek(offset)
+                return file.read(length).decode('utf-8')
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"메모 본문 로드 중 오류 발생: {e}")
+            return ""
+    
+    def garbage_ratio(self, live_refs: List[List[int]]) -> float:
+        """
+        파일에서 더 이상 참조되지 않는 영역의 비율을 계산합니다.
+        
+        Args:
+            live_refs (List[List[int]]): 현재 사용 중인 참조 목록
+            
+        Returns:
+            float: 0.0 ~ 1.0 사이의 비율
+        """
+        if not os.path.exists(self.file_path):
+            return 0.0
+        total = os.path.getsize(self.file_path)
+        if total == 0:
+            return 0.0
+        live = sum(length for _, length in live_refs)
+        return max(0.0, 1.0 - live / total)
+    
+    def rewrite(self, live_refs: Dict[int, List[int]]) -> Dict[int, List[int]]:
+        """
+        사용 중인 본문만 남기고 파일을 다시 씁니다.
+        
+        Args:
+            live_refs (Dict[int, List[int]]): 메모 ID별 현재 참조
+            
+        Returns:
+            Dict[int, List[int]]: 메모 ID별 새 참조
+        """
+        temp_path = self.file_path + ".tmp"
+        new_refs = {}
+        with open(self.file_path, 'rb') as source, open(temp_path, 'wb') as target:
+            for memo_id, (offset, length) in live_refs.items():
+                source.seek(offset)
+                new_refs[memo_id] = [target.tell(), length]
+                target.write(source.read(length))
+        os.replace(temp_path, self.file_path)
+        return new_refs
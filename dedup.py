@@ -0,0 +1,309 @@
+"""
+중복 메모 탐지
+제목, 본문, 위치로 64비트 SimHash 서명을 만들고, 서명을 16비트 밴드로 나눈
+다중 인덱스 해싱(multi-index hashing)으로 비슷한 메모 후보만 비교합니다.
+"""
+from collections import Counter
+from functools import lru_cache
+from itertools import combinations
+from typing import List, Optional, Dict, Any, Set, Tuple
+import hashlib
+
+
+# 서명 비트 수
+SIGNATURE_BITS = 64
+
+# 밴드 수 (서명을 16비트씩 4개로 나눔, 밴드마다 65536개 버킷)
+SIGNATURE_BANDS = 4
+
+# 중복으로 판단하는 최대 해밍 거리 (짧은 메모는 몇 글자만 바뀌어도 5~10비트가 달라짐)
+# 거리가 d 이하인 두 서명은 적어도 한 밴드에서 d // SIGNATURE_BANDS 비트 이하만 다르므로
+# 밴드마다 그 반경 안의 버킷만 찾아보면 후보를 빠뜨리지 않습니다 (d = 10이면 밴드당 버킷 137개)
+DUPLICATE_DISTANCE = 10
+
+# 서명에 사용하는 최대 글자 수 (매우 긴 본문은 앞부분만 사용)
+SIGNATURE_TEXT_LIMIT = 4000
+
+# 서명 계산 방식 버전 (simhash나 signature_text를 바꾸면 올려서 저장된 서명을 모두 다시 계산하게 함)
+SIGNATURE_VERSION = 1
+
+# 이 개수 이상이면 서명 계산을 여러 프로세스로 나눕니다 (이전 형식 저장소나 서명 방식 변경 후 전체 재계산)
+PARALLEL_THRESHOLD = 2000
+
+_BAND_BITS = SIGNATURE_BITS // SIGNATURE_BANDS
+_BAND_MASK = (1 << _BAND_BITS) - 1
+
+
+def signature_text(memo: Dict[str, Any], content: str) -> str:
+    """
+    서명을 만들 메모 텍스트 (제목 + 본문 + 위치)를 구합니다.
+    
+    Args:
+        memo (Dict[str, Any]): 메모 데이터
+        content (str): 메모 본문
+        
+    Returns:
+        str: 서명 대상 텍스트
+    """
+    return " ".join([memo.get("title", ""), content[:SIGNATURE_TEXT_LIMIT],
+                     memo.get("location", "")])
+
+
+def simhash(text: str) -> int:
+    """
+    텍스트의 글자 3-gram으로 64비트 SimHash 서명을 계산합니다.
+    
+    프로세스마다 값이 달라지는 내장 hash() 대신 blake2b를 사용하므로
+    다른 프로세스에서 계산하거나 파일에 저장한 서명과도 비교할 수 있습니다.
+    
+    Args:
+        text (str): 서명 대상 텍스트
+        
+    Returns:
+        int: 64비트 서명
+    """
+    normalized = " ".join(text.lower().split())
+    grams = Counter(normalized[i:i + 3] for i in range(max(1, len(normalized) - 2)))
+    weights = [0] * SIGNATURE_BITS
+    for gram, weight in grams.items():
+        value = int.from_bytes(hashlib.blake2b(gram.encode('utf-8'), digest_size=8).digest(), 'big')
+        for bit in range(SIGNATURE_BITS):
+            if value >> bit & 1:
+                weights[bit] += weight
+            else:
+                weights[bit] -= weight
+    return sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+
+
+def hamming_distance(first: int, second: int) -> int:
+    """두 서명의 서로 다른 비트 수를 구합니다."""
+    return bin(first ^ second).count("1")
+
+
+def similarity(first: int, second: int) -> float:
+    """두 서명의 유사도 (0.0 ~ 1.0)를 구합니다."""
+    return 1.0 - hamming_distance(first, second) / SIGNATURE_BITS
+
+
+def _bands(signature: int) -> List[int]:
+    """서명을 밴드 값으로 나눕니다."""
+    return [signature >> (band * _BAND_BITS) & _BAND_MASK for band in range(SIGNATURE_BANDS)]
+
+
+@lru_cache(maxsize=None)
+def _probe_masks(max_distance: int) -> Tuple[int, ...]:
+    """
+    밴드 값에 XOR해서 찾아볼 이웃 버킷 마스크를 구합니다.
+    
+    Args:
+        max_distance (int): 서명 전체의 최대 해밍 거리
+        
+    Returns:
+        Tuple[int, ...]: 켜진 비트가 max_distance // SIGNATURE_BANDS개 이하인 밴드 마스크 (0 포함)
+    """
+    radius = min(max_distance // SIGNATURE_BANDS, _BAND_BITS)
+    return tuple(sum(1 << bit for bit in bits)
+                 for count in range(radius + 1)
+                 for bits in combinations(range(_BAND_BITS), count))
+
+
+def compute_signatures(texts: Dict[int, str], workers: Optional[int] = None) -> Dict[int, int]:
+    """
+    여러 메모의 서명을 계산합니다. 개수가 많으면 프로세스 풀에서 나누어 계산합니다.
+    
+    Args:
+        texts (Dict[int, str]): 메모 ID별 서명 대상 텍스트
+        workers (Optional[int]): 프로세스 수 (기본값: CPU 수)
+        
+    Returns:
+        Dict[int, int]: 메모 ID별 서명
+    """
+    memo_ids = list(texts)
+    if len(memo_ids) < PARALLEL_THRESHOLD:
+        return {memo_id: simhash(texts[memo_id]) for memo_id in memo_ids}
+    
+    # 프로세스 풀은 임포트 비용이 커서 실제로 나누어 계산할 때만 불러옵니다
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        signatures = executor.map(simhash, (texts[memo_id] for memo_id in memo_ids),
+                                  chunksize=256)
+        return dict(zip(memo_ids, signatures))
+
+
+def find_duplicate_groups(signatures: Dict[int, int],
+                          max_distance: int = DUPLICATE_DISTANCE) -> List[List[int]]:
+    """
+    서명이 비슷한 메모끼리 묶습니다.
+    
+    밴드마다 버킷과 그 반경 안의 이웃 버킷에 들어간 후보 쌍만 비교하고, 여러 밴드에서
+    후보가 되는 쌍은 처음 후보가 되는 밴드에서 한 번만 해밍 거리를 계산합니다.
+    
+    Args:
+        signatures (Dict[int, int]): 메모 ID별 서명
+        max_distance (int): 중복으로 판단할 최대 해밍 거리
+        
+    Returns:
+        List[List[int]]: 중복 그룹 리스트 (그룹마다 메모 ID 오름차순, 큰 그룹부터)
+    """
+    masks = _probe_masks(max_distance)
+    radius = max_distance // SIGNATURE_BANDS
+    
+    # 유니온 파인드로 중복 쌍을 그룹으로 합칩니다
+    parents = {memo_id: memo_id for memo_id in signatures}
+    
+    def find(memo_id: int) -> int:
+        while parents[memo_id] != memo_id:
+            parents[memo_id] = parents[parents[memo_id]]
+            memo_id = parents[memo_id]
+        return memo_id
+    
+    def join(band: int, first: int, second: int, difference: int) -> None:
+        # 앞 밴드에서도 후보였던 쌍은 그 밴드에서 이미 합쳤으므로 건너뜁니다
+        for earlier in range(band):
+            if bin(difference >> (earlier * _BAND_BITS) & _BAND_MASK).count("1") <= radius:
+                return
+        first, second = find(first), find(second)
+        if first != second:
+            parents[second] = first
+    
+    for band in range(SIGNATURE_BANDS):
+        buckets: Dict[int, List[Tuple[int, int]]] = {}
+        shift = band * _BAND_BITS
+        for memo_id, signature in signatures.items():
+            buckets.setdefault(signature >> shift & _BAND_MASK, []).append((memo_id, signature))
+        
+        for value, members in buckets.items():
+            # 같은 버킷 쌍과, 값이 더 큰 이웃 버킷과의 쌍만 비교해 버킷 쌍마다 한 번씩만 봅니다
+            pairs = [(members[i + 1:], members[i:i + 1]) for i in range(len(members) - 1)]
+            for mask in masks[1:]:
+                neighbor = value ^ mask
+                if neighbor > value and neighbor in buckets:
+                    pairs.append((members, buckets[neighbor]))
+            
+            # 대부분의 후보는 전체 해밍 거리에서 걸러지므로 그 검사를 먼저 합니다
+            for left, right in pairs:
+                for first, first_signature in left:
+                    for second, second_signature in right:
+                        difference = first_signature ^ second_signature
+                        if bin(difference).count("1") <= max_distance:
+                            join(band, first, second, difference)
+    
+    groups: Dict[int, List[int]] = {}
+    for memo_id in signatures:
+        groups.setdefault(find(memo_id), []).append(memo_id)
+    duplicates = [sorted(group) for group in groups.values() if len(group) > 1]
+    return sorted(duplicates, key=lambda group: (-len(group), group[0]))
+
+
+class DuplicateIndex:
+    """밴드 버킷(다중 인덱스 해싱)으로 비슷한 서명을 찾는 중복 탐지 인덱스"""
+    
+    def __init__(self):
+        """중복 탐지 인덱스 초기화"""
+        self._signatures: Dict[int, int] = {}
+        self._buckets: List[Dict[int, Set[int]]] = [{} for _ in range(SIGNATURE_BANDS)]
+    
+    def build(self, memos: List[Dict[str, Any]]) -> None:
+        """
+        메모 목록으로 인덱스를 새로 만듭니다.
+        
+        Args:
+            memos (List[Dict[str, Any]]): 서명("simhash")이 있는 메모 리스트
+        """
+        self._signatures = {}
+        self._buckets = [{} for _ in range(SIGNATURE_BANDS)]
+        for memo in memos:
+            self.add(memo)
+    
+    def add(self, memo: Dict[str, Any]) -> None:
+        """메모 서명을 인덱스에 추가합니다."""
+        self.remove(memo["id"])
+        if not memo.get("simhash"):
+            return
+        signature = int(memo["simhash"], 16)
+        self._signatures[memo["id"]] = signature
+        for band, value in enumerate(_bands(signature)):
+            self._buckets[band].setdefault(value, set()).add(memo["id"])
+    
+    def remove(self, memo_id: int) -> None:
+        """메모 서명을 인덱스에서 제거합니다."""
+        signature = self._signatures.pop(memo_id, None)
+        if signature is None:
+            return
+        for band, value in enumerate(_bands(signature)):
+            bucket = self._buckets[band].get(value)
+            if bucket is not None:
+                bucket.discard(memo_id)
+                if not bucket:
+                    del self._buckets[band][value]
+    
+    def get_state(self) -> Dict[str, Any]:
+        """
+        스냅샷에 저장할 인덱스 상태를 가져옵니다.
+        
+        Returns:
+            Dict[str, Any]: {"ids", "signatures", "buckets"} (버킷은 밴드별 [밴드 값, 메모 ID 리스트] 리스트)
+        """
+        return {"ids": list(self._signatures), "signatures": list(self._signatures.values()),
+                "buckets": [[[value, list(ids)] for value, ids in buckets.items()]
+                            for buckets in self._buckets]}
+    
+    def set_state(self, state: Dict[str, Any]) -> None:
+        """
+        get_state()로 저장한 상태로 인덱스를 복원합니다.
+        
+        Args:
+            state (Dict[str, Any]): {"ids", "signatures", "buckets"}
+            
+        Raises:
+            ValueError, TypeError, KeyError: 상태 형식이 잘못된 경우
+        """
+        if len(state["ids"]) != len(state["signatures"]) or len(state["buckets"]) != SIGNATURE_BANDS:
+            raise ValueError("중복 탐지 인덱스 상태의 길이가 맞지 않습니다.")
+        self._signatures = dict(zip(state["ids"], state["signatures"]))
+        self._buckets = [{value: set(ids) for value, ids in buckets} for buckets in state["buckets"]]
+    
+    def on_memo_changed(self, event: str, memo: Dict[str, Any],
+                        previous: Optional[Dict[str, Any]] = None) -> None:
+        """
+        MemoModel 변경 이벤트 리스너
+        
+        Args:
+            event (str): 변경 이벤트 종류
+            memo (Dict[str, Any]): 변경된 메모
+            previous (Optional[Dict[str, Any]]): 변경 전 메모
+        """
+        if event in ("deleted", "purged"):
+            self.remove(memo["id"])
+        elif event != "updated" or previous is None or \
+                previous.get("simhash") != memo.get("simhash"):
+            self.add(memo)
+    
+    def find_similar(self, signature: int, max_distance: int = DUPLICATE_DISTANCE,
+                     exclude_id: Optional[int] = None) -> List[Tuple[int, float]]:
+        """
+        서명과 비슷한 메모를 찾습니다.
+        
+        Args:
+            signature (int): 비교할 서명
+            max_distance (int): 최대 해밍 거리
+            exclude_id (Optional[int]): 결과에서 뺄 메모 ID (자기 자신)
+            
+        Returns:
+            List[Tuple[int, float]]: (메모 ID, 유사도) 리스트 (유사도 높은 순)
+        """
+        candidates: Set[int] = set()
+        masks = _probe_masks(max_distance)
+        for band, value in enumerate(_bands(signature)):
+            buckets = self._buckets[band]
+            for mask in masks:
+                candidates |= buckets.get(value ^ mask, set())
+        candidates.discard(exclude_id)
+        
+        results = [(memo_id, similarity(signature, self._signatures[memo_id]))
+                   for memo_id in candidates
+                   if hamming_distance(signature, self._signatures[memo_id]) <= max_distance]
+        return sorted(results, key=lambda result: (-result[1], result[0]))
+    
+    def __len__(self) -> int:
+        return len(self._signatures)
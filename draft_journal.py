@@ -0,0 +1,115 @@
+"""
+편집 중인 메모 초안 저널
+변경된 입력 필드만 백그라운드 스레드에서 JSON Lines 파일에 추가 기록합니다.
+"""
+from datetime import datetime
+from typing import Optional, Dict, Any
+import json
+import os
+import queue
+import threading
+
+
+class DraftJournal:
+    """메모 초안을 자동 저장하는 저널 클래스"""
+    
+    def __init__(self, file_path: str):
+        """
+        초안 저널 초기화
+        
+        Args:
+            file_path (str): 초안을 기록할 JSON Lines 파일 경로
+        """
+        self.file_path = file_path
+        self._queue: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue()
+        self._writer = threading.Thread(target=self._write_loop, daemon=True)
+        self._writer.start()
+    
+    def _write_loop(self) -> None:
+        """큐에 쌓인 항목을 파일에 기록합니다 (백그라운드 스레드)."""
+        while True:
+            entry = self._queue.get()
+            if entry is None:
+                break
+            if "_flush" in entry:
+                entry["_flush"].set()
+                continue
+            try:
+                with open(self.file_path, 'a', encoding='utf-8') as file:
+                    file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            except OSError as e:
+                print(f"초안 저장 중 오류 발생: {e}")
+    
+    def record(self, memo_id: Optional[int], fields: Dict[str, Any]) -> None:
+        """
+        변경된 필드를 기록합니다.
+        
+        Args:
+            memo_id (Optional[int]): 편집 중인 메모 ID (새 메모는 None)
+            fields (Dict[str, Any]): 마지막 기록 이후 변경된 필드와 값
+        """
+        self._queue.put({"memo_id": memo_id, "fields": fields,
+                         "saved_at": datetime.now().isoformat()})
+    
+    def discard(self, memo_id: Optional[int]) -> None:
+        """
+        메모의 초안을 폐기합니다 (저장 또는 취소 후).
+        
+        Args:
+            memo_id (Optional[int]): 메모 ID (새 메모는 None)
+        """
+        self._queue.put({"memo_id": memo_id, "discard": True})
+    
+    def load_pending(self) -> Dict[Optional[int], Dict[str, Any]]:
+        """
+        저널을 재생해 폐기되지 않은 초안을 가져옵니다.
+        
+        Returns:
+            Dict[Optional[int], Dict[str, Any]]: 메모 ID별 {"fields", "saved_at"}
+        """
+        drafts: Dict[Optional[int], Dict[str, Any]] = {}
+        if not os.path.exists(self.file_path):
+            return drafts
+        try:
+            with open(self.file_path, 'r', encoding='utf-8') as file:
+                for line in file:
+                    if not line.strip():
+                        continue
+                    entry = json.loads(line)
+                    memo_id = entry["memo_id"]
+                    if entry.get("discard"):
+                        drafts.pop(memo_id, None)
+                        continue
+                    draft = drafts.setdefault(memo_id, {"fields": {}, "saved_at": None})
+                    draft["fields"].update(entry["fields"])
+                    draft["saved_at"] = entry["saved_at"]
+        except (json.JSONDecodeError, KeyError) as e:
+            # 마지막 줄이 기록 도중 끊긴 경우에도 그 이전 초안은 살립니다
+            print(f"초안 로드 중 오류 발생: {e}")
+        return drafts
+    
+    def compact(self) -> None:
+        """폐기된 항목을 지우고 남은 초안만으로 저널을 다시 씁니다."""
+        self.flush()
+        drafts = self.load_pending()
+        temp_path = self.file_path + ".tmp"
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as file:
+                for memo_id, draft in drafts.items():
+                    file.write(json.dumps({"memo_id": memo_id, "fields": draft["fields"],
+                                           "saved_at": draft["saved_at"]},
+                                          ensure_ascii=False) + "\n")
+            os.replace(temp_path, self.file_path)
+        except OSError as e:
+            print(f"초안 저널 정리 중 오류 발생: {e}")
+    
+    def flush(self) -> None:
+        """대기 중인 기록이 모두 파일에 쓰일 때까지 기다립니다."""
+        done = threading.Event()
+        self._queue.put({"_flush": done})
+        done.wait()
+    
+    def close(self) -> None:
+        """대기 중인 기록을 마치고 기록 스레드를 종료합니다."""
+        self._queue.put(None)
+        self._writer.join()
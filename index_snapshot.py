@@ -0,0 +1,134 @@
+"""
+인덱스 스냅샷
+메모 모델의 파생 인덱스 상태를 부가 파일에 저장해 두었다가 다음 실행 때 위치 해석,
+시각 변환 없이 복원합니다. 스냅샷은 저장 당시의 세대 번호, 저장소 파일 체크섬,
+인덱싱된 메모별 체크섬으로 유효성을 확인합니다.
+
+다른 지점의 저장소 폴더를 워크스페이스로 열 수 있으므로 스냅샷에는 숫자와 문자열로 된
+JSON 데이터만 저장하며, 인덱스 객체는 항상 이 데이터로 새로 만듭니다.
+"""
+from typing import List, Optional, Dict, Any
+import json
+import os
+import zlib
+
+
+# 스냅샷 형식 버전 (인덱스 구조가 바뀌면 올려서 이전 스냅샷을 무시합니다)
+INDEX_SNAPSHOT_VERSION = 4
+
+# 인덱스 내용을 결정하는 메모 필드 (메모별 체크섬 계산 대상)
+INDEXED_FIELDS = ("created_at", "updated_at", "location", "simhash", "latitude", "longitude")
+
+
+def memo_checksum(memo: Dict[str, Any]) -> int:
+    """
+    메모의 인덱스 필드로 CRC32 체크섬을 계산합니다.
+    
+    Args:
+        memo (Dict[str, Any]): 메모 데이터
+        
+    Returns:
+        int: 체크섬
+    """
+    key = "\x1f".join([str(memo["id"])] + [str(memo.get(field, "")) for field in INDEXED_FIELDS])
+    return zlib.crc32(key.encode('utf-8'))
+
+
+def store_checksum(paths: List[str]) -> int:
+    """
+    저장소 파일들의 내용으로 CRC32 체크섬을 계산합니다 (없는 파일은 건너뜀).
+    
+    Args:
+        paths (List[str]): 파일 경로 리스트
+        
+    Returns:
+        int: 체크섬
+    """
+    checksum = 0
+    for path in paths:
+        try:
+            with open(path, 'rb') as file:
+                checksum = zlib.crc32(file.read(), checksum)
+        except FileNotFoundError:
+            continue
+    return checksum
+
+
+class IndexSnapshot:
+    """파생 인덱스 스냅샷 파일을 읽고 쓰는 클래스"""
+    
+    def __init__(self, file_path: str):
+        """
+        인덱스 스냅샷 초기화
+        
+        Args:
+            file_path (str): 스냅샷 파일 경로
+        """
+        self.file_path = file_path
+    
+    def load(self, max_generation: int) -> Optional[Dict[str, Any]]:
+        """
+        스냅샷을 로드합니다.
+        
+        첫 줄의 헤더(형식 버전, 세대 번호)를 먼저 확인하고, 쓸 수 없는 스냅샷이면
+        인덱스 데이터가 있는 본문은 읽지 않습니다.
+        
+        Args:
+            max_generation (int): 현재 저장소 세대 번호 (이보다 새로운 스냅샷은 무시)
+            
+        Returns:
+            Optional[Dict[str, Any]]: {"generation", "store_checksum", "checksums", "indexes"} 또는 None
+                (파일이 없거나 읽을 수 없거나 형식 버전, 세대 번호가 맞지 않는 경우)
+                "indexes"는 인덱스 이름별 get_state() 데이터입니다.
+        """
+        if not os.path.exists(self.file_path):
+            return None
+        try:
+            with open(self.file_path, 'r', encoding='utf-8') as file:
+                header = json.loads(file.readline())
+                if not isinstance(header, dict) or header.get("version") != INDEX_SNAPSHOT_VERSION or \
+                        not isinstance(header.get("generation"), int) or \
+                        header["generation"] > max_generation:
+                    return None
+                body = json.loads(file.readline())
+            if len(body["ids"]) != len(body["checksums"]):
+                return None
+            checksums = dict(zip(body["ids"], body["checksums"]))
+            indexes = body["indexes"]
+            if not isinstance(indexes, dict):
+                return None
+        except (OSError, ValueError, TypeError, KeyError) as e:
+            print(f"인덱스 스냅샷 로드 중 오류 발생: {e}")
+            return None
+        
+        return {"generation": header["generation"], "store_checksum": header.get("store_checksum"),
+                "checksums": checksums, "indexes": indexes}
+    
+    def save(self, generation: int, checksum: int, checksums: Dict[int, int],
+             indexes: Dict[str, Any]) -> bool:
+        """
+        스냅샷을 저장합니다.
+        
+        Args:
+            generation (int): 스냅샷 시점의 저장소 세대 번호
+            checksum (int): 스냅샷 시점의 저장소 파일 체크섬 (store_checksum())
+            checksums (Dict[int, int]): 인덱싱된 메모 ID별 memo_checksum()
+            indexes (Dict[str, Any]): 인덱스 이름별 get_state() 데이터
+            
+        Returns:
+            bool: 저장 성공 여부
+        """
+        temp_path = self.file_path + ".tmp"
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as file:
+                json.dump({"version": INDEX_SNAPSHOT_VERSION, "generation": generation,
+                           "store_checksum": checksum}, file)
+                file.write("\n")
+                json.dump({"ids": list(checksums), "checksums": list(checksums.values()),
+                           "indexes": indexes}, file, ensure_ascii=False, separators=(',', ':'))
+                file.write("\n")
+            os.replace(temp_path, self.file_path)
+            return True
+        except (OSError, TypeError, ValueError) as e:
+            print(f"인덱스 스냅샷 저장 중 오류 발생: {e}")
+            return False
@@ -0,0 +1,327 @@
+"""
+계층형 지역 인덱스
+자유 입력된 위치를 시/도 → 시/군/구 → 읍/면/동 단계로 정규화하고 트리로 색인합니다.
+"""
+from typing import List, Optional, Dict, Any, Set, Tuple, Sequence, Iterator
+import re
+
+
+# 지역 단계 이름 (트리 깊이 순)
+REGION_LEVELS = ["시/도", "시/군/구", "읍/면/동"]
+
+# 시/도 정식 명칭별 약칭
+SIDO_ALIASES = {
+    "서울특별시": ["서울", "서울시"],
+    "부산광역시": ["부산", "부산시"],
+    "대구광역시": ["대구", "대구시"],
+    "인천광역시": ["인천", "인천시"],
+    "광주광역시": ["광주"],
+    "대전광역시": ["대전", "대전시"],
+    "울산광역시": ["울산", "울산시"],
+    "세종특별자치시": ["세종", "세종시"],
+    "경기도": ["경기"],
+    "강원특별자치도": ["강원", "강원도"],
+    "충청북도": ["충북"],
+    "충청남도": ["충남"],
+    "전북특별자치도": ["전북", "전라북도"],
+    "전라남도": ["전남"],
+    "경상북도": ["경북"],
+    "경상남도": ["경남"],
+    "제주특별자치도": ["제주", "제주도"]
+}
+
+# 약칭 → 정식 명칭 조회표
+_SIDO_LOOKUP = {alias: name for name, aliases in SIDO_ALIASES.items()
+                for alias in aliases + [name]}
+
+_SIGUNGU_PATTERN = re.compile(r"^[가-힣]+[시군구]$")
+_DONG_PATTERN = re.compile(r"^[가-힣][가-힣0-9.·]*[동읍면리가]$")
+
+
+def parse_location(text: str) -> Tuple[str, str, str]:
+    """
+    위치 문자열을 (시/도, 시/군/구, 읍/면/동)으로 나눕니다.
+    
+    "서울 강남구 역삼동 123-4"는 ("서울특별시", "강남구", "역삼동")이 되고,
+    "수원시 영통구"처럼 시와 구가 함께 있으면 시/군/구 단계에 붙여서 넣습니다.
+    
+    Args:
+        text (str): 자유 입력된 위치
+        
+    Returns:
+        Tuple[str, str, str]: 단계별 이름 (알 수 없는 단계는 빈 문자열)
+    """
+    tokens = [token for token in re.split(r"[\s,]+", text or "") if token]
+    position = 0
+    
+    sido = ""
+    if tokens and tokens[0] in _SIDO_LOOKUP:
+        sido = _SIDO_LOOKUP[tokens[0]]
+        position = 1
+    
+    sigungu_parts: List[str] = []
+    while position < len(tokens) and len(sigungu_parts) < 2 and \
+            _SIGUNGU_PATTERN.match(tokens[position]):
+        sigungu_parts.append(tokens[position])
+        position += 1
+        if not tokens[position - 1].endswith("시"):
+            break
+    
+    dong = ""
+    if position < len(tokens) and _DONG_PATTERN.match(tokens[position]):
+        dong = tokens[position]
+    
+    return sido, " ".join(sigungu_parts), dong
+
+
+def region_matches(path: Sequence[str], region: Sequence[str]) -> bool:
+    """
+    상위 단계가 비어 있을 수 있는 위치가 지역 경로와 맞는지 확인합니다.
+    
+    빈 단계는 어떤 이름과도 맞는 것으로 봅니다. 예를 들어 ("", "강남구")는 ("서울특별시", "강남구")와
+    맞습니다. 지정한 가장 아래 단계의 이름이 없는 위치는 맞지 않습니다.
+    
+    Args:
+        path (Sequence[str]): parse_location으로 해석한 위치
+        region (Sequence[str]): 위 단계부터의 지역 이름
+        
+    Returns:
+        bool: 일치 여부
+    """
+    path = tuple(path[:len(region)])
+    if path == tuple(region):
+        return True
+    return bool(region) and bool(region[-1]) and path[-1] == region[-1] and \
+        all(not name or name == region[i] for i, name in enumerate(path[:-1]))
+
+
+class _RegionNode:
+    """지역 트리의 노드 (하위 지역 전체의 메모 ID를 함께 보관)"""
+    
+    __slots__ = ("children", "ids")
+    
+    def __init__(self):
+        self.children: Dict[str, "_RegionNode"] = {}
+        self.ids: Set[int] = set()
+
+
+class LocationIndex:
+    """시/도 → 시/군/구 → 읍/면/동 트리로 된 지역 인덱스"""
+    
+    def __init__(self):
+        """지역 인덱스 초기화"""
+        self._root = _RegionNode()
+        self._paths: Dict[int, Tuple[str, str, str]] = {}
+        self._paths_by_name: Dict[str, Set[Tuple[str, ...]]] = {}
+    
+    def build(self, memos: List[Dict[str, Any]]) -> None:
+        """
+        메모 목록으로 인덱스를 새로 만듭니다.
+        
+        Args:
+            memos (List[Dict[str, Any]]): 인덱싱할 메모 리스트
+        """
+        self._root = _RegionNode()
+        self._paths = {}
+        self._paths_by_name = {}
+        for memo in memos:
+            self.add(memo)
+    
+    def add(self, memo: Dict[str, Any]) -> None:
+        """메모를 인덱스에 추가합니다 (지역을 알 수 없으면 추가하지 않음)."""
+        self.remove(memo["id"])
+        path = parse_location(memo.get("location", ""))
+        if not any(path):
+            return
+        
+        self._paths[memo["id"]] = path
+        node = self._root
+        node.ids.add(memo["id"])
+        for depth, name in enumerate(path):
+            if depth > 0 and not any(path[depth:]):
+                break
+            if name not in node.children:
+                node.children[name] = _RegionNode()
+                if name:
+                    self._paths_by_name.setdefault(name, set()).add(path[:depth + 1])
+            node = node.children[name]
+            node.ids.add(memo["id"])
+    
+    def remove(self, memo_id: int) -> None:
+        """메모를 인덱스에서 제거합니다."""
+        path = self._paths.pop(memo_id, None)
+        if path is None:
+            return
+        
+        node = self._root
+        node.ids.discard(memo_id)
+        visited = []
+        for name in path:
+            child = node.children.get(name)
+            if child is None:
+                break
+            child.ids.discard(memo_id)
+            visited.append((node, name, child))
+            node = child
+        
+        # 메모가 남지 않은 노드는 아래에서부터 지웁니다
+        for depth in range(len(visited) - 1, -1, -1):
+            parent, name, child = visited[depth]
+            if child.ids:
+                break
+            del parent.children[name]
+            if name:
+                paths = self._paths_by_name.get(name, set())
+                paths.discard(path[:depth + 1])
+                if not paths:
+                    self._paths_by_name.pop(name, None)
+    
+    def get_state(self) -> Dict[str, Any]:
+        """
+        스냅샷에 저장할 인덱스 상태를 가져옵니다 (위치 해석 결과와 지역 트리).
+        
+        Returns:
+            Dict[str, Any]: {"ids", "paths", "tree"} (트리 노드는 [메모 ID 리스트, [[이름, 하위 노드], ...]])
+        """
+        def dump(node: _RegionNode) -> List[Any]:
+            return [list(node.ids), [[name, dump(child)] for name, child in node.children.items()]]
+        
+        return {"ids": list(self._paths), "paths": list(self._paths.values()), "tree": dump(self._root)}
+    
+    def set_state(self, state: Dict[str, Any]) -> None:
+        """
+        get_state()로 저장한 상태로 인덱스를 복원합니다 (위치 문자열을 다시 해석하지 않음).
+        
+        Args:
+            state (Dict[str, Any]): {"ids", "paths", "tree"}
+            
+        Raises:
+            ValueError, TypeError, KeyError: 상태 형식이 잘못된 경우
+        """
+        if len(state["ids"]) != len(state["paths"]):
+            raise ValueError("지역 인덱스 상태의 길이가 맞지 않습니다.")
+        paths_by_name: Dict[str, Set[Tuple[str, ...]]] = {}
+        
+        def load(data: List[Any], path: Tuple[str, ...]) -> _RegionNode:
+            ids, children = data
+            node = _RegionNode()
+            node.ids = set(ids)
+            for name, child in children:
+                if not isinstance(name, str) or len(path) >= len(REGION_LEVELS):
+                    raise ValueError("지역 인덱스 트리 형식이 잘못되었습니다.")
+                if name:
+                    paths_by_name.setdefault(name, set()).add(path + (name,))
+                node.children[name] = load(child, path + (name,))
+            return node
+        
+        self._root = load(state["tree"], ())
+        self._paths = dict(zip(state["ids"], map(tuple, state["paths"])))
+        self._paths_by_name = paths_by_name
+    
+    def on_memo_changed(self, event: str, memo: Dict[str, Any],
+                        previous: Optional[Dict[str, Any]] = None) -> None:
+        """
+        MemoModel 변경 이벤트 리스너
+        
+        Args:
+            event (str): 변경 이벤트 종류
+            memo (Dict[str, Any]): 변경된 메모
+            previous (Optional[Dict[str, Any]]): 변경 전 메모
+        """
+        if event in ("deleted", "purged"):
+            self.remove(memo["id"])
+        elif event != "updated" or previous is None or \
+                previous.get("location") != memo.get("location"):
+            self.add(memo)
+    
+    def _find_node(self, region: Sequence[str]) -> Optional[_RegionNode]:
+        """지역 경로에 해당하는 노드를 찾습니다."""
+        node = self._root
+        for name in region:
+            node = node.children.get(name)
+            if node is None:
+                return None
+        return node
+    
+    def _partial_paths(self) -> Iterator[Tuple[str, ...]]:
+        """상위 단계를 생략한 위치의 트리 노드 경로 (이름이 있는 단계에서 끝나는 것)를 차례로 돌려줍니다."""
+        for paths in self._paths_by_name.values():
+            for path in paths:
+                if not all(path):
+                    yield path
+    
+    def _resolves_into(self, partial: Tuple[str, ...], region: Sequence[str]) -> bool:
+        """생략된 상위 단계를 채운 완전한 경로 중 지역 경로 아래에 있는 것이 트리에 있는지 확인합니다."""
+        return any(all(path) and path[:len(region)] == tuple(region) and region_matches(partial, path)
+                   for path in self._paths_by_name.get(partial[-1], ())
+                   if len(path) == len(partial))
+    
+    def get_ids(self, region: Sequence[str] = (), include_partial: bool = False) -> Set[int]:
+        """
+        지역 경로 아래에 있는 메모 ID를 가져옵니다.
+        
+        include_partial이 참이면 "강남구 삼성동"처럼 상위 단계를 생략한 위치도, 같은 이름의
+        완전한 경로(예: ("서울특별시", "강남구"))가 트리에 있으면 그 상위 지역들 아래에 포함합니다.
+        "중구"처럼 여러 시/도에 있는 이름은 해당하는 모든 시/도에 포함되고, "기타"에도 그대로 남습니다.
+        
+        Args:
+            region (Sequence[str]): 위 단계부터의 지역 이름 (예: ("서울특별시", "강남구"))
+            include_partial (bool): 상위 단계를 생략한 위치도 포함할지 여부
+            
+        Returns:
+            Set[int]: 메모 ID 집합
+        """
+        node = self._find_node(region)
+        ids = set(node.ids) if node else set()
+        if include_partial and region and all(region):
+            for partial in self._partial_paths():
+                if len(partial) >= len(region) and self._resolves_into(partial, region):
+                    ids |= self._find_node(partial).ids
+        return ids
+    
+    def contains(self, memo_id: int, region: Sequence[str], include_partial: bool = False) -> bool:
+        """
+        메모가 지역 경로 아래에 있는지 확인합니다 (get_ids와 같은 기준).
+        
+        Args:
+            memo_id (int): 메모 ID
+            region (Sequence[str]): 위 단계부터의 지역 이름
+            include_partial (bool): 상위 단계를 생략한 위치도 포함할지 여부
+            
+        Returns:
+            bool: 포함 여부
+        """
+        node = self._find_node(region)
+        if node is not None and memo_id in node.ids:
+            return True
+        path = self._paths.get(memo_id)
+        if not include_partial or path is None or not region or not all(region):
+            return False
+        for depth in range(len(region) - 1, len(path)):
+            partial = path[:depth + 1]
+            if partial[-1] and not all(partial) and self._resolves_into(partial, region):
+                return True
+        return False
+    
+    def get_children(self, region: Sequence[str] = (),
+                     include_partial: bool = False) -> List[Tuple[str, int]]:
+        """
+        지역 경로 바로 아래 단계의 지역과 메모 수를 가져옵니다.
+        
+        Args:
+            region (Sequence[str]): 위 단계부터의 지역 이름 (빈 값이면 시/도 목록)
+            include_partial (bool): 메모 수에 상위 단계를 생략한 위치도 포함할지 여부
+            
+        Returns:
+            List[Tuple[str, int]]: (지역 이름, 메모 수) 리스트 (이름이 없는 단계는 빈 문자열)
+        """
+        node = self._find_node(region)
+        if node is None:
+            return []
+        if not include_partial:
+            return sorted((name, len(child.ids)) for name, child in node.children.items())
+        return sorted((name, len(self.get_ids(tuple(region) + (name,), include_partial=True)))
+                      for name in node.children)
+    
+    def __len__(self) -> int:
+        return len(self._paths)
@@ -4,19 +4,55 @@ PySide6를 사용한 현대적인 메모 관리 시스템
 """
 import sys
 import os
-from typing import Optional, Dict, Any
-from datetime import datetime
+import tempfile
+from typing import Optional, Dict, Any, List, Set, Tuple
+from datetime import date, datetime, timedelta
+
+# 시작 시간 측정 기준점을 잡기 위해 Qt보다 먼저 임포트합니다
+from startup_probe import probe, PROBE_ARG
 
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
     QGridLayout, QLabel, QPushButton, QLineEdit, QTextEdit, 
     QListWidget, QListWidgetItem, QFrame, QGroupBox, QComboBox,
-    QMessageBox, QSplitter, QScrollArea, QSizePolicy
+    QMessageBox, QSplitter, QScrollArea, QSizePolicy, QDialog, QInputDialog,
+    QDateEdit, QFileDialog, QCompleter, QTabWidget, QTableWidget, QTableWidgetItem,
+    QHeaderView, QAbstractItemView, QStyle, QCheckBox
+)
+from PySide6.QtCore import (
+    Qt, QTimer, Signal, QThread, QDate, QStringListModel, QObject, QRunnable, QThreadPool,
+    QSize, QBuffer, QByteArray, QIODevice, QUrl
+)
+from PySide6.QtGui import (
+    QFont, QIcon, QPixmap, QPalette, QColor, QTextCursor, QPainter, QImageReader,
+    QDesktopServices
 )
-from PySide6.QtCore import Qt, QTimer, Signal, QThread
-from PySide6.QtGui import QFont, QIcon, QPixmap, QPalette, QColor
 
+from analytics import MemoAggregates, DIMENSION_LABELS
 from memo_model import MemoModel
+from render_cache import build_render_data
+from saved_search import DATE_RANGE_PRESETS, resolve_date_range
+from spatial_index import parse_coordinates, format_coordinates, get_coordinates
+from thumbnail_cache import ThumbnailCache, THUMBNAIL_SIZE
+from workspace import Workspace, WorkspaceManager
+
+
+# 이 길이를 넘는 본문은 상세 보기에 나누어 불러옵니다
+CONTENT_STREAMING_THRESHOLD = 128 * 1024
+
+# 한 번에 상세 보기에 넣는 본문 글자 수
+CONTENT_CHUNK_SIZE = 32 * 1024
+
+# 편집 중 초안 자동 저장 간격 (밀리초)
+AUTOSAVE_INTERVAL = 5 * 1000
+
+# 주변 매물 검색 반경 (km)
+NEARBY_RADIUS_OPTIONS = [0.5, 1, 3, 5, 10]
+
+# 주변 매물 최대 표시 수
+NEARBY_RESULT_LIMIT = 50
+
+probe.mark("import")
 
 
 class MemoItemWidget(QWidget):
@@ -24,9 +60,11 @@ class MemoItemWidget(QWidget):
     
     memo_selected = Signal(dict)
     
-    def __init__(self, memo_data: Dict[str, Any], parent=None):
+    def __init__(self, memo_data: Dict[str, Any], render_data: Optional[Dict[str, Any]] = None,
+                 parent=None):
         super().__init__(parent)
         self.memo_data = memo_data
+        self.render_data = render_data or build_render_data(memo_data)
         self.setup_ui()
         self.setup_style()
     
@@ -37,15 +75,13 @@ class MemoItemWidget(QWidget):
         layout.setSpacing(5)
         
         # 제목 - 이지지색상
-        self.title_label = QLabel(self.memo_data.get("title", "제목 없음"))
+        self.title_label = QLabel(self.render_data["title"])
         self.title_label.setFont(QFont("Inter", 14, QFont.Bold))
         self.title_label.setWordWrap(True)
         self.title_label.setStyleSheet("color: var(--easy-text-dark); font-weight: 700; margin-bottom: 4px;")
         
         # 내용 미리보기 - 이지지색상
-        content = self.memo_data.get("content", "")
-        preview = content[:100] + "..." if len(content) > 100 else content
-        self.content_label = QLabel(preview)
+        self.content_label = QLabel(self.render_data["preview"])
         self.content_label.setFont(QFont("Inter", 11))
         self.content_label.setWordWrap(True)
         self.content_label.setStyleSheet("color: var(--easy-text-medium); line-height: 1.5; margin-bottom: 8px;")
@@ -54,27 +90,27 @@ class MemoItemWidget(QWidget):
         meta_layout = QHBoxLayout()
         
         # 카테고리 - 이지지색상 (연보라)
-        if self.memo_data.get("category"):
-            self.category_label = QLabel(f"📁 {self.memo_data['category']}")
+        if self.render_data["category"]:
+            self.category_label = QLabel(self.render_data["category"])
             self.category_label.setFont(QFont("Inter", 10, QFont.Bold))
             self.category_label.setStyleSheet("color: var(--easy-purple); background: #e8eaf6; padding: 6px 12px; border-radius: 20px; font-weight: 600; border: 1px solid var(--easy-purple);")
             meta_layout.addWidget(self.category_label)
         
         # 부동산 유형 - 이지지색상 (민트 그린)
-        if self.memo_data.get("property_type"):
-            self.property_label = QLabel(f"🏠 {self.memo_data['property_type']}")
+        if self.render_data["property_type"]:
+            self.property_label = QLabel(self.render_data["property_type"])
             self.property_label.setFont(QFont("Inter", 10, QFont.Bold))
             self.property_label.setStyleSheet("color: var(--easy-green); background: #e0f2f1; padding: 6px 12px; border-radius: 20px; font-weight: 600; border: 1px solid var(--easy-green);")
             meta_layout.addWidget(self.property_label)
         
         # 우선순위 - 이지지색상 (상태 색상 사용)
-        priority = self.memo_data.get("priority", "보통")
+        priority = self.render_data["priority"]
         priority_styles = {
             "높음": "color: var(--easy-danger); background: #ffebee; border: 1px solid var(--easy-danger);",
             "보통": "color: var(--easy-warning); background: #fff3e0; border: 1px solid var(--easy-warning);",
             "낮음": "color: var(--easy-purple); background: #e8eaf6; border: 1px solid var(--easy-purple);"
         }
-        self.priority_label = QLabel(f"⚡ {priority}")
+        self.priority_label = QLabel(self.render_data["priority_label"])
         self.priority_label.setFont(QFont("Inter", 10, QFont.Bold))
         self.priority_label.setStyleSheet(f"{priority_styles.get(priority, priority_styles['보통'])} padding: 6px 12px; border-radius: 20px; font-weight: 600;")
         meta_layout.addWidget(self.priority_label)
@@ -82,17 +118,7 @@ class MemoItemWidget(QWidget):
         meta_layout.addStretch()
         
         # 날짜
-        created_at = self.memo_data.get("created_at", "")
-        if created_at:
-            try:
-                dt = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-                date_str = dt.strftime("%Y-%m-%d %H:%M")
-            except:
-                date_str = created_at
-        else:
-            date_str = "날짜 없음"
-            
-        self.date_label = QLabel(date_str)
+        self.date_label = QLabel(self.render_data["date"])
         self.date_label.setFont(QFont("Inter", 9))
         self.date_label.setStyleSheet("color: var(--easy-text-light); font-weight: 400;")
         meta_layout.addWidget(self.date_label)
@@ -130,26 +156,620 @@ class MemoItemWidget(QWidget):
         super().mousePressEvent(event)
 
 
+class MemoHistoryDialog(QDialog):
+    """메모 변경 이력 보기 대화상자"""
+    
+    def __init__(self, memo_model: MemoModel, memo_id: int, parent=None):
+        super().__init__(parent)
+        self.memo_model = memo_model
+        self.memo_id = memo_id
+        self.setup_ui()
+        self.load_versions()
+    
+    def setup_ui(self):
+        """UI 구성"""
+        self.setWindowTitle("📜 변경 이력")
+        self.resize(800, 500)
+        
+        layout = QHBoxLayout(self)
+        
+        # 버전 목록
+        self.version_list = QListWidget()
+        self.version_list.setObjectName("versionList")
+        self.version_list.setFixedWidth(220)
+        self.version_list.currentItemChanged.connect(self.on_version_selected)
+        
+        # 선택한 버전의 내용
+        self.version_view = QTextEdit()
+        self.version_view.setObjectName("versionView")
+        self.version_view.setReadOnly(True)
+        
+        layout.addWidget(self.version_list)
+        layout.addWidget(self.version_view)
+    
+    def load_versions(self):
+        """버전 목록 로드 (최신 버전이 위)"""
+        versions = self.memo_model.get_memo_history(self.memo_id)
+        for entry in reversed(versions):
+            timestamp = entry["timestamp"]
+            if timestamp:
+                try:
+                    date_str = datetime.fromisoformat(timestamp).strftime("%Y-%m-%d %H:%M")
+                except ValueError:
+                    date_str = timestamp
+            else:
+                date_str = "이전 기록"
+            item = QListWidgetItem(f"v{entry['version'] + 1} · {date_str}")
+            item.setData(Qt.UserRole, entry["version"])
+            self.version_list.addItem(item)
+        
+        if self.version_list.count():
+            self.version_list.setCurrentRow(0)
+        else:
+            self.version_view.setPlainText("저장된 변경 이력이 없습니다.")
+    
+    def on_version_selected(self, current, previous):
+        """버전 선택 이벤트"""
+        if current is None:
+            return
+        content = self.memo_model.get_memo_version(self.memo_id, current.data(Qt.UserRole))
+        self.version_view.setPlainText(content or "")
+
+
+class TrashDialog(QDialog):
+    """휴지통 대화상자"""
+    
+    def __init__(self, memo_model: MemoModel, parent=None):
+        super().__init__(parent)
+        self.memo_model = memo_model
+        self.restored_ids = []
+        self.setup_ui()
+        self.load_deleted_memos()
+    
+    def setup_ui(self):
+        """UI 구성"""
+        self.setWindowTitle("♻️ 휴지통")
+        self.resize(500, 400)
+        
+        layout = QVBoxLayout(self)
+        
+        info_label = QLabel("삭제된 메모는 30일이 지나면 자동으로 영구 삭제됩니다.")
+        info_label.setStyleSheet("color: var(--easy-text-medium);")
+        
+        self.trash_list = QListWidget()
+        self.trash_list.setObjectName("trashList")
+        
+        button_layout = QHBoxLayout()
+        self.restore_btn = QPushButton("♻️ 복원")
+        self.restore_btn.setObjectName("restoreButton")
+        self.restore_btn.setFixedHeight(35)
+        self.restore_btn.clicked.connect(self.restore_selected)
+        
+        close_btn = QPushButton("닫기")
+        close_btn.setFixedHeight(35)
+        close_btn.clicked.connect(self.accept)
+        
+        button_layout.addStretch()
+        button_layout.addWidget(self.restore_btn)
+        button_layout.addWidget(close_btn)
+        
+        layout.addWidget(info_label)
+        layout.addWidget(self.trash_list)
+        layout.addLayout(button_layout)
+    
+    def load_deleted_memos(self):
+        """휴지통 메모 목록 로드"""
+        self.trash_list.clear()
+        for memo in self.memo_model.get_deleted_memos():
+            try:
+                date_str = datetime.fromisoformat(memo["deleted_at"]).strftime("%Y-%m-%d %H:%M")
+            except ValueError:
+                date_str = memo["deleted_at"]
+            item = QListWidgetItem(f"{memo.get('title', '제목 없음')}  ·  {date_str} 삭제")
+            item.setData(Qt.UserRole, memo["id"])
+            self.trash_list.addItem(item)
+        self.restore_btn.setEnabled(self.trash_list.count() > 0)
+    
+    def restore_selected(self):
+        """선택한 메모 복원"""
+        item = self.trash_list.currentItem()
+        if item is None:
+            return
+        memo_id = item.data(Qt.UserRole)
+        if self.memo_model.restore_memo(memo_id):
+            self.restored_ids.append(memo_id)
+            self.load_deleted_memos()
+        else:
+            QMessageBox.critical(self, "오류", "메모 복원에 실패했습니다.")
+
+
+class StorageWorker(QThread):
+    """유휴 시간에 저장소를 정리하는 백그라운드 작업 스레드"""
+    
+    # (정리한 메모 모델, 영구 삭제된 메모 리스트)
+    compacted = Signal(object, list)
+    
+    def __init__(self, memo_model: MemoModel, parent=None):
+        super().__init__(parent)
+        self.memo_model = memo_model
+    
+    def run(self):
+        """미저장 변경 사항을 저장하고, 오래된 메모를 압축 보관하고, 오래된 휴지통 메모를 영구 삭제합니다."""
+        self.memo_model.flush()
+        self.memo_model.archive_cold_memos()
+        # 리스너는 GUI 스레드에서 읽으므로 삭제 이벤트는 compacted 신호를 받은 쪽에서 전달합니다
+        memo_model = self.memo_model
+        self.compacted.emit(memo_model, memo_model.compact(notify=False))
+
+
+class ThumbnailSignals(QObject):
+    """썸네일 작업 완료 신호 (GUI 스레드에서 받음)"""
+    
+    # (첨부 파일 해시, 썸네일 경로 - 만들 수 없으면 빈 문자열)
+    finished = Signal(str, str)
+
+
+class ThumbnailTask(QRunnable):
+    """첨부 파일 썸네일 하나를 만드는 스레드 풀 작업"""
+    
+    def __init__(self, source_path: str, file_hash: str, cache: ThumbnailCache,
+                 signals: ThumbnailSignals):
+        super().__init__()
+        self.source_path = source_path
+        self.file_hash = file_hash
+        self.cache = cache
+        self.signals = signals
+    
+    def run(self):
+        """이미지를 줄여 읽고 PNG로 캐시에 저장합니다 (QPixmap 대신 스레드에서 쓸 수 있는 QImage 사용)."""
+        path = ""
+        reader = QImageReader(self.source_path)
+        reader.setAutoTransform(True)
+        if reader.canRead():
+            # 큰 사진은 디코딩 단계에서 바로 줄여 읽습니다
+            size = reader.size()
+            if size.isValid() and (size.width() > THUMBNAIL_SIZE or size.height() > THUMBNAIL_SIZE):
+                reader.setScaledSize(size.scaled(THUMBNAIL_SIZE, THUMBNAIL_SIZE, Qt.KeepAspectRatio))
+            image = reader.read()
+            if not image.isNull():
+                if image.width() > THUMBNAIL_SIZE or image.height() > THUMBNAIL_SIZE:
+                    image = image.scaled(THUMBNAIL_SIZE, THUMBNAIL_SIZE, Qt.KeepAspectRatio,
+                                         Qt.SmoothTransformation)
+                data = QByteArray()
+                buffer = QBuffer(data)
+                buffer.open(QIODevice.WriteOnly)
+                image.save(buffer, "PNG")
+                buffer.close()
+                path = self.cache.put(self.file_hash, bytes(data)) or ""
+        self.signals.finished.emit(self.file_hash, path)
+
+
+class DuplicateReportWorker(QThread):
+    """전체 메모 중복 보고서를 만드는 백그라운드 작업 스레드"""
+    
+    report_ready = Signal(list)
+    
+    def __init__(self, memo_model: MemoModel, parent=None):
+        super().__init__(parent)
+        self.memo_model = memo_model
+    
+    def run(self):
+        """저장된 서명으로 중복 그룹을 계산합니다."""
+        self.report_ready.emit(self.memo_model.get_duplicate_report())
+
+
+class DuplicateReportDialog(QDialog):
+    """중복 의심 메모 보고서 대화상자"""
+    
+    def __init__(self, memo_model: MemoModel, parent=None):
+        super().__init__(parent)
+        self.memo_model = memo_model
+        self.selected_id = None
+        self.setup_ui()
+        
+        self.worker = DuplicateReportWorker(memo_model, self)
+        self.worker.report_ready.connect(self.show_report)
+        self.worker.start()
+    
+    def setup_ui(self):
+        """UI 구성"""
+        self.setWindowTitle("👥 중복 의심 메모")
+        self.resize(560, 440)
+        
+        layout = QVBoxLayout(self)
+        
+        self.info_label = QLabel("전체 메모를 분석하는 중...")
+        self.info_label.setStyleSheet("color: var(--easy-text-medium);")
+        
+        self.group_list = QListWidget()
+        self.group_list.setObjectName("duplicateList")
+        self.group_list.itemDoubleClicked.connect(self.open_selected)
+        
+        button_layout = QHBoxLayout()
+        self.open_btn = QPushButton("📄 메모 열기")
+        self.open_btn.setObjectName("openDuplicateButton")
+        self.open_btn.setFixedHeight(35)
+        self.open_btn.setEnabled(False)
+        self.open_btn.clicked.connect(self.open_selected)
+        
+        close_btn = QPushButton("닫기")
+        close_btn.setFixedHeight(35)
+        close_btn.clicked.connect(self.reject)
+        
+        button_layout.addStretch()
+        button_layout.addWidget(self.open_btn)
+        button_layout.addWidget(close_btn)
+        
+        layout.addWidget(self.info_label)
+        layout.addWidget(self.group_list)
+        layout.addLayout(button_layout)
+    
+    def show_report(self, groups: List[List[Dict[str, Any]]]):
+        """중복 그룹 표시"""
+        self.group_list.clear()
+        for number, group in enumerate(groups, 1):
+            header = QListWidgetItem(f"그룹 {number}  ·  {len(group)}개")
+            header.setFlags(Qt.NoItemFlags)
+            self.group_list.addItem(header)
+            for memo in group:
+                created = memo.get("created_at", "")[:10]
+                item = QListWidgetItem(f"    {memo.get('title', '제목 없음')}  ·  "
+                                       f"{memo.get('location') or '위치 없음'}  ·  {created}")
+                item.setData(Qt.UserRole, memo["id"])
+                self.group_list.addItem(item)
+        
+        if groups:
+            count = sum(len(group) for group in groups)
+            self.info_label.setText(f"중복으로 보이는 메모 {count}개 ({len(groups)}개 그룹)")
+        else:
+            self.info_label.setText("중복으로 보이는 메모가 없습니다.")
+        self.open_btn.setEnabled(bool(groups))
+    
+    def open_selected(self, *args):
+        """선택한 메모를 열고 대화상자 닫기"""
+        item = self.group_list.currentItem()
+        if item is None or item.data(Qt.UserRole) is None:
+            return
+        self.selected_id = item.data(Qt.UserRole)
+        self.accept()
+    
+    def done(self, result):
+        """분석이 끝날 때까지 기다린 뒤 닫기"""
+        self.worker.wait()
+        super().done(result)
+
+
+class NearbyMemosDialog(QDialog):
+    """기준 메모 주변 매물 대화상자 (공간 인덱스로 가까운 순 조회)"""
+    
+    def __init__(self, memo_model: MemoModel, memo: Dict[str, Any], parent=None):
+        super().__init__(parent)
+        self.memo_model = memo_model
+        self.memo = memo
+        self.selected_id = None
+        self.setup_ui()
+        self.refresh()
+    
+    def setup_ui(self):
+        """UI 구성"""
+        self.setWindowTitle(f"📍 주변 매물 - {self.memo.get('title', '제목 없음')}")
+        self.resize(560, 440)
+        
+        layout = QVBoxLayout(self)
+        
+        radius_layout = QHBoxLayout()
+        radius_label = QLabel("반경:")
+        self.radius_combo = QComboBox()
+        for radius in NEARBY_RADIUS_OPTIONS:
+            self.radius_combo.addItem(f"{radius:g} km", radius)
+        self.radius_combo.setCurrentIndex(NEARBY_RADIUS_OPTIONS.index(1))
+        self.radius_combo.currentIndexChanged.connect(self.refresh)
+        radius_layout.addWidget(radius_label)
+        radius_layout.addWidget(self.radius_combo)
+        radius_layout.addStretch()
+        
+        self.info_label = QLabel()
+        self.info_label.setStyleSheet("color: var(--easy-text-medium);")
+        
+        self.nearby_list = QListWidget()
+        self.nearby_list.setObjectName("nearbyList")
+        self.nearby_list.itemDoubleClicked.connect(self.open_selected)
+        
+        button_layout = QHBoxLayout()
+        self.open_btn = QPushButton("📄 메모 열기")
+        self.open_btn.setObjectName("openNearbyButton")
+        self.open_btn.setFixedHeight(35)
+        self.open_btn.setEnabled(False)
+        self.open_btn.clicked.connect(self.open_selected)
+        
+        close_btn = QPushButton("닫기")
+        close_btn.setFixedHeight(35)
+        close_btn.clicked.connect(self.reject)
+        
+        button_layout.addStretch()
+        button_layout.addWidget(self.open_btn)
+        button_layout.addWidget(close_btn)
+        
+        layout.addLayout(radius_layout)
+        layout.addWidget(self.info_label)
+        layout.addWidget(self.nearby_list)
+        layout.addLayout(button_layout)
+    
+    def refresh(self):
+        """선택한 반경 안의 메모를 가까운 순으로 표시"""
+        radius = self.radius_combo.currentData()
+        latitude, longitude = get_coordinates(self.memo)
+        nearby = self.memo_model.find_nearby_memos(latitude, longitude, radius,
+                                                   NEARBY_RESULT_LIMIT, exclude_id=self.memo["id"])
+        
+        self.nearby_list.clear()
+        for memo, distance in nearby:
+            distance_text = f"{distance * 1000:.0f} m" if distance < 1 else f"{distance:.2f} km"
+            item = QListWidgetItem(f"{distance_text}  ·  {memo.get('title', '제목 없음')}  ·  "
+                                   f"{memo.get('property_type') or '유형 없음'}  ·  "
+                                   f"{memo.get('location') or '위치 없음'}")
+            item.setData(Qt.UserRole, memo["id"])
+            self.nearby_list.addItem(item)
+        
+        if nearby:
+            self.info_label.setText(f"반경 {radius:g} km 안의 메모 {len(nearby)}개 (가까운 순)")
+        else:
+            self.info_label.setText(f"반경 {radius:g} km 안에 좌표가 입력된 다른 메모가 없습니다.")
+        self.open_btn.setEnabled(bool(nearby))
+    
+    def open_selected(self, *args):
+        """선택한 메모를 열고 대화상자 닫기"""
+        item = self.nearby_list.currentItem()
+        if item is None:
+            return
+        self.selected_id = item.data(Qt.UserRole)
+        self.accept()
+
+
+class ActivityChartWidget(QWidget):
+    """기간별 메모 수 막대 차트"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.data: List[Tuple[str, int]] = []
+        self.setMinimumSize(560, 260)
+    
+    def set_data(self, data: List[Tuple[str, int]]):
+        """(라벨, 메모 수) 리스트 설정"""
+        self.data = data
+        self.update()
+    
+    def paintEvent(self, event):
+        """막대 그리기"""
+        if not self.data:
+            return
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        
+        margin = 24
+        chart_height = self.height() - margin * 2
+        bar_width = (self.width() - margin * 2) / len(self.data)
+        max_count = max(count for _, count in self.data) or 1
+        label_step = max(1, len(self.data) // 10)
+        
+        painter.setFont(QFont("Inter", 8))
+        for index, (label, count) in enumerate(self.data):
+            bar_height = chart_height * count / max_count
+            x = margin + index * bar_width
+            y = margin + chart_height - bar_height
+            painter.fillRect(int(x + 2), int(y), max(1, int(bar_width - 4)), int(bar_height),
+                             QColor("#b39ddb"))
+            if count:
+                painter.setPen(QColor("#424242"))
+                painter.drawText(int(x), int(y - 4), str(count))
+            if index % label_step == 0:
+                painter.setPen(QColor("#757575"))
+                painter.drawText(int(x), self.height() - 6, label)
+        painter.end()
+
+
+class ActivityChartDialog(QDialog):
+    """메모 활동 차트 대화상자"""
+    
+    def __init__(self, memo_model: MemoModel, parent=None):
+        super().__init__(parent)
+        self.memo_model = memo_model
+        self.setup_ui()
+        self.load_activity()
+    
+    def setup_ui(self):
+        """UI 구성"""
+        self.setWindowTitle("📊 메모 활동")
+        self.resize(640, 360)
+        
+        layout = QVBoxLayout(self)
+        
+        option_layout = QHBoxLayout()
+        self.bucket_combo = QComboBox()
+        self.bucket_combo.addItem("일별 (최근 30일)", "day")
+        self.bucket_combo.addItem("주별 (최근 12주)", "week")
+        self.bucket_combo.currentIndexChanged.connect(self.load_activity)
+        
+        self.field_combo = QComboBox()
+        self.field_combo.addItem("작성", "created_at")
+        self.field_combo.addItem("수정", "updated_at")
+        self.field_combo.currentIndexChanged.connect(self.load_activity)
+        
+        option_layout.addWidget(self.bucket_combo)
+        option_layout.addWidget(self.field_combo)
+        option_layout.addStretch()
+        
+        self.chart = ActivityChartWidget()
+        
+        layout.addLayout(option_layout)
+        layout.addWidget(self.chart)
+    
+    def load_activity(self):
+        """시각 인덱스에서 구간별 메모 수 로드"""
+        bucket = self.bucket_combo.currentData()
+        today = date.today()
+        start = today - timedelta(days=29) if bucket == "day" else today - timedelta(weeks=11)
+        counts = self.memo_model.get_activity_counts(start, today, bucket,
+                                                     self.field_combo.currentData())
+        self.chart.set_data([(day.strftime("%m/%d"), count) for day, count in counts])
+
+
+class DashboardWidget(QWidget):
+    """메모 통계 대시보드 (증분 집계에서 바로 계산)"""
+    
+    def __init__(self, aggregates: MemoAggregates, parent=None):
+        super().__init__(parent)
+        self.aggregates = aggregates
+        self.setup_ui()
+    
+    def setup_ui(self):
+        """UI 구성"""
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 10, 0, 0)
+        
+        # 필터와 집계 기준
+        option_layout = QHBoxLayout()
+        self.filter_combos: Dict[str, QComboBox] = {}
+        for dimension in ("category", "property_type", "priority"):
+            combo = QComboBox()
+            combo.setMinimumWidth(100)
+            combo.currentIndexChanged.connect(self.refresh)
+            option_layout.addWidget(QLabel(f"{DIMENSION_LABELS[dimension]}:"))
+            option_layout.addWidget(combo)
+            self.filter_combos[dimension] = combo
+        
+        self.group_combo = QComboBox()
+        for dimension in ("region", "property_type", "category", "priority"):
+            self.group_combo.addItem(f"{DIMENSION_LABELS[dimension]}별", dimension)
+        self.group_combo.currentIndexChanged.connect(self.refresh)
+        option_layout.addWidget(QLabel("기준:"))
+        option_layout.addWidget(self.group_combo)
+        option_layout.addStretch()
+        
+        self.total_label = QLabel()
+        self.total_label.setObjectName("memoMetaLabel")
+        option_layout.addWidget(self.total_label)
+        
+        # 구분별 메모 수 표
+        breakdown_group = QGroupBox("📋 구분별 메모 수")
+        breakdown_layout = QVBoxLayout(breakdown_group)
+        self.breakdown_table = QTableWidget(0, 2)
+        self.breakdown_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.breakdown_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.breakdown_table.verticalHeader().setVisible(False)
+        self.breakdown_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        breakdown_layout.addWidget(self.breakdown_table)
+        
+        # 주별 새 메모 차트
+        weekly_group = QGroupBox("📈 주별 새 메모 (최근 12주)")
+        weekly_layout = QVBoxLayout(weekly_group)
+        self.weekly_chart = ActivityChartWidget()
+        self.weekly_chart.setMinimumSize(360, 260)
+        weekly_layout.addWidget(self.weekly_chart)
+        
+        content_layout = QHBoxLayout()
+        content_layout.addWidget(breakdown_group, 2)
+        content_layout.addWidget(weekly_group, 3)
+        
+        layout.addLayout(option_layout)
+        layout.addLayout(content_layout)
+    
+    def set_aggregates(self, aggregates: MemoAggregates):
+        """다른 워크스페이스의 집계로 교체"""
+        self.aggregates = aggregates
+        self.reload()
+    
+    def current_filters(self) -> Dict[str, str]:
+        """선택된 필터 (전체는 제외)"""
+        return {dimension: combo.currentData() for dimension, combo in self.filter_combos.items()
+                if combo.currentData() is not None}
+    
+    def update_filter_combos(self):
+        """필터 콤보박스를 집계에 나타나는 값으로 채우기 (선택 유지)"""
+        for dimension, combo in self.filter_combos.items():
+            current = combo.currentData()
+            combo.blockSignals(True)
+            combo.clear()
+            combo.addItem("전체", None)
+            for value in self.aggregates.values(dimension):
+                combo.addItem(value, value)
+            index = combo.findData(current) if current is not None else 0
+            combo.setCurrentIndex(max(0, index))
+            combo.blockSignals(False)
+    
+    def reload(self):
+        """필터 값과 통계 새로고침"""
+        self.update_filter_combos()
+        self.refresh()
+    
+    def refresh(self):
+        """현재 필터로 통계 표시"""
+        filters = self.current_filters()
+        dimension = self.group_combo.currentData()
+        rows = self.aggregates.breakdown(dimension, **filters)
+        
+        self.breakdown_table.setHorizontalHeaderLabels([DIMENSION_LABELS[dimension], "메모 수"])
+        self.breakdown_table.setRowCount(len(rows))
+        for row, (value, count) in enumerate(rows):
+            self.breakdown_table.setItem(row, 0, QTableWidgetItem(value or "기타"))
+            count_item = QTableWidgetItem(str(count))
+            count_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+            self.breakdown_table.setItem(row, 1, count_item)
+        
+        self.total_label.setText(f"총 {sum(count for _, count in rows)}개의 메모")
+        weeks = self.aggregates.weekly_counts(date.today() - timedelta(weeks=11), 12, **filters)
+        self.weekly_chart.set_data([(day.strftime("%m/%d"), count) for day, count in weeks])
+
+
 class MemoApp(QMainWindow):
     """메인 메모 애플리케이션 클래스"""
     
     def __init__(self):
         super().__init__()
-        self.memo_model = MemoModel()
+        self.workspaces = WorkspaceManager()
+        self.bind_workspace(self.workspaces.open(self.workspaces.get_last_path()))
+        probe.mark("model_load")
+        self.first_painted = False
         self.current_memo_id = None
         self.is_editing = False
+        self.content_load_token = 0
+        self.is_loading_content = False
+        self.edit_baseline: Dict[str, str] = {}
+        self.dirty_fields = set()
+        self.pending_draft_recovery = False
         
         self.setup_ui()
         self.setup_style()
         self.load_memos()
         self.setup_connections()
+        self.setup_storage_maintenance()
+        self.setup_autosave()
+        self.setup_autocomplete()
+    
+    def bind_workspace(self, workspace: Workspace):
+        """워크스페이스의 모델, 인덱스, 캐시를 화면에 연결"""
+        self.workspace = workspace
+        self.memo_model = workspace.memo_model
+        self.render_cache = workspace.render_cache
+        self.saved_searches = workspace.saved_searches
+        self.autocomplete = workspace.autocomplete
+        self.analytics = workspace.analytics
+        self.thumbnails = workspace.thumbnails
+        self.draft_journal = workspace.draft_journal
+        if hasattr(self, "storage_worker"):
+            self.storage_worker.memo_model = workspace.memo_model
+        if hasattr(self, "dashboard"):
+            self.dashboard.aggregates = workspace.analytics
     
     def setup_ui(self):
         """UI 구성"""
-        self.setWindowTitle("공인중개사 메모 관리 시스템")
+        self.update_window_title()
         self.setGeometry(100, 100, 1200, 800)
         self.setMinimumSize(800, 600)
         
+        # 메뉴바
+        self.create_menu_bar()
+        
         # 중앙 위젯
         central_widget = QWidget()
         central_widget.setObjectName("mainWidget")
@@ -172,6 +792,79 @@ class MemoApp(QMainWindow):
         # 상태바
         self.create_status_bar()
     
+    def update_window_title(self):
+        """창 제목에 현재 워크스페이스 이름 표시"""
+        self.setWindowTitle(f"공인중개사 메모 관리 시스템 - {self.workspace.name}")
+    
+    def create_menu_bar(self):
+        """메뉴바 생성"""
+        self.workspace_menu = self.menuBar().addMenu("워크스페이스(&W)")
+        self.workspace_menu.aboutToShow.connect(self.populate_workspace_menu)
+        self.populate_workspace_menu()
+    
+    def populate_workspace_menu(self):
+        """워크스페이스 메뉴 채우기 (최근 사용 순, ⚡는 메모리에 유지 중)"""
+        self.workspace_menu.clear()
+        current_path = os.path.abspath(self.workspace.file_path)
+        other_entries = []
+        for entry in self.workspaces.workspaces:
+            is_current = os.path.abspath(entry["path"]) == current_path
+            label = entry["name"]
+            if not is_current and self.workspaces.is_warm(entry["path"]):
+                label += "  ⚡"
+            action = self.workspace_menu.addAction(label)
+            action.setCheckable(True)
+            action.setChecked(is_current)
+            action.setToolTip(entry["path"])
+            action.triggered.connect(lambda _, path=entry["path"]: self.switch_workspace(path))
+            if not is_current:
+                other_entries.append(entry)
+        
+        self.workspace_menu.addSeparator()
+        open_action = self.workspace_menu.addAction("📂 워크스페이스 열기...")
+        open_action.triggered.connect(self.open_workspace_file)
+        
+        remove_menu = self.workspace_menu.addMenu("🗑️ 목록에서 제거")
+        remove_menu.setEnabled(bool(other_entries))
+        for entry in other_entries:
+            action = remove_menu.addAction(entry["name"])
+            action.triggered.connect(lambda _, path=entry["path"]: self.workspaces.remove(path))
+    
+    def open_workspace_file(self):
+        """메모 파일을 골라 워크스페이스로 등록하고 전환"""
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, "워크스페이스 열기 (없으면 새로 만듦)", "", "JSON 파일 (*.json)",
+            options=QFileDialog.DontConfirmOverwrite
+        )
+        if not file_path:
+            return
+        
+        default_name = os.path.splitext(os.path.basename(file_path))[0]
+        name, ok = QInputDialog.getText(self, "워크스페이스 이름", "이름:", text=default_name)
+        if not ok:
+            return
+        self.workspaces.add(name.strip() or default_name, file_path)
+        self.switch_workspace(file_path)
+    
+    def switch_workspace(self, file_path: str):
+        """워크스페이스 전환 - 메모리에 남아 있으면 다시 로드하지 않음"""
+        if os.path.abspath(file_path) == os.path.abspath(self.workspace.file_path):
+            return
+        
+        # 편집 중인 내용은 현재 워크스페이스의 초안으로 남깁니다
+        self.autosave_draft()
+        self.set_edit_mode(False)
+        self.storage_worker.wait()
+        self.memo_model.flush()
+        
+        self.bind_workspace(self.workspaces.open(file_path))
+        self.update_window_title()
+        self.clear_memo_detail()
+        self.load_memos()
+        self.status_label.setText(
+            f"워크스페이스 '{self.workspace.name}' ({len(self.memo_model.get_all_memos())}개의 메모)")
+        QTimer.singleShot(0, self.offer_draft_recovery)
+    
     def create_header(self, parent_layout):
         """헤더 생성"""
         header_frame = QFrame()
@@ -239,12 +932,36 @@ class MemoApp(QMainWindow):
         self.delete_btn.setFixedHeight(35)
         self.delete_btn.setEnabled(False)
         
+        # 휴지통 버튼
+        self.trash_btn = QPushButton("♻️ 휴지통")
+        self.trash_btn.setObjectName("trashButton")
+        self.trash_btn.setFixedHeight(35)
+        
         button_layout.addWidget(self.new_memo_btn)
         button_layout.addWidget(self.edit_btn)
         button_layout.addWidget(self.save_btn)
         button_layout.addWidget(self.cancel_btn)
         button_layout.addWidget(self.delete_btn)
+        # 활동 차트 버튼
+        self.activity_btn = QPushButton("📊 활동")
+        self.activity_btn.setObjectName("activityButton")
+        self.activity_btn.setFixedHeight(35)
+        
+        # 중복 찾기 버튼
+        self.duplicate_btn = QPushButton("👥 중복 찾기")
+        self.duplicate_btn.setObjectName("duplicateButton")
+        self.duplicate_btn.setFixedHeight(35)
+        
+        # 웹 동기화 버튼
+        self.sync_btn = QPushButton("🔄 웹 동기화")
+        self.sync_btn.setObjectName("syncButton")
+        self.sync_btn.setFixedHeight(35)
+        
         button_layout.addStretch()
+        button_layout.addWidget(self.duplicate_btn)
+        button_layout.addWidget(self.sync_btn)
+        button_layout.addWidget(self.activity_btn)
+        button_layout.addWidget(self.trash_btn)
         
         # 하단 검색 및 필터
         search_layout = QHBoxLayout()
@@ -259,6 +976,11 @@ class MemoApp(QMainWindow):
         self.search_input.setPlaceholderText("제목, 내용, 카테고리, 위치로 검색...")
         self.search_input.setFixedHeight(36)
         
+        # 보관된 메모 본문은 압축을 풀어야 하므로 켰을 때만 검색
+        self.archived_search_check = QCheckBox("보관 본문 포함")
+        self.archived_search_check.setObjectName("archivedSearchCheck")
+        self.archived_search_check.setToolTip("오래되어 압축 보관된 메모의 본문까지 검색합니다 (느릴 수 있음)")
+        
         # 카테고리 필터 - 이지지색상
         category_label = QLabel("카테고리:")
         category_label.setFont(QFont("Inter", 11))
@@ -289,14 +1011,60 @@ class MemoApp(QMainWindow):
         self.priority_combo.addItems(["전체", "높음", "보통", "낮음"])
         self.priority_combo.setFixedHeight(36)
         
+        # 지역 필터 (시/도 → 시/군/구 → 읍/면/동) - 이지지색상
+        region_label = QLabel("지역:")
+        region_label.setFont(QFont("Inter", 11))
+        region_label.setStyleSheet("color: var(--easy-text-dark);")
+        
+        self.region_combos = []
+        for object_name in ("sidoCombo", "sigunguCombo", "dongCombo"):
+            region_combo = QComboBox()
+            region_combo.setObjectName(object_name)
+            region_combo.addItem("전체", None)
+            region_combo.setFixedHeight(36)
+            self.region_combos.append(region_combo)
+        
+        # 기간 필터 - 이지지색상
+        date_label = QLabel("기간:")
+        date_label.setFont(QFont("Inter", 11))
+        date_label.setStyleSheet("color: var(--easy-text-dark);")
+        
+        self.date_combo = QComboBox()
+        self.date_combo.setObjectName("dateCombo")
+        self.date_combo.addItem("전체", "")
+        for preset, label in DATE_RANGE_PRESETS.items():
+            self.date_combo.addItem(label, preset)
+        self.date_combo.addItem("직접 지정", "custom")
+        self.date_combo.setFixedHeight(36)
+        
+        self.date_from_edit = QDateEdit(QDate.currentDate().addDays(-30))
+        self.date_from_edit.setObjectName("dateFromEdit")
+        self.date_from_edit.setCalendarPopup(True)
+        self.date_from_edit.setFixedHeight(36)
+        self.date_from_edit.setVisible(False)
+        
+        self.date_to_edit = QDateEdit(QDate.currentDate())
+        self.date_to_edit.setObjectName("dateToEdit")
+        self.date_to_edit.setCalendarPopup(True)
+        self.date_to_edit.setFixedHeight(36)
+        self.date_to_edit.setVisible(False)
+        
         search_layout.addWidget(search_label)
         search_layout.addWidget(self.search_input)
+        search_layout.addWidget(self.archived_search_check)
         search_layout.addWidget(category_label)
         search_layout.addWidget(self.category_combo)
         search_layout.addWidget(property_label)
         search_layout.addWidget(self.property_combo)
         search_layout.addWidget(priority_label)
         search_layout.addWidget(self.priority_combo)
+        search_layout.addWidget(region_label)
+        for region_combo in self.region_combos:
+            search_layout.addWidget(region_combo)
+        search_layout.addWidget(date_label)
+        search_layout.addWidget(self.date_combo)
+        search_layout.addWidget(self.date_from_edit)
+        search_layout.addWidget(self.date_to_edit)
         
         control_layout.addLayout(button_layout)
         control_layout.addLayout(search_layout)
@@ -309,16 +1077,62 @@ class MemoApp(QMainWindow):
         splitter = QSplitter(Qt.Horizontal)
         splitter.setChildrenCollapsible(False)
         
-        # 왼쪽: 메모 리스트
+        # 왼쪽: 저장된 검색
+        self.create_saved_search_sidebar(splitter)
+        
+        # 가운데: 메모 리스트
         self.create_memo_list(splitter)
         
         # 오른쪽: 메모 상세 보기/편집
         self.create_memo_detail(splitter)
         
         # 스플리터 비율 설정
-        splitter.setSizes([400, 600])
+        splitter.setSizes([180, 400, 600])
+        
+        # 메모 화면과 통계 대시보드 탭
+        self.main_tabs = QTabWidget()
+        self.main_tabs.setObjectName("mainTabs")
+        self.main_tabs.addTab(splitter, "📝 메모")
+        self.dashboard = DashboardWidget(self.analytics)
+        self.main_tabs.addTab(self.dashboard, "📊 대시보드")
+        
+        parent_layout.addWidget(self.main_tabs)
+    
+    def create_saved_search_sidebar(self, parent):
+        """저장된 검색 사이드바 생성"""
+        sidebar_frame = QFrame()
+        sidebar_frame.setObjectName("savedSearchFrame")
+        
+        sidebar_layout = QVBoxLayout(sidebar_frame)
+        sidebar_layout.setContentsMargins(5, 5, 5, 5)
+        
+        # 사이드바 제목 - 이지지색상
+        sidebar_title = QLabel("⭐ 저장된 검색")
+        sidebar_title.setFont(QFont("Inter", 14, QFont.Bold))
+        sidebar_title.setStyleSheet("color: var(--easy-text-dark); font-weight: 700; margin-bottom: 12px;")
+        sidebar_layout.addWidget(sidebar_title)
+        
+        # 저장된 검색 목록
+        self.saved_search_list = QListWidget()
+        self.saved_search_list.setObjectName("savedSearchList")
+        sidebar_layout.addWidget(self.saved_search_list)
+        
+        # 저장/삭제 버튼
+        button_layout = QHBoxLayout()
+        self.save_search_btn = QPushButton("➕ 현재 검색 저장")
+        self.save_search_btn.setObjectName("saveSearchButton")
+        self.save_search_btn.setFixedHeight(30)
+        
+        self.remove_search_btn = QPushButton("➖")
+        self.remove_search_btn.setObjectName("removeSearchButton")
+        self.remove_search_btn.setFixedHeight(30)
+        self.remove_search_btn.setEnabled(False)
         
-        parent_layout.addWidget(splitter)
+        button_layout.addWidget(self.save_search_btn)
+        button_layout.addWidget(self.remove_search_btn)
+        sidebar_layout.addLayout(button_layout)
+        
+        parent.addWidget(sidebar_frame)
     
     def create_memo_list(self, parent):
         """메모 리스트 생성"""
@@ -418,6 +1232,21 @@ class MemoApp(QMainWindow):
         self.priority_input.addItems(["높음", "보통", "낮음"])
         self.priority_input.setEnabled(False)
         
+        # 좌표 - 지도 앱에서 복사한 "위도, 경도"를 그대로 붙여 넣음
+        coordinate_label = QLabel("좌표:")
+        coordinate_label.setFont(QFont("Inter", 11))
+        coordinate_label.setStyleSheet("color: var(--easy-text-dark);")
+        
+        self.coordinate_input = QLineEdit()
+        self.coordinate_input.setObjectName("coordinateInput")
+        self.coordinate_input.setPlaceholderText("위도, 경도 (예: 37.4979, 127.0276)")
+        self.coordinate_input.setReadOnly(True)
+        
+        self.nearby_btn = QPushButton("📍 주변 매물")
+        self.nearby_btn.setObjectName("nearbyButton")
+        self.nearby_btn.setFixedHeight(30)
+        self.nearby_btn.setEnabled(False)
+        
         meta_layout.addWidget(category_label, 0, 0)
         meta_layout.addWidget(self.category_input, 0, 1)
         meta_layout.addWidget(property_label, 0, 2)
@@ -426,6 +1255,9 @@ class MemoApp(QMainWindow):
         meta_layout.addWidget(self.location_input, 1, 1)
         meta_layout.addWidget(priority_label, 1, 2)
         meta_layout.addWidget(self.priority_input, 1, 3)
+        meta_layout.addWidget(coordinate_label, 2, 0)
+        meta_layout.addWidget(self.coordinate_input, 2, 1)
+        meta_layout.addWidget(self.nearby_btn, 2, 3)
         
         title_layout.addLayout(meta_layout)
         detail_layout.addWidget(title_group)
@@ -444,11 +1276,59 @@ class MemoApp(QMainWindow):
         self.content_input.setReadOnly(True)
         self.content_input.setMinimumHeight(200)
         
-        content_layout.addWidget(content_label)
+        # 변경 이력 버튼
+        self.history_btn = QPushButton("📜 변경 이력")
+        self.history_btn.setObjectName("historyButton")
+        self.history_btn.setFixedHeight(30)
+        self.history_btn.setEnabled(False)
+        
+        content_header = QHBoxLayout()
+        content_header.addWidget(content_label)
+        content_header.addStretch()
+        content_header.addWidget(self.history_btn)
+        
+        content_layout.addLayout(content_header)
         content_layout.addWidget(self.content_input)
         
         detail_layout.addWidget(content_group)
         
+        # 첨부 파일 영역
+        attachment_group = QGroupBox("첨부 파일")
+        attachment_layout = QVBoxLayout(attachment_group)
+        
+        self.add_attachment_btn = QPushButton("📎 첨부 추가")
+        self.add_attachment_btn.setObjectName("addAttachmentButton")
+        self.add_attachment_btn.setFixedHeight(30)
+        self.add_attachment_btn.setEnabled(False)
+        
+        self.remove_attachment_btn = QPushButton("➖ 첨부 제거")
+        self.remove_attachment_btn.setObjectName("removeAttachmentButton")
+        self.remove_attachment_btn.setFixedHeight(30)
+        self.remove_attachment_btn.setEnabled(False)
+        
+        attachment_header = QHBoxLayout()
+        attachment_header.addStretch()
+        attachment_header.addWidget(self.add_attachment_btn)
+        attachment_header.addWidget(self.remove_attachment_btn)
+        
+        # 썸네일은 스레드 풀에서 만들어 준비되는 대로 표시합니다
+        self.attachment_list = QListWidget()
+        self.attachment_list.setObjectName("attachmentList")
+        self.attachment_list.setViewMode(QListWidget.IconMode)
+        self.attachment_list.setFlow(QListWidget.LeftToRight)
+        self.attachment_list.setWrapping(False)
+        self.attachment_list.setMovement(QListWidget.Static)
+        self.attachment_list.setIconSize(QSize(THUMBNAIL_SIZE, THUMBNAIL_SIZE))
+        self.attachment_list.setFixedHeight(THUMBNAIL_SIZE + 56)
+        self.attachment_list.setToolTip("두 번 클릭하면 파일을 엽니다")
+        self.thumbnail_signals = ThumbnailSignals(self)
+        self.pending_thumbnails = set()
+        
+        attachment_layout.addLayout(attachment_header)
+        attachment_layout.addWidget(self.attachment_list)
+        
+        detail_layout.addWidget(attachment_group)
+        
         # 빈 공간 채우기
         detail_layout.addStretch()
         
@@ -477,35 +1357,343 @@ class MemoApp(QMainWindow):
         self.save_btn.clicked.connect(self.save_memo)
         self.cancel_btn.clicked.connect(self.cancel_edit)
         self.delete_btn.clicked.connect(self.delete_memo)
+        self.history_btn.clicked.connect(self.show_history)
+        self.nearby_btn.clicked.connect(self.show_nearby)
+        self.trash_btn.clicked.connect(self.show_trash)
+        self.activity_btn.clicked.connect(self.show_activity)
+        self.sync_btn.clicked.connect(self.sync_with_web)
+        self.duplicate_btn.clicked.connect(self.show_duplicates)
         
         # 검색 이벤트
         self.search_input.textChanged.connect(self.search_memos)
+        self.archived_search_check.toggled.connect(self.filter_memos)
         self.category_combo.currentTextChanged.connect(self.filter_memos)
         self.property_combo.currentTextChanged.connect(self.filter_memos)
         self.priority_combo.currentTextChanged.connect(self.filter_memos)
+        self.date_combo.currentIndexChanged.connect(self.on_date_range_changed)
+        for level, region_combo in enumerate(self.region_combos):
+            region_combo.currentIndexChanged.connect(
+                lambda _, level=level: self.on_region_changed(level))
+        self.date_from_edit.dateChanged.connect(self.filter_memos)
+        self.date_to_edit.dateChanged.connect(self.filter_memos)
         
         # 리스트 이벤트
         self.memo_list.itemClicked.connect(self.on_memo_selected)
+        
+        # 첨부 파일 이벤트
+        self.add_attachment_btn.clicked.connect(self.add_attachments)
+        self.remove_attachment_btn.clicked.connect(self.remove_attachment)
+        self.attachment_list.itemSelectionChanged.connect(self.update_attachment_buttons)
+        self.attachment_list.itemDoubleClicked.connect(self.open_attachment)
+        self.thumbnail_signals.finished.connect(self.on_thumbnail_ready)
+        
+        # 저장된 검색 이벤트
+        self.saved_search_list.itemClicked.connect(self.on_saved_search_selected)
+        self.save_search_btn.clicked.connect(self.save_current_search)
+        self.remove_search_btn.clicked.connect(self.remove_saved_search)
+        
+        # 탭 이벤트
+        self.main_tabs.currentChanged.connect(self.refresh_dashboard)
+    
+    def setup_storage_maintenance(self):
+        """유휴 시간 저장소 정리 타이머 설정"""
+        self.storage_worker = StorageWorker(self.memo_model, self)
+        self.storage_worker.compacted.connect(self.on_storage_compacted)
+        
+        self.maintenance_timer = QTimer(self)
+        self.maintenance_timer.setInterval(60 * 1000)
+        self.maintenance_timer.timeout.connect(self.run_storage_maintenance)
+        self.maintenance_timer.start()
+    
+    def run_storage_maintenance(self):
+        """편집 중이 아닐 때 백그라운드 정리 작업 실행"""
+        if self.is_editing or self.storage_worker.isRunning():
+            return
+        self.storage_worker.start()
+    
+    def on_storage_compacted(self, memo_model: MemoModel, purged: List[Dict[str, Any]]):
+        """백그라운드 정리에서 영구 삭제된 메모를 GUI 스레드에서 인덱스와 캐시에 반영"""
+        memo_model.notify_purged(purged)
+    
+    def setup_autocomplete(self):
+        """카테고리, 부동산 유형, 위치 입력에 자동 완성 연결"""
+        for field, line_edit in (("category", self.category_input.lineEdit()),
+                                 ("property_type", self.property_input.lineEdit()),
+                                 ("location", self.location_input)):
+            # 초성 검색과 단어 중간 일치는 트라이가 처리하므로 Qt 쪽 필터링은 끕니다
+            completer = QCompleter(QStringListModel(self), self)
+            completer.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
+            line_edit.setCompleter(completer)
+            line_edit.textEdited.connect(
+                lambda text, field=field, completer=completer:
+                    self.update_completions(field, completer, text))
+        
+        # 자동 완성으로 고른 위치도 변경 사항으로 기록
+        self.location_input.completer().activated.connect(
+            lambda: self.mark_field_dirty("location"))
+    
+    def update_completions(self, field: str, completer: QCompleter, text: str):
+        """입력 중인 접두사의 자동 완성 후보 표시"""
+        suggestions = self.autocomplete.suggest(field, text)
+        if suggestions == [text.strip()]:
+            suggestions = []
+        completer.model().setStringList(suggestions)
+        if suggestions and text.strip():
+            completer.complete()
+        else:
+            completer.popup().hide()
+    
+    def setup_autosave(self):
+        """초안 자동 저장 설정"""
+        self.autosave_timer = QTimer(self)
+        self.autosave_timer.setInterval(AUTOSAVE_INTERVAL)
+        self.autosave_timer.timeout.connect(self.autosave_draft)
+        
+        # 입력 필드별 변경 추적
+        self.title_input.textEdited.connect(lambda: self.mark_field_dirty("title"))
+        # 본문은 글자 입력마다 추적하지 않고 자동 저장 때 문서의 수정 여부로 확인합니다
+        self.category_input.currentTextChanged.connect(lambda: self.mark_field_dirty("category"))
+        self.property_input.currentTextChanged.connect(lambda: self.mark_field_dirty("property_type"))
+        self.location_input.textEdited.connect(lambda: self.mark_field_dirty("location"))
+        self.priority_input.currentTextChanged.connect(lambda: self.mark_field_dirty("priority"))
+        self.coordinate_input.textEdited.connect(lambda: self.mark_field_dirty("coordinates"))
+        
+        # 이전 실행에서 저장되지 않은 초안 복구
+        QTimer.singleShot(0, self.offer_draft_recovery)
+    
+    def collect_editor_fields(self, fields: Optional[Set[str]] = None) -> Dict[str, str]:
+        """편집기 입력 값 수집 (fields가 주어지면 해당 필드만 읽음)"""
+        getters = {
+            "title": lambda: self.title_input.text().strip(),
+            "content": lambda: self.content_input.toPlainText().strip(),
+            "category": self.category_input.currentText,
+            "property_type": self.property_input.currentText,
+            "location": self.location_input.text,
+            "priority": self.priority_input.currentText,
+            "coordinates": lambda: self.coordinate_input.text().strip()
+        }
+        return {field: getter() for field, getter in getters.items()
+                if fields is None or field in fields}
+    
+    def apply_editor_fields(self, fields: Dict[str, str]):
+        """편집기에 필드 값 채우기"""
+        if "title" in fields:
+            self.title_input.setText(fields["title"])
+        if "content" in fields:
+            self.content_input.setPlainText(fields["content"])
+        if "category" in fields:
+            self.category_input.setCurrentText(fields["category"])
+        if "property_type" in fields:
+            self.property_input.setCurrentText(fields["property_type"])
+        if "location" in fields:
+            self.location_input.setText(fields["location"])
+        if "priority" in fields:
+            self.priority_input.setCurrentText(fields["priority"])
+        if "coordinates" in fields:
+            self.coordinate_input.setText(fields["coordinates"])
+    
+    def mark_field_dirty(self, field: str):
+        """편집 중 변경된 필드 기록"""
+        if self.is_editing:
+            self.dirty_fields.add(field)
+    
+    def autosave_draft(self):
+        """마지막 자동 저장 이후 변경된 필드만 초안 저널에 기록"""
+        if not self.is_editing:
+            return
+        document = self.content_input.document()
+        if document.isModified():
+            self.dirty_fields.add("content")
+            document.setModified(False)
+        if not self.dirty_fields:
+            return
+        fields = self.collect_editor_fields(self.dirty_fields)
+        self.dirty_fields.clear()
+        self.draft_journal.record(self.current_memo_id, fields)
+        self.status_label.setText(f"초안 자동 저장됨 ({datetime.now().strftime('%H:%M:%S')})")
+    
+    def offer_draft_recovery(self):
+        """저장되지 않은 초안이 있으면 메모마다 복구 여부 확인
+        
+        편집기는 한 번에 하나의 메모만 열 수 있으므로 최근 초안부터 차례로 묻고,
+        복구를 선택한 초안을 연 뒤 나머지는 일지에 남겨 두었다가 편집이 끝나면 다시 묻습니다.
+        """
+        self.pending_draft_recovery = False
+        # 편집 종료 직후에는 방금 기록한 폐기 항목까지 읽어야 함
+        self.draft_journal.flush()
+        drafts = self.draft_journal.load_pending()
+        # 이미 삭제된 메모의 초안은 복구할 수 없음
+        for memo_id in [memo_id for memo_id in drafts
+                        if memo_id is not None and not self.memo_model.get_memo(memo_id)]:
+            self.draft_journal.discard(memo_id)
+            del drafts[memo_id]
+        
+        ordered = sorted(drafts.items(), key=lambda item: item[1]["saved_at"] or "", reverse=True)
+        for index, (memo_id, draft) in enumerate(ordered):
+            memo = self.memo_model.get_memo(memo_id) if memo_id is not None else None
+            title = draft["fields"].get("title") or (memo["title"] if memo else "새 메모")
+            count = f" ({index + 1}/{len(ordered)})" if len(ordered) > 1 else ""
+            reply = QMessageBox.question(
+                self, "초안 복구",
+                f"저장되지 않은 초안이 있습니다{count}: '{title}'\n복구하시겠습니까?",
+                QMessageBox.Yes | QMessageBox.No,
+                QMessageBox.Yes
+            )
+            if reply != QMessageBox.Yes:
+                self.draft_journal.discard(memo_id)
+                continue
+            
+            if memo:
+                self.select_memo(memo)
+                if self.is_loading_content:
+                    # 초안을 덮어쓰기 전에 본문을 한 번에 채움
+                    self.display_memo(memo, stream=False)
+                self.edit_memo()
+            else:
+                self.create_new_memo()
+            self.apply_editor_fields(draft["fields"])
+            self.dirty_fields = set(draft["fields"])
+            remaining = len(ordered) - index - 1
+            if remaining:
+                # 나머지 초안은 버리지 않고 이 편집을 마친 뒤 다시 묻습니다
+                self.pending_draft_recovery = True
+                self.status_label.setText(
+                    f"초안을 복구했습니다. 저장 버튼을 눌러 반영하세요. (남은 초안 {remaining}개)")
+            else:
+                self.status_label.setText("초안을 복구했습니다. 저장 버튼을 눌러 반영하세요.")
+            return
+        
+        self.draft_journal.compact()
+    
+    def resume_draft_recovery(self):
+        """복구한 초안의 편집이 끝나면 남은 초안 복구를 이어서 확인"""
+        if self.pending_draft_recovery:
+            self.pending_draft_recovery = False
+            QTimer.singleShot(0, self.offer_draft_recovery)
+    
+    def paintEvent(self, event):
+        """첫 화면 그리기 시점을 시작 시간 측정기에 기록"""
+        super().paintEvent(event)
+        if not self.first_painted:
+            self.first_painted = True
+            # 이번 그리기가 화면에 반영된 뒤 기록되도록 이벤트 루프로 미룹니다
+            QTimer.singleShot(0, self.report_startup_time)
+    
+    def report_startup_time(self):
+        """시작 시간 측정 결과 보고"""
+        probe.mark("first_paint")
+        probe.report()
+        if PROBE_ARG in sys.argv:
+            QApplication.instance().quit()
+    
+    def closeEvent(self, event):
+        """종료 시 미저장 변경 사항 저장"""
+        self.autosave_draft()
+        self.maintenance_timer.stop()
+        self.storage_worker.wait()
+        QThreadPool.globalInstance().waitForDone()
+        self.workspaces.close_all()
+        super().closeEvent(event)
     
     def load_memos(self):
         """메모 목록 로드"""
-        self.memo_list.clear()
         memos = self.memo_model.get_all_memos()
+        self.populate_memo_list(memos)
         
+        # 콤보박스 업데이트
+        self.update_combo_boxes()
+        self.refresh_saved_searches()
+        self.refresh_dashboard()
+        
+        self.status_label.setText(f"총 {len(memos)}개의 메모")
+    
+    def refresh_dashboard(self, *args):
+        """대시보드 탭이 보이는 중이면 통계 새로고침"""
+        if self.main_tabs.currentWidget() is self.dashboard:
+            self.dashboard.reload()
+    
+    def populate_memo_list(self, memos):
+        """메모 리스트 위젯 채우기 (렌더링 캐시 사용)"""
+        self.memo_list.clear()
         for memo in memos:
-            item_widget = MemoItemWidget(memo)
+            render_data = self.render_cache.get(memo)
+            item_widget = MemoItemWidget(memo, render_data)
             item_widget.memo_selected.connect(self.select_memo)
             
+            if render_data["size_hint"] is None:
+                render_data["size_hint"] = item_widget.sizeHint()
+            
             list_item = QListWidgetItem()
-            list_item.setSizeHint(item_widget.sizeHint())
+            list_item.setSizeHint(render_data["size_hint"])
             
             self.memo_list.addItem(list_item)
             self.memo_list.setItemWidget(list_item, item_widget)
-        
-        # 콤보박스 업데이트
-        self.update_combo_boxes()
-        
-        self.status_label.setText(f"총 {len(memos)}개의 메모")
+    
+    def refresh_saved_searches(self):
+        """저장된 검색 목록과 결과 수 갱신"""
+        current = self.saved_search_list.currentItem()
+        current_name = current.data(Qt.UserRole) if current else None
+        
+        self.saved_search_list.clear()
+        for search in self.saved_searches.searches:
+            name = search["name"]
+            item = QListWidgetItem(f"{name} ({self.saved_searches.get_count(name)})")
+            item.setData(Qt.UserRole, name)
+            self.saved_search_list.addItem(item)
+            if name == current_name:
+                self.saved_search_list.setCurrentItem(item)
+        self.remove_search_btn.setEnabled(self.saved_search_list.currentItem() is not None)
+    
+    def current_search_criteria(self) -> Dict[str, Any]:
+        """컨트롤 패널의 현재 검색 조건"""
+        criteria = {"query": self.search_input.text().strip()}
+        for field, combo in (("category", self.category_combo),
+                             ("property_type", self.property_combo),
+                             ("priority", self.priority_combo)):
+            value = combo.currentText()
+            criteria[field] = "" if value == "전체" else value
+        
+        date_range = self.date_combo.currentData()
+        if date_range == "custom":
+            criteria["date_from"] = self.date_from_edit.date().toString(Qt.ISODate)
+            criteria["date_to"] = self.date_to_edit.date().toString(Qt.ISODate)
+        elif date_range:
+            criteria["date_range"] = date_range
+        
+        region = self.current_region()
+        if region:
+            criteria["region"] = region
+        return criteria
+    
+    def save_current_search(self):
+        """현재 검색 조건을 저장된 검색으로 추가"""
+        name, ok = QInputDialog.getText(self, "검색 저장", "저장할 검색 이름:")
+        name = name.strip()
+        if not ok or not name:
+            return
+        if self.saved_searches.add_search(name, self.current_search_criteria()):
+            self.refresh_saved_searches()
+            self.status_label.setText(f"검색 '{name}'이(가) 저장되었습니다.")
+        else:
+            QMessageBox.critical(self, "오류", "검색 저장에 실패했습니다.")
+    
+    def remove_saved_search(self):
+        """선택한 저장된 검색 삭제"""
+        item = self.saved_search_list.currentItem()
+        if item is None:
+            return
+        name = item.data(Qt.UserRole)
+        self.saved_searches.remove_search(name)
+        self.refresh_saved_searches()
+        self.status_label.setText(f"검색 '{name}'이(가) 삭제되었습니다.")
+    
+    def on_saved_search_selected(self, item):
+        """저장된 검색 선택 - 보관된 결과 집합을 바로 표시"""
+        name = item.data(Qt.UserRole)
+        memos = self.saved_searches.get_results(name)
+        self.populate_memo_list(memos)
+        self.remove_search_btn.setEnabled(True)
+        self.status_label.setText(f"저장된 검색 '{name}': {len(memos)}개")
     
     def update_combo_boxes(self):
         """콤보박스 옵션 업데이트"""
@@ -524,6 +1712,46 @@ class MemoApp(QMainWindow):
         self.property_combo.addItems(self.memo_model.get_property_types())
         if current_property in [self.property_combo.itemText(i) for i in range(self.property_combo.count())]:
             self.property_combo.setCurrentText(current_property)
+        
+        # 지역 콤보박스 (메모 수 갱신)
+        self.update_region_combos()
+    
+    def current_region(self) -> List[str]:
+        """지역 콤보박스에서 선택된 지역 경로 (시/도부터, '전체' 앞까지)"""
+        region = []
+        for region_combo in self.region_combos:
+            name = region_combo.currentData()
+            if name is None:
+                break
+            region.append(name)
+        return region
+    
+    def update_region_combos(self, start_level: int = 0):
+        """지역 콤보박스를 지정한 단계부터 다시 채우고 단계별 메모 수를 표시"""
+        region = self.current_region()
+        for level in range(start_level, len(self.region_combos)):
+            region_combo = self.region_combos[level]
+            selected = region[level] if level < len(region) else None
+            
+            region_combo.blockSignals(True)
+            region_combo.clear()
+            region_combo.addItem("전체", None)
+            if level <= len(region):
+                for name, count in self.memo_model.get_region_counts(region[:level]):
+                    region_combo.addItem(f"{name or '기타'} ({count})", name)
+            index = region_combo.findData(selected)
+            region_combo.setCurrentIndex(index if selected is not None and index >= 0 else 0)
+            region_combo.setEnabled(region_combo.count() > 1)
+            region_combo.blockSignals(False)
+            
+            # 선택이 사라지면 그 아래 단계도 '전체'로 돌아갑니다
+            if region_combo.currentData() is None:
+                region = region[:level]
+    
+    def on_region_changed(self, level: int):
+        """지역 필터 변경 - 하위 단계 콤보박스를 다시 채우고 필터 적용"""
+        self.update_region_combos(level + 1)
+        self.filter_memos()
     
     def create_new_memo(self):
         """새 메모 생성"""
@@ -534,7 +1762,7 @@ class MemoApp(QMainWindow):
     
     def edit_memo(self):
         """메모 편집 모드"""
-        if self.current_memo_id:
+        if self.current_memo_id and not self.is_loading_content:
             self.set_edit_mode(True)
             self.status_label.setText("메모 편집 중...")
     
@@ -549,6 +1777,16 @@ class MemoApp(QMainWindow):
         self.property_input.setEnabled(edit_mode)
         self.location_input.setReadOnly(not edit_mode)
         self.priority_input.setEnabled(edit_mode)
+        self.coordinate_input.setReadOnly(not edit_mode)
+        
+        # 편집 시작 시점의 값을 기준으로 변경 필드 추적
+        self.edit_baseline = self.collect_editor_fields() if edit_mode else {}
+        self.dirty_fields = set()
+        self.content_input.document().setModified(False)
+        if edit_mode:
+            self.autosave_timer.start()
+        else:
+            self.autosave_timer.stop()
         
         # 버튼 표시/숨김
         self.edit_btn.setVisible(not edit_mode)
@@ -556,6 +1794,7 @@ class MemoApp(QMainWindow):
         self.cancel_btn.setVisible(edit_mode)
         self.new_memo_btn.setEnabled(not edit_mode)
         self.delete_btn.setEnabled(not edit_mode)
+        self.update_nearby_button()
     
     def save_memo(self):
         """메모 저장"""
@@ -570,34 +1809,60 @@ class MemoApp(QMainWindow):
             QMessageBox.warning(self, "경고", "내용을 입력해주세요.")
             return
         
-        memo_data = {
-            "title": title,
-            "content": content,
-            "category": self.category_input.currentText(),
-            "property_type": self.property_input.currentText(),
-            "location": self.location_input.text(),
-            "priority": self.priority_input.currentText()
-        }
+        try:
+            coordinates = parse_coordinates(self.coordinate_input.text())
+        except ValueError as e:
+            QMessageBox.warning(self, "경고", f"좌표 형식이 올바르지 않습니다.\n{e}")
+            return
+        
+        memo_data = self.collect_editor_fields()
         
         if self.current_memo_id:
-            # 기존 메모 업데이트
-            if self.memo_model.update_memo(self.current_memo_id, **memo_data):
+            # 기존 메모 업데이트 (변경된 필드만 전달)
+            changed_fields = {key: value for key, value in memo_data.items()
+                              if value != self.edit_baseline.get(key)}
+            if changed_fields.pop("coordinates", None) is not None:
+                changed_fields["latitude"], changed_fields["longitude"] = coordinates or (None, None)
+            if not changed_fields:
+                self.status_label.setText("변경 사항이 없습니다.")
+            elif self.memo_model.update_memo(self.current_memo_id, **changed_fields):
                 self.status_label.setText("메모가 저장되었습니다.")
             else:
                 QMessageBox.critical(self, "오류", "메모 저장에 실패했습니다.")
                 return
+            self.draft_journal.discard(self.current_memo_id)
         else:
+            # 이미 같은 매물을 입력한 메모가 있는지 확인
+            similar = self.memo_model.find_similar_memos(title, content, memo_data["location"])
+            if similar:
+                similar_memo, score = similar[0]
+                reply = QMessageBox.question(
+                    self, "중복 의심",
+                    f"비슷한 메모가 이미 있습니다.\n\n'{similar_memo['title']}' (유사도 {score:.0%})\n\n"
+                    "그래도 새 메모로 저장하시겠습니까?",
+                    QMessageBox.Yes | QMessageBox.No,
+                    QMessageBox.No
+                )
+                if reply != QMessageBox.Yes:
+                    self.status_label.setText("중복 의심 메모가 있어 저장하지 않았습니다.")
+                    return
+            
             # 새 메모 생성
+            del memo_data["coordinates"]
+            memo_data["latitude"], memo_data["longitude"] = coordinates or (None, None)
             memo = self.memo_model.create_memo(**memo_data)
             self.current_memo_id = memo["id"]
+            self.draft_journal.discard(None)
             self.status_label.setText("새 메모가 생성되었습니다.")
         
         self.set_edit_mode(False)
         self.load_memos()
         self.select_memo_by_id(self.current_memo_id)
+        self.resume_draft_recovery()
     
     def cancel_edit(self):
         """편집 취소"""
+        self.draft_journal.discard(self.current_memo_id)
         if self.current_memo_id:
             # 기존 메모 데이터로 복원
             memo = self.memo_model.get_memo(self.current_memo_id)
@@ -608,6 +1873,7 @@ class MemoApp(QMainWindow):
         
         self.set_edit_mode(False)
         self.status_label.setText("편집이 취소되었습니다.")
+        self.resume_draft_recovery()
     
     def delete_memo(self):
         """메모 삭제"""
@@ -616,25 +1882,100 @@ class MemoApp(QMainWindow):
         
         reply = QMessageBox.question(
             self, "메모 삭제", 
-            "정말로 이 메모를 삭제하시겠습니까?",
+            "이 메모를 휴지통으로 이동하시겠습니까?",
             QMessageBox.Yes | QMessageBox.No,
             QMessageBox.No
         )
         
         if reply == QMessageBox.Yes:
             if self.memo_model.delete_memo(self.current_memo_id):
-                self.status_label.setText("메모가 삭제되었습니다.")
+                self.status_label.setText("메모가 휴지통으로 이동되었습니다.")
                 self.clear_memo_detail()
                 self.load_memos()
             else:
                 QMessageBox.critical(self, "오류", "메모 삭제에 실패했습니다.")
     
+    def show_history(self):
+        """메모 변경 이력 보기"""
+        if not self.current_memo_id:
+            return
+        dialog = MemoHistoryDialog(self.memo_model, self.current_memo_id, self)
+        dialog.exec()
+    
+    def show_nearby(self):
+        """현재 메모 주변의 매물 보기"""
+        memo = self.memo_model.get_memo(self.current_memo_id) if self.current_memo_id else None
+        if memo is None or get_coordinates(memo) is None:
+            return
+        dialog = NearbyMemosDialog(self.memo_model, memo, self)
+        dialog.exec()
+        if dialog.selected_id is not None:
+            self.select_memo_by_id(dialog.selected_id)
+    
+    def update_nearby_button(self):
+        """좌표가 있는 메모를 보고 있을 때만 주변 매물 버튼 활성화"""
+        memo = self.memo_model.get_memo(self.current_memo_id) if self.current_memo_id else None
+        self.nearby_btn.setEnabled(not self.is_editing and memo is not None
+                                   and get_coordinates(memo) is not None)
+    
+    def sync_with_web(self):
+        """웹 앱 메모 파일과 증분 동기화"""
+        if self.is_editing:
+            QMessageBox.warning(self, "경고", "편집 중에는 동기화할 수 없습니다.")
+            return
+        
+        remote_path, _ = QFileDialog.getSaveFileName(
+            self, "웹 메모 파일 선택", "web_memos.json", "JSON 파일 (*.json)",
+            options=QFileDialog.DontConfirmOverwrite
+        )
+        if not remote_path:
+            return
+        
+        # 동기화는 드물게 쓰이므로 시작 시간을 줄이기 위해 필요할 때 임포트합니다
+        from memo_sync import SyncEngine, JsonFileRemote
+        
+        try:
+            engine = SyncEngine(self.memo_model, JsonFileRemote(remote_path))
+            stats = engine.sync()
+        except (OSError, ValueError, KeyError) as e:
+            QMessageBox.critical(self, "오류", f"동기화에 실패했습니다: {e}")
+            return
+        
+        self.load_memos()
+        self.status_label.setText(
+            f"동기화 완료: 가져옴 {stats['pulled']}개, 보냄 {stats['pushed']}개, "
+            f"삭제 {stats['deleted']}개, 충돌 {stats['conflicts']}개"
+        )
+    
+    def show_duplicates(self):
+        """전체 메모 중복 보고서 보기"""
+        dialog = DuplicateReportDialog(self.memo_model, self)
+        dialog.exec()
+        if dialog.selected_id is not None:
+            self.select_memo_by_id(dialog.selected_id)
+    
+    def show_activity(self):
+        """메모 활동 차트 보기"""
+        dialog = ActivityChartDialog(self.memo_model, self)
+        dialog.exec()
+    
+    def show_trash(self):
+        """휴지통 보기"""
+        dialog = TrashDialog(self.memo_model, self)
+        dialog.exec()
+        if dialog.restored_ids:
+            self.load_memos()
+            self.select_memo_by_id(dialog.restored_ids[-1])
+            self.status_label.setText(f"{len(dialog.restored_ids)}개의 메모가 복원되었습니다.")
+    
     def select_memo(self, memo_data: Dict[str, Any]):
         """메모 선택"""
         self.current_memo_id = memo_data["id"]
         self.display_memo(memo_data)
-        self.edit_btn.setEnabled(True)
+        self.edit_btn.setEnabled(not self.is_loading_content)
         self.delete_btn.setEnabled(True)
+        self.history_btn.setEnabled(True)
+        self.update_attachment_buttons()
         self.set_edit_mode(False)
     
     def select_memo_by_id(self, memo_id: int):
@@ -648,32 +1989,181 @@ class MemoApp(QMainWindow):
         # 이벤트는 MemoItemWidget에서 처리됨
         pass
     
-    def display_memo(self, memo_data: Dict[str, Any]):
+    def display_memo(self, memo_data: Dict[str, Any], stream: bool = True):
         """메모 상세 정보 표시"""
         self.title_input.setText(memo_data.get("title", ""))
-        self.content_input.setPlainText(memo_data.get("content", ""))
         self.category_input.setCurrentText(memo_data.get("category", ""))
         self.property_input.setCurrentText(memo_data.get("property_type", ""))
         self.location_input.setText(memo_data.get("location", ""))
         self.priority_input.setCurrentText(memo_data.get("priority", "보통"))
+        self.coordinate_input.setText(format_coordinates(memo_data))
+        self.show_attachments(memo_data)
+        
+        # 본문은 메모를 열 때 불러오며, 아주 긴 본문은 나누어 표시합니다
+        self.content_load_token += 1
+        if stream and self.memo_model.get_content_length(memo_data) > CONTENT_STREAMING_THRESHOLD:
+            self.stream_content(self.memo_model.get_content(memo_data["id"]))
+        else:
+            self.is_loading_content = False
+            self.content_input.document().setUndoRedoEnabled(True)
+            self.content_input.setPlainText(self.memo_model.get_content(memo_data["id"]))
+    
+    def stream_content(self, content: str):
+        """긴 본문을 여러 번에 나누어 상세 보기에 넣기"""
+        self.is_loading_content = True
+        self.content_input.clear()
+        self.content_input.document().setUndoRedoEnabled(False)
+        self.edit_btn.setEnabled(False)
+        self.status_label.setText("메모 내용을 불러오는 중...")
+        self.append_content_chunk(content, 0, self.content_load_token)
+    
+    def append_content_chunk(self, content: str, position: int, token: int):
+        """본문 조각 하나를 추가하고 다음 조각을 예약"""
+        if token != self.content_load_token:
+            # 다른 메모가 선택되어 불러오기가 취소됨
+            return
+        
+        cursor = QTextCursor(self.content_input.document())
+        cursor.movePosition(QTextCursor.End)
+        cursor.insertText(content[position:position + CONTENT_CHUNK_SIZE])
+        
+        position += CONTENT_CHUNK_SIZE
+        if position < len(content):
+            QTimer.singleShot(0, lambda: self.append_content_chunk(content, position, token))
+            return
+        
+        self.content_input.document().setUndoRedoEnabled(True)
+        self.content_input.moveCursor(QTextCursor.Start)
+        self.is_loading_content = False
+        self.edit_btn.setEnabled(self.current_memo_id is not None)
+        self.status_label.setText("메모 내용을 모두 불러왔습니다.")
     
     def clear_memo_detail(self):
         """메모 상세 정보 초기화"""
+        self.content_load_token += 1
+        self.is_loading_content = False
+        self.content_input.document().setUndoRedoEnabled(True)
         self.title_input.clear()
         self.content_input.clear()
         self.category_input.setCurrentText("")
         self.property_input.setCurrentText("")
         self.location_input.clear()
         self.priority_input.setCurrentText("보통")
+        self.coordinate_input.clear()
+        self.attachment_list.clear()
         self.current_memo_id = None
         self.edit_btn.setEnabled(False)
         self.delete_btn.setEnabled(False)
+        self.history_btn.setEnabled(False)
+        self.update_attachment_buttons()
+        self.update_nearby_button()
+    
+    def show_attachments(self, memo_data: Dict[str, Any]):
+        """첨부 파일 목록 표시 (썸네일은 캐시에 없으면 백그라운드에서 생성)"""
+        self.attachment_list.clear()
+        file_icon = self.style().standardIcon(QStyle.SP_FileIcon)
+        for ref in memo_data.get("attachments", []):
+            item = QListWidgetItem(file_icon, ref["name"])
+            item.setData(Qt.UserRole, ref)
+            item.setToolTip(f"{ref['name']} ({max(1, ref.get('size', 0) // 1024):,} KB)")
+            self.attachment_list.addItem(item)
+            self.load_thumbnail(ref["hash"])
+        self.update_attachment_buttons()
+    
+    def load_thumbnail(self, file_hash: str):
+        """캐시된 썸네일을 표시하거나 썸네일 작업을 스레드 풀에 넣기"""
+        path = self.thumbnails.get(file_hash)
+        if path:
+            self.set_attachment_icon(file_hash, path)
+            return
+        if file_hash in self.pending_thumbnails:
+            return
+        self.pending_thumbnails.add(file_hash)
+        QThreadPool.globalInstance().start(ThumbnailTask(
+            self.memo_model.get_attachment_path(file_hash), file_hash,
+            self.thumbnails, self.thumbnail_signals
+        ))
+    
+    def on_thumbnail_ready(self, file_hash: str, path: str):
+        """썸네일 작업 완료 이벤트"""
+        self.pending_thumbnails.discard(file_hash)
+        if path:
+            self.set_attachment_icon(file_hash, path)
+    
+    def set_attachment_icon(self, file_hash: str, path: str):
+        """해당 첨부 파일 항목에 썸네일 설정"""
+        for row in range(self.attachment_list.count()):
+            item = self.attachment_list.item(row)
+            if item.data(Qt.UserRole)["hash"] == file_hash:
+                item.setIcon(QIcon(path))
+    
+    def update_attachment_buttons(self):
+        """첨부 버튼 활성화 상태 갱신"""
+        has_memo = self.current_memo_id is not None
+        self.add_attachment_btn.setEnabled(has_memo)
+        self.remove_attachment_btn.setEnabled(has_memo and bool(self.attachment_list.selectedItems()))
+    
+    def add_attachments(self):
+        """선택한 파일을 현재 메모에 첨부"""
+        if self.current_memo_id is None:
+            return
+        file_paths, _ = QFileDialog.getOpenFileNames(
+            self, "첨부할 파일 선택", "",
+            "이미지 (*.png *.jpg *.jpeg *.gif *.bmp *.webp);;모든 파일 (*)"
+        )
+        if not file_paths:
+            return
+        
+        added = [path for path in file_paths
+                 if self.memo_model.add_attachment(self.current_memo_id, path) is not None]
+        memo = self.memo_model.get_memo(self.current_memo_id)
+        if memo:
+            self.show_attachments(memo)
+        if len(added) < len(file_paths):
+            QMessageBox.warning(self, "경고", f"{len(file_paths) - len(added)}개의 파일을 첨부하지 못했습니다.")
+        self.status_label.setText(f"{len(added)}개의 파일을 첨부했습니다.")
+    
+    def remove_attachment(self):
+        """선택한 첨부 파일을 현재 메모에서 제거"""
+        items = self.attachment_list.selectedItems()
+        if self.current_memo_id is None or not items:
+            return
+        ref = items[0].data(Qt.UserRole)
+        reply = QMessageBox.question(
+            self, "첨부 제거 확인",
+            f"'{ref['name']}' 첨부 파일을 메모에서 제거하시겠습니까?",
+            QMessageBox.Yes | QMessageBox.No,
+            QMessageBox.No
+        )
+        if reply != QMessageBox.Yes:
+            return
+        if self.memo_model.remove_attachment(self.current_memo_id, ref["hash"]):
+            self.show_attachments(self.memo_model.get_memo(self.current_memo_id))
+            self.status_label.setText("첨부 파일이 제거되었습니다.")
+    
+    def open_attachment(self, item):
+        """첨부 파일을 원래 이름으로 임시 폴더에 복사해 기본 프로그램으로 열기"""
+        ref = item.data(Qt.UserRole)
+        target_dir = os.path.join(tempfile.gettempdir(), "memo_attachments", ref["hash"][:12])
+        try:
+            path = self.memo_model.attachments.export(ref, target_dir)
+        except OSError as e:
+            QMessageBox.warning(self, "경고", f"첨부 파일을 열 수 없습니다: {e}")
+            return
+        QDesktopServices.openUrl(QUrl.fromLocalFile(path))
     
     def search_memos(self):
         """메모 검색"""
         query = self.search_input.text()
         self.filter_memos()
     
+    def on_date_range_changed(self):
+        """기간 필터 변경 - 직접 지정일 때만 날짜 입력 표시"""
+        is_custom = self.date_combo.currentData() == "custom"
+        self.date_from_edit.setVisible(is_custom)
+        self.date_to_edit.setVisible(is_custom)
+        self.filter_memos()
+    
     def filter_memos(self):
         """메모 필터링"""
         query = self.search_input.text()
@@ -683,13 +2173,30 @@ class MemoApp(QMainWindow):
         
         # 검색 실행
         if query.strip():
-            memos = self.memo_model.search_memos(query)
+            memos = self.memo_model.search_memos(
+                query, include_archived=self.archived_search_check.isChecked())
         else:
             memos = self.memo_model.get_all_memos()
         
+        # 기간 필터는 작성 시각 인덱스로 먼저 후보를 구함
+        date_ids = None
+        date_from, date_to = resolve_date_range(self.current_search_criteria())
+        if date_from or date_to:
+            start = datetime.fromisoformat(date_from) if date_from else None
+            end = datetime.fromisoformat(date_to) + timedelta(days=1) if date_to else None
+            date_ids = self.memo_model.get_memo_ids_in_range(start, end)
+        
+        # 지역 필터는 지역 인덱스에서 바로 ID 집합을 구함
+        region = self.current_region()
+        region_ids = self.memo_model.get_memo_ids_in_region(region) if region else None
+        
         # 필터 적용
         filtered_memos = []
         for memo in memos:
+            if date_ids is not None and memo["id"] not in date_ids:
+                continue
+            if region_ids is not None and memo["id"] not in region_ids:
+                continue
             if category != "전체" and memo.get("category") != category:
                 continue
             if property_type != "전체" and memo.get("property_type") != property_type:
@@ -699,22 +2206,19 @@ class MemoApp(QMainWindow):
             filtered_memos.append(memo)
         
         # 리스트 업데이트
-        self.memo_list.clear()
-        for memo in filtered_memos:
-            item_widget = MemoItemWidget(memo)
-            item_widget.memo_selected.connect(self.select_memo)
-            
-            list_item = QListWidgetItem()
-            list_item.setSizeHint(item_widget.sizeHint())
-            
-            self.memo_list.addItem(list_item)
-            self.memo_list.setItemWidget(list_item, item_widget)
+        self.populate_memo_list(filtered_memos)
         
         self.status_label.setText(f"검색 결과: {len(filtered_memos)}개")
 
 
 def main():
     """메인 함수"""
+    # 서명 계산용 프로세스 풀이 패키징된 실행 파일에서도 동작하도록 합니다
+    # (multiprocessing은 임포트 비용이 커서 패키징된 실행 파일에서만 불러옵니다)
+    if getattr(sys, "frozen", False):
+        import multiprocessing
+        multiprocessing.freeze_support()
+    
     app = QApplication(sys.argv)
     
     # 애플리케이션 정보 설정
@@ -726,6 +2230,13 @@ def main():
     window = MemoApp()
     window.show()
     
+    # 빠른 시작 빌드의 스플래시 화면은 메인 윈도우가 뜨면 닫습니다
+    try:
+        import pyi_splash
+        pyi_splash.close()
+    except ImportError:
+        pass
+    
     # 이벤트 루프 시작
     sys.exit(app.exec())
 
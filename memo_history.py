@@ -0,0 +1,270 @@
+"""
+메모 변경 이력 관리 모듈
+메모 내용의 버전을 정/역방향 델타와 주기적인 키프레임으로 저장합니다.
+"""
+from difflib import SequenceMatcher
+from typing import List, Optional, Dict, Any
+import json
+import os
+import threading
+
+
+# 키프레임 간격 (이 간격마다 전체 내용을 저장합니다)
+KEYFRAME_INTERVAL = 10
+
+
+# 문자 단위로 비교할 변경 구간의 최대 크기 (두 구간 길이의 곱)
+CHAR_DIFF_LIMIT = 4_000_000
+
+
+def _common_prefix_length(source: str, target: str) -> int:
+    """두 문자열의 공통 접두사 길이를 이진 탐색으로 구합니다."""
+    low, high = 0, min(len(source), len(target))
+    while low < high:
+        middle = (low + high + 1) // 2
+        if source[:middle] == target[:middle]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def _common_suffix_length(source: str, target: str, limit: int) -> int:
+    """두 문자열의 공통 접미사 길이를 limit 이하로 구합니다."""
+    low, high = 0, limit
+    while low < high:
+        middle = (low + high + 1) // 2
+        if source[len(source) - middle:] == target[len(target) - middle:]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def _line_delta(source: str, target: str, base: int) -> List[List[Any]]:
+    """줄 단위로 비교한 델타를 계산합니다 (긴 변경 구간용)."""
+    source_lines = source.splitlines(keepends=True)
+    target_lines = target.splitlines(keepends=True)
+    source_offsets = [0]
+    for line in source_lines:
+        source_offsets.append(source_offsets[-1] + len(line))
+    target_offsets = [0]
+    for line in target_lines:
+        target_offsets.append(target_offsets[-1] + len(line))
+    
+    matcher = SequenceMatcher(None, source_lines, target_lines, autojunk=False)
+    delta = []
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag != "equal":
+            delta.append([base + source_offsets[i1], base + source_offsets[i2],
+                          target[target_offsets[j1]:target_offsets[j2]]])
+    return delta
+
+
+def compute_delta(source: str, target: str) -> List[List[Any]]:
+    """
+    source를 target으로 바꾸는 델타를 계산합니다.
+    
+    공통 접두사/접미사를 먼저 잘라내고, 남은 변경 구간이 짧으면 문자 단위로,
+    길면 줄 단위로 비교합니다.
+    
+    Args:
+        source (str): 원본 텍스트
+        target (str): 대상 텍스트
+        
+    Returns:
+        List[List[Any]]: [시작, 끝, 대체 텍스트] 형식의 편집 목록
+    """
+    if source == target:
+        return []
+    
+    prefix = _common_prefix_length(source, target)
+    suffix = _common_suffix_length(source, target,
+                                   min(len(source), len(target)) - prefix)
+    source_middle = source[prefix:len(source) - suffix]
+    target_middle = target[prefix:len(target) - suffix]
+    
+    if not source_middle or not target_middle:
+        return [[prefix, len(source) - suffix, target_middle]]
+    if len(source_middle) * len(target_middle) > CHAR_DIFF_LIMIT:
+        return _line_delta(source_middle, target_middle, prefix)
+    
+    matcher = SequenceMatcher(None, source_middle, target_middle, autojunk=False)
+    delta = []
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag != "equal":
+            delta.append([prefix + i1, prefix + i2, target_middle[j1:j2]])
+    return delta
+
+
+def apply_delta(source: str, delta: List[List[Any]]) -> str:
+    """
+    텍스트에 델타를 적용합니다.
+    
+    Args:
+        source (str): 원본 텍스트
+        delta (List[List[Any]]): compute_delta로 계산된 편집 목록
+        
+    Returns:
+        str: 델타가 적용된 텍스트
+    """
+    parts = []
+    position = 0
+    for start, end, text in delta:
+        parts.append(source[position:start])
+        parts.append(text)
+        position = end
+    parts.append(source[position:])
+    return "".join(parts)
+
+
+class MemoHistory:
+    """메모별 내용 변경 이력을 관리하는 클래스"""
+    
+    def __init__(self, file_path: str):
+        """
+        변경 이력 초기화
+        
+        Args:
+            file_path (str): 이력을 저장할 JSON Lines 파일 경로
+        """
+        self.file_path = file_path
+        self.versions: Dict[int, List[Dict[str, Any]]] = {}
+        # 정리 작업(백그라운드 스레드)의 파일 재작성과 UI 스레드의 기록이 겹치지 않도록 합니다
+        self._lock = threading.RLock()
+        self.load_history()
+    
+    def load_history(self) -> None:
+        """JSON Lines 파일에서 변경 이력을 로드합니다."""
+        self.versions = {}
+        if not os.path.exists(self.file_path):
+            return
+        try:
+            with open(self.file_path, 'r', encoding='utf-8') as file:
+                for line in file:
+                    if not line.strip():
+                        continue
+                    entry = json.loads(line)
+                    self.versions.setdefault(entry["memo_id"], []).append(entry)
+        except (json.JSONDecodeError, KeyError) as e:
+            print(f"변경 이력 로드 중 오류 발생: {e}")
+    
+    def _append(self, entry: Dict[str, Any]) -> None:
+        """이력 항목을 파일 끝에 추가합니다."""
+        try:
+            with open(self.file_path, 'a', encoding='utf-8') as file:
+                file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        except OSError as e:
+            print(f"변경 이력 저장 중 오류 발생: {e}")
+        self.versions.setdefault(entry["memo_id"], []).append(entry)
+    
+    def record(self, memo_id: int, content: str, timestamp: str,
+               previous: Optional[str] = None) -> None:
+        """
+        새 버전을 기록합니다.
+        
+        Args:
+            memo_id (int): 메모 ID
+            content (str): 새 버전의 내용
+            timestamp (str): 버전 생성 시각 (ISO 형식)
+            previous (Optional[str]): 직전 버전의 내용 (이력이 없을 때 기준 버전으로 사용)
+        """
+        with self._lock:
+            versions = self.versions.get(memo_id, [])
+            if not versions and previous is not None and previous != content:
+                # 이력 기능 도입 이전의 메모는 직전 내용을 첫 키프레임으로 남깁니다
+                self._append({"memo_id": memo_id, "version": 0, "timestamp": None,
+                              "kind": "key", "data": previous})
+                versions = self.versions[memo_id]
+            
+            version = len(versions)
+            if version > 0:
+                if previous is None:
+                    previous = self.get_version(memo_id, version - 1)
+                if previous == content:
+                    return
+            
+            entry = {"memo_id": memo_id, "version": version, "timestamp": timestamp}
+            if version % KEYFRAME_INTERVAL == 0:
+                entry.update({"kind": "key", "data": content})
+            else:
+                entry.update({"kind": "delta", "forward": compute_delta(previous, content)})
+            if version > 0:
+                entry["reverse"] = compute_delta(content, previous)
+            self._append(entry)
+    
+    def get_versions(self, memo_id: int) -> List[Dict[str, Any]]:
+        """
+        메모의 버전 목록을 가져옵니다.
+        
+        Args:
+            memo_id (int): 메모 ID
+            
+        Returns:
+            List[Dict[str, Any]]: 버전 번호와 시각 목록
+        """
+        with self._lock:
+            return [{"version": entry["version"], "timestamp": entry["timestamp"]}
+                    for entry in self.versions.get(memo_id, [])]
+    
+    def get_version(self, memo_id: int, version: int) -> Optional[str]:
+        """
+        특정 버전의 내용을 복원합니다.
+        
+        가장 가까운 키프레임에서 시작해 정방향 또는 역방향 델타를 적용하므로
+        최대 KEYFRAME_INTERVAL / 2 개의 델타만 적용됩니다.
+        
+        Args:
+            memo_id (int): 메모 ID
+            version (int): 버전 번호
+            
+        Returns:
+            Optional[str]: 해당 버전의 내용 또는 None
+        """
+        with self._lock:
+            versions = list(self.versions.get(memo_id, []))
+        if not 0 <= version < len(versions):
+            return None
+        
+        previous_key = version - version % KEYFRAME_INTERVAL
+        next_key = previous_key + KEYFRAME_INTERVAL
+        if next_key < len(versions) and next_key - version < version - previous_key:
+            # 다음 키프레임에서 역방향 델타로 되돌아갑니다
+            content = versions[next_key]["data"]
+            for index in range(next_key, version, -1):
+                content = apply_delta(content, versions[index]["reverse"])
+            return content
+        
+        content = versions[previous_key]["data"]
+        for index in range(previous_key + 1, version + 1):
+            content = apply_delta(content, versions[index]["forward"])
+        return content
+    
+    def remove(self, memo_id: int) -> None:
+        """
+        메모의 이력을 삭제하고 파일을 다시 씁니다.
+        
+        Args:
+            memo_id (int): 메모 ID
+        """
+        self.remove_many([memo_id])
+    
+    def remove_many(self, memo_ids: List[int]) -> None:
+        """
+        여러 메모의 이력을 한꺼번에 삭제하고 파일을 한 번만 다시 씁니다.
+        
+        Args:
+            memo_ids (List[int]): 메모 ID 리스트
+        """
+        with self._lock:
+            removed = [memo_id for memo_id in memo_ids
+                       if self.versions.pop(memo_id, None) is not None]
+            if not removed:
+                return
+            try:
+                with open(self.file_path, 'w', encoding='utf-8') as file:
+                    for entries in self.versions.values():
+                        for entry in entries:
+                            file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            except OSError as e:
+                print(f"변경 이력 저장 중 오류 발생: {e}")
@@ -2,10 +2,42 @@
 메모 데이터 모델 클래스
 공인중개사용 메모의 데이터 구조를 정의합니다.
 """
-from datetime import datetime
-from typing import List, Optional, Dict, Any
+from datetime import date, datetime, timedelta
+from typing import List, Optional, Dict, Any, Callable, Set, Tuple, Sequence
 import json
 import os
+import threading
+
+from archive_store import ArchiveStore, ARCHIVE_BLOCK_SIZE
+from attachment_store import AttachmentStore
+from content_store import ContentStore
+from dedup import (DuplicateIndex, simhash, signature_text, compute_signatures, find_duplicate_groups,
+                   SIGNATURE_VERSION)
+from index_snapshot import IndexSnapshot, memo_checksum, store_checksum
+from location_index import LocationIndex
+from memo_history import MemoHistory
+from spatial_index import SpatialIndex
+from timestamp_index import TimestampIndex
+
+
+# 메모 변경 리스너 타입: (이벤트, 메모, 변경 전 메모) -> None
+ChangeListener = Callable[[str, Dict[str, Any], Optional[Dict[str, Any]]], None]
+
+# 이 길이를 넘는 본문은 메타데이터와 분리해 본문 저장소에 보관합니다
+INLINE_CONTENT_LIMIT = 2000
+
+# 본문을 분리한 메모에 함께 보관하는 미리보기 길이
+CONTENT_PREVIEW_LENGTH = 100
+
+# 이 기간 동안 수정되지 않은 메모는 압축 보관소로 옮깁니다 (일)
+ARCHIVE_AFTER_DAYS = 90
+
+# 이전에 만든 메모에는 없을 수 있어 update_memo()로 새로 추가할 수 있는 필드
+OPTIONAL_FIELDS = ("attachments", "latitude", "longitude")
+
+# 스냅샷으로 저장하는 파생 인덱스 속성 이름
+INDEX_NAMES = ("created_index", "updated_index", "location_index", "duplicate_index",
+               "spatial_index")
 
 
 class MemoModel:
@@ -20,8 +52,42 @@ class MemoModel:
         """
         self.file_path = file_path
         self.memos: List[Dict[str, Any]] = []
+        self._memo_index: Dict[int, Dict[str, Any]] = {}
+        self._last_id = 0
+        self.generation = 0
+        self._dirty = False
+        self._lock = threading.RLock()
+        self._listeners: List[ChangeListener] = []
+        self.history = MemoHistory(self.get_sidecar_path("_history.jsonl"))
+        self.content_store = ContentStore(self.get_sidecar_path("_content.dat"))
+        self.archive = ArchiveStore(self.get_sidecar_path("_archive.dat"),
+                                    self.get_sidecar_path("_archive.json"))
+        self._archive_dirty = False
+        self.attachments = AttachmentStore(self.get_sidecar_path("_attachments"))
+        self._attachments_removed = False
+        self.created_index = TimestampIndex("created_at")
+        self.updated_index = TimestampIndex("updated_at")
+        self.location_index = LocationIndex()
+        self.duplicate_index = DuplicateIndex()
+        self.spatial_index = SpatialIndex()
+        self.add_change_listener(self._update_indexes)
+        self.index_snapshot = IndexSnapshot(self.get_sidecar_path("_index.dat"))
+        self._snapshot_generation: Optional[int] = None
+        self._index_rebuild: Optional[threading.Thread] = None
         self.load_memos()
     
+    def get_sidecar_path(self, suffix: str) -> str:
+        """
+        메모 파일과 함께 저장되는 부가 파일의 경로를 만듭니다.
+        
+        Args:
+            suffix (str): 파일 이름 뒤에 붙일 접미사 (예: "_history.jsonl")
+            
+        Returns:
+            str: 부가 파일 경로
+        """
+        return os.path.splitext(self.file_path)[0] + suffix
+    
     def load_memos(self) -> None:
         """JSON 파일에서 메모 데이터를 로드합니다."""
         try:
@@ -33,20 +99,420 @@ class MemoModel:
         except (json.JSONDecodeError, FileNotFoundError) as e:
             print(f"메모 로드 중 오류 발생: {e}")
             self.memos = []
+        
+        # 보관된 메모는 메타데이터만 올립니다. 보관 후 다시 수정된 메모는 메모 파일 쪽이 최신입니다
+        hot_ids = {memo["id"] for memo in self.memos}
+        archived = self.archive.load()
+        self.memos.extend(memo for memo in archived if memo["id"] not in hot_ids)
+        self._archive_dirty = len(self.memos) - len(hot_ids) != len(archived)
+        
+        self._memo_index = {memo["id"]: memo for memo in self.memos}
+        meta = self._load_meta()
+        # 영구 삭제된 메모의 ID를 다시 쓰지 않도록 저장해 둔 마지막 ID와 비교합니다
+        self._last_id = max(meta["last_id"], max(self._memo_index, default=0))
+        self.generation = max([meta["generation"]] +
+                              [memo.get("seq", 0) for memo in self.memos])
+        
+        # seq가 없는 이전 형식 메모는 수정 순서대로 순번을 매겨 첫 동기화 때 함께 내보내지게 합니다
+        for memo in sorted((memo for memo in self.memos if "seq" not in memo),
+                           key=lambda memo: memo.get("updated_at", "")):
+            self.generation += 1
+            memo["seq"] = self.generation
+            self._dirty = True
+            if self._is_archived(memo):
+                self._archive_dirty = True
+        
+        # 이전 형식으로 저장된 긴 본문은 본문 저장소로 옮깁니다
+        for memo in self.memos:
+            if len(memo.get("content", "")) > INLINE_CONTENT_LIMIT:
+                self._set_content(memo, memo["content"])
+                self._dirty = True
+        
+        # 중복 탐지 서명이 없거나 서명 방식이 바뀐 뒤 처음 여는 저장소는 한 번에 계산해 둡니다
+        # (개수가 많으면 compute_signatures가 프로세스 풀에서 나누어 계산)
+        resign_all = meta["signature_version"] != SIGNATURE_VERSION
+        unsigned = {memo["id"]: memo for memo in self.memos
+                    if resign_all or "simhash" not in memo}
+        if unsigned:
+            signatures = compute_signatures({
+                memo_id: signature_text(memo, self._read_content(memo))
+                for memo_id, memo in unsigned.items()
+            })
+            for memo_id, signature in signatures.items():
+                unsigned[memo_id]["simhash"] = format(signature, '016x')
+            self._dirty = True
+            if any(self._is_archived(memo) for memo in unsigned.values()):
+                self._archive_dirty = True
+        
+        self._load_indexes()
+    
+    @staticmethod
+    def _create_indexes() -> Dict[str, Any]:
+        """비어 있는 파생 인덱스를 만듭니다."""
+        return {
+            "created_index": TimestampIndex("created_at"),
+            "updated_index": TimestampIndex("updated_at"),
+            "location_index": LocationIndex(),
+            "duplicate_index": DuplicateIndex(),
+            "spatial_index": SpatialIndex()
+        }
+    
+    def _set_indexes(self, indexes: Dict[str, Any]) -> None:
+        """파생 인덱스를 교체합니다."""
+        for name, index in indexes.items():
+            setattr(self, name, index)
+    
+    def _get_indexes(self) -> Dict[str, Any]:
+        """현재 파생 인덱스를 이름별로 가져옵니다."""
+        return {name: getattr(self, name) for name in INDEX_NAMES}
+    
+    def _update_indexes(self, event: str, memo: Dict[str, Any],
+                        previous: Optional[Dict[str, Any]] = None) -> None:
+        """
+        변경 이벤트를 현재 파생 인덱스에 전달합니다 (교체된 인덱스도 그대로 받도록).
+        백그라운드 재구축이 인덱스를 교체하는 동안에는 잠금으로 기다립니다.
+        """
+        with self._lock:
+            for index in self._get_indexes().values():
+                index.on_memo_changed(event, memo, previous)
+    
+    def _replay_indexes(self, memos: List[Dict[str, Any]],
+                        indexes: Optional[Dict[str, Any]] = None) -> None:
+        """스냅샷(또는 재구축 시작) 이후에 바뀐 메모만 인덱스에 반영합니다 (기본값: 현재 인덱스)."""
+        for index in (indexes or self._get_indexes()).values():
+            for memo in memos:
+                index.on_memo_changed("created" if self._is_active(memo) else "deleted", memo)
+    
+    def _load_indexes(self) -> None:
+        """
+        파생 인덱스를 준비합니다.
+        
+        스냅샷 이후 저장소 파일이 그대로면 스냅샷을 그대로 쓰고, 바뀌었으면 바뀐 메모만 반영합니다.
+        스냅샷 이전 메모의 체크섬이 맞지 않으면(파일을 직접 고친 경우 등) 우선 스냅샷으로
+        띄운 뒤 백그라운드에서 새로 만들어 교체하고, 스냅샷이 없으면 바로 만듭니다.
+        """
+        self._index_rebuild = None
+        self._snapshot_generation = None
+        snapshot = self.index_snapshot.load(self.generation)
+        indexes = self._restore_indexes(snapshot["indexes"]) if snapshot else None
+        if indexes is None:
+            indexes = self._create_indexes()
+            active_memos = self.get_all_memos()
+            for index in indexes.values():
+                index.build(active_memos)
+            self._set_indexes(indexes)
+            return
+        
+        generation = snapshot["generation"]
+        self._set_indexes(indexes)
+        if generation == self.generation and \
+                snapshot.get("store_checksum") == store_checksum(self._get_store_paths()):
+            self._snapshot_generation = generation
+            return
+        
+        self._replay_indexes(self.changes_since(generation))
+        if not self._verify_snapshot(snapshot.get("checksums", {}), generation):
+            self._index_rebuild = threading.Thread(target=self._rebuild_indexes, daemon=True)
+            self._index_rebuild.start()
+    
+    def _restore_indexes(self, states: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        스냅샷의 인덱스 상태로 새 파생 인덱스를 만듭니다.
+        
+        Returns:
+            Optional[Dict[str, Any]]: 인덱스 이름별 인덱스 또는 None (상태가 없거나 형식이 잘못된 경우)
+        """
+        if set(states) != set(INDEX_NAMES):
+            return None
+        indexes = self._create_indexes()
+        try:
+            for name, index in indexes.items():
+                index.set_state(states[name])
+        except (ValueError, TypeError, KeyError, OverflowError) as e:
+            print(f"인덱스 스냅샷 복원 중 오류 발생: {e}")
+            return None
+        return indexes
+    
+    def _get_store_paths(self) -> List[str]:
+        """인덱싱되는 메모 메타데이터가 저장된 파일 경로를 가져옵니다."""
+        return [self.file_path, self.archive.index_path]
+    
+    def _verify_snapshot(self, checksums: Dict[int, int], generation: int) -> bool:
+        """
+        스냅샷 이후 바뀌지 않은 메모가 스냅샷 시점과 같은지 메모별 체크섬으로 확인합니다.
+        스냅샷 이후 영구 삭제된 메모는 인덱스에서 뺍니다.
+        
+        Returns:
+            bool: 유효 여부 (메모 파일을 직접 고쳤거나 다른 파일로 바뀐 경우 False)
+        """
+        unchanged = 0
+        for memo in self.get_all_memos():
+            if memo.get("seq", 0) <= generation:
+                if checksums.get(memo["id"]) != memo_checksum(memo):
+                    return False
+                unchanged += 1
+        
+        # 스냅샷에 있던 메모는 그대로거나, 이후에 바뀌었거나(seq 증가), 영구 삭제되었어야 합니다
+        purged = checksums.keys() - self._memo_index.keys()
+        changed = sum(1 for memo_id in checksums.keys() - purged
+                      if self._memo_index[memo_id].get("seq", 0) > generation)
+        if unchanged + changed + len(purged) != len(checksums):
+            return False
+        for memo_id in purged:
+            for index in self._get_indexes().values():
+                index.remove(memo_id)
+        return True
+    
+    def _rebuild_indexes(self) -> None:
+        """백그라운드에서 파생 인덱스를 새로 만들어 교체합니다."""
+        with self._lock:
+            generation = self.generation
+            active_memos = self.get_all_memos()
+        indexes = self._create_indexes()
+        for index in indexes.values():
+            index.build(active_memos)
+        
+        with self._lock:
+            # 그 사이에 메모를 다시 로드했으면 버립니다
+            if self._index_rebuild is not threading.current_thread():
+                return
+            # 만드는 동안 바뀐 메모를 새 인덱스에 먼저 반영하고 영구 삭제된 메모는 뺀 뒤 교체합니다.
+            # 변경 이벤트도 잠금 안에서 전달되므로 교체 전후로 빠지는 변경이 없습니다
+            self._replay_indexes(self.changes_since(generation), indexes)
+            for memo in active_memos:
+                if memo["id"] not in self._memo_index:
+                    for index in indexes.values():
+                        index.on_memo_changed("purged", memo)
+            self._set_indexes(indexes)
+    
+    def save_index_snapshot(self) -> bool:
+        """
+        미저장 변경 사항을 저장한 뒤 파생 인덱스를 스냅샷 파일에 저장합니다.
+        다음 실행 때 인덱스를 다시 만들지 않고 불러옵니다.
+        
+        Returns:
+            bool: 저장 여부 (이미 최신이거나 백그라운드에서 다시 만드는 중이면 False)
+        """
+        if self._index_rebuild is not None and self._index_rebuild.is_alive():
+            return False
+        with self._lock:
+            if not self.flush() or self._snapshot_generation == self.generation:
+                return False
+            generation = self.generation
+            checksums = {memo["id"]: memo_checksum(memo) for memo in self.get_all_memos()}
+            states = {name: index.get_state() for name, index in self._get_indexes().items()}
+            saved = self.index_snapshot.save(generation, store_checksum(self._get_store_paths()),
+                                             checksums, states)
+        if saved:
+            self._snapshot_generation = generation
+        return saved
     
     def save_memos(self) -> bool:
         """메모 데이터를 JSON 파일에 저장합니다."""
+        temp_path = self.file_path + ".tmp"
         try:
-            with open(self.file_path, 'w', encoding='utf-8') as file:
-                json.dump(self.memos, file, ensure_ascii=False, indent=2)
+            with self._lock:
+                # 압축 보관된 메모는 메모 파일에 다시 쓰지 않습니다
+                with open(temp_path, 'w', encoding='utf-8') as file:
+                    json.dump([memo for memo in self.memos if not self._is_archived(memo)],
+                              file, ensure_ascii=False, indent=2)
+                os.replace(temp_path, self.file_path)
+                if self._archive_dirty:
+                    self._save_archive_index()
+                with open(self.get_sidecar_path("_meta.json"), 'w', encoding='utf-8') as file:
+                    json.dump({"generation": self.generation, "last_id": self._last_id,
+                               "signature_version": SIGNATURE_VERSION}, file)
+                self._dirty = False
+                # 저장소 파일이 바뀌었으므로 다음 종료 때 스냅샷도 다시 저장합니다
+                self._snapshot_generation = None
             return True
         except Exception as e:
             print(f"메모 저장 중 오류 발생: {e}")
             return False
     
+    def _load_meta(self) -> Dict[str, int]:
+        """
+        메타 파일에서 저장소 세대 번호, 마지막으로 발급한 메모 ID, 서명 방식 버전을 읽습니다.
+        
+        Returns:
+            Dict[str, int]: {"generation", "last_id", "signature_version"}
+            (파일이 없거나 잘못되었으면 0, 서명 버전이 기록되기 전의 저장소는 첫 번째 서명 방식인 1)
+        """
+        try:
+            with open(self.get_sidecar_path("_meta.json"), 'r', encoding='utf-8') as file:
+                meta = json.load(file)
+            return {"generation": int(meta.get("generation", 0)),
+                    "last_id": int(meta.get("last_id", 0)),
+                    "signature_version": int(meta.get("signature_version", 1))}
+        except (OSError, ValueError, TypeError, AttributeError):
+            return {"generation": 0, "last_id": 0, "signature_version": 1}
+    
+    def _touch(self, memo: Dict[str, Any]) -> None:
+        """
+        저장소 세대 번호를 올리고 메모에 변경 순번(seq)으로 기록합니다.
+        
+        세대 번호는 영구 삭제 후에도 줄어들지 않으므로
+        changes_since()의 커서로 안전하게 쓸 수 있습니다.
+        """
+        self.generation += 1
+        memo["seq"] = self.generation
+        self._thaw(memo)
+    
+    def _is_archived(self, memo: Dict[str, Any]) -> bool:
+        """압축 보관소에 본문이 있는 메모인지 확인합니다."""
+        return "archive_block" in memo
+    
+    def _thaw(self, memo: Dict[str, Any]) -> None:
+        """
+        보관된 메모를 다시 메모 파일에서 관리하도록 되돌립니다 (수정될 때).
+        
+        새 본문이 이미 설정되었으면 그대로 두고, 아니면 보관소의 본문을 가져옵니다.
+        """
+        if not self._is_archived(memo):
+            return
+        block = memo.pop("archive_block")
+        if "content" not in memo and "content_ref" not in memo:
+            self._set_content(memo, self.archive.read(block, memo["id"]))
+        self._archive_dirty = True
+    
+    def _save_archive_index(self) -> None:
+        """보관된 메모의 메타데이터와 블록 색인을 저장합니다."""
+        if self.archive.save([memo for memo in self.memos if self._is_archived(memo)]):
+            self._archive_dirty = False
+    
+    def flush(self) -> bool:
+        """
+        아직 저장되지 않은 변경 사항(휴지통 이동 등)을 저장합니다.
+        
+        Returns:
+            bool: 저장 성공 여부 (저장할 내용이 없으면 True)
+        """
+        if not self._dirty:
+            return True
+        return self.save_memos()
+    
+    def add_change_listener(self, listener: ChangeListener) -> None:
+        """
+        메모 변경 이벤트 리스너를 등록합니다.
+        
+        리스너는 (이벤트, 메모, 변경 전 메모)를 인자로 호출됩니다.
+        이벤트는 "created", "updated", "deleted", "restored", "purged" 중 하나이며,
+        변경 전 메모는 "updated" 이벤트에서만 전달됩니다.
+        "purged" 이벤트는 백그라운드 정리 스레드에서 호출될 수 있습니다.
+        
+        Args:
+            listener (ChangeListener): 변경 이벤트를 받을 함수
+        """
+        self._listeners.append(listener)
+    
+    def remove_change_listener(self, listener: ChangeListener) -> None:
+        """
+        메모 변경 이벤트 리스너를 해제합니다.
+        
+        Args:
+            listener (ChangeListener): 등록했던 함수
+        """
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+    
+    def _notify(self, event: str, memo: Dict[str, Any],
+                previous: Optional[Dict[str, Any]] = None) -> None:
+        """등록된 리스너에게 변경 이벤트를 전달합니다."""
+        for listener in list(self._listeners):
+            try:
+                listener(event, memo, previous)
+            except Exception as e:
+                print(f"메모 변경 이벤트 처리 중 오류 발생: {e}")
+    
+    def _set_content(self, memo: Dict[str, Any], content: str) -> None:
+        """
+        메모 본문을 저장합니다. 긴 본문은 본문 저장소에 두고 참조만 남깁니다.
+        
+        Args:
+            memo (Dict[str, Any]): 대상 메모
+            content (str): 저장할 본문
+        """
+        with self._lock:
+            if len(content) > INLINE_CONTENT_LIMIT:
+                memo.pop("content", None)
+                memo["content_ref"] = self.content_store.write(content)
+                memo["content_length"] = len(content)
+                memo["content_preview"] = content[:CONTENT_PREVIEW_LENGTH]
+            else:
+                memo["content"] = content
+                for key in ("content_ref", "content_length", "content_preview"):
+                    memo.pop(key, None)
+    
+    def _update_signature(self, memo: Dict[str, Any], content: str) -> None:
+        """제목, 본문, 위치로 메모의 중복 탐지 서명을 다시 계산합니다."""
+        memo["simhash"] = format(simhash(signature_text(memo, content)), '016x')
+    
+    def _read_content(self, memo: Dict[str, Any]) -> str:
+        """메모 본문을 읽습니다. 분리되거나 보관된 본문은 저장소에서 불러옵니다."""
+        if "content" in memo:
+            return memo["content"]
+        with self._lock:
+            if self._is_archived(memo):
+                return self.archive.read(memo["archive_block"], memo["id"])
+            if "content_ref" in memo:
+                return self.content_store.read(memo["content_ref"])
+            return ""
+    
+    def get_content(self, memo_id: int) -> str:
+        """
+        메모 본문을 가져옵니다. 긴 본문은 이때 저장소에서 불러옵니다.
+        
+        Args:
+            memo_id (int): 메모 ID
+            
+        Returns:
+            str: 메모 본문 (메모가 없으면 빈 문자열)
+        """
+        memo = self._memo_index.get(memo_id)
+        if memo is None:
+            return ""
+        return self._read_content(memo)
+    
+    def get_searchable_content(self, memo_id: int) -> str:
+        """
+        검색에 쓸 메모 본문을 가져옵니다. 압축 보관된 메모는 압축을 풀지 않고 빈 문자열을 돌려주므로
+        제목, 카테고리, 유형, 위치로만 찾게 됩니다 (search_memos의 기본 동작과 같음).
+        
+        Args:
+            memo_id (int): 메모 ID
+            
+        Returns:
+            str: 메모 본문 (보관된 메모이거나 메모가 없으면 빈 문자열)
+        """
+        memo = self._memo_index.get(memo_id)
+        if memo is None or self._is_archived(memo):
+            return ""
+        return self._read_content(memo)
+    
+    def get_content_length(self, memo: Dict[str, Any]) -> int:
+        """
+        본문을 불러오지 않고 메모 본문의 길이를 가져옵니다.
+        
+        Args:
+            memo (Dict[str, Any]): 메모 데이터
+            
+        Returns:
+            int: 본문 글자 수
+        """
+        if "content" not in memo:
+            return memo.get("content_length", 0)
+        return len(memo["content"])
+    
+    def _is_active(self, memo: Dict[str, Any]) -> bool:
+        """휴지통에 있지 않은 메모인지 확인합니다."""
+        return not memo.get("deleted_at")
+    
     def create_memo(self, title: str, content: str, category: str = "", 
                    priority: str = "보통", property_type: str = "", 
-                   location: str = "") -> Dict[str, Any]:
+                   location: str = "",
+                   attachments: Optional[List[Dict[str, Any]]] = None,
+                   latitude: Optional[float] = None,
+                   longitude: Optional[float] = None) -> Dict[str, Any]:
         """
         새 메모를 생성합니다.
         
@@ -57,23 +523,36 @@ class MemoModel:
             priority (str): 우선순위
             property_type (str): 부동산 유형
             location (str): 위치
+            attachments (Optional[List[Dict[str, Any]]]): add_attachment_file()로 만든 첨부 참조
+            latitude (Optional[float]): 위도 (없으면 None)
+            longitude (Optional[float]): 경도 (없으면 None)
             
         Returns:
             Dict[str, Any]: 생성된 메모 데이터
         """
-        memo = {
-            "id": len(self.memos) + 1,
-            "title": title,
-            "content": content,
-            "category": category,
-            "priority": priority,
-            "property_type": property_type,
-            "location": location,
-            "created_at": datetime.now().isoformat(),
-            "updated_at": datetime.now().isoformat()
-        }
-        self.memos.append(memo)
+        with self._lock:
+            self._last_id += 1
+            memo = {
+                "id": self._last_id,
+                "title": title,
+                "category": category,
+                "priority": priority,
+                "property_type": property_type,
+                "location": location,
+                "attachments": list(attachments or []),
+                "latitude": latitude,
+                "longitude": longitude,
+                "created_at": datetime.now().isoformat(),
+                "updated_at": datetime.now().isoformat()
+            }
+            self._set_content(memo, content)
+            self._update_signature(memo, content)
+            self._touch(memo)
+            self.memos.append(memo)
+            self._memo_index[memo["id"]] = memo
         self.save_memos()
+        self.history.record(memo["id"], content, memo["created_at"])
+        self._notify("created", memo)
         return memo
     
     def update_memo(self, memo_id: int, **kwargs) -> bool:
@@ -87,19 +566,41 @@ class MemoModel:
         Returns:
             bool: 업데이트 성공 여부
         """
-        for memo in self.memos:
-            if memo["id"] == memo_id:
-                for key, value in kwargs.items():
-                    if key in memo:
-                        memo[key] = value
-                memo["updated_at"] = datetime.now().isoformat()
-                self.save_memos()
-                return True
-        return False
+        memo = self.get_memo(memo_id)
+        if memo is None:
+            return False
+        
+        previous = memo.copy()
+        content = kwargs.pop("content", None)
+        previous_content = self._read_content(memo) if content is not None else None
+        with self._lock:
+            for key, value in kwargs.items():
+                if key in memo or key in OPTIONAL_FIELDS:
+                    memo[key] = value
+            if len(memo.get("attachments", [])) < len(previous.get("attachments", [])):
+                self._attachments_removed = True
+            if content is not None and content != previous_content:
+                self._set_content(memo, content)
+            if any(memo.get(key) != previous.get(key) for key in ("title", "location")) or \
+                    (content is not None and content != previous_content):
+                self._update_signature(memo, content if content is not None else
+                                       self._read_content(memo))
+            memo["updated_at"] = datetime.now().isoformat()
+            self._touch(memo)
+        self.save_memos()
+        if content is not None and content != previous_content:
+            self.history.record(memo_id, content, memo["updated_at"],
+                                previous=previous_content)
+        self._notify("updated", memo, previous)
+        return True
     
     def delete_memo(self, memo_id: int) -> bool:
         """
-        메모를 삭제합니다.
+        메모를 휴지통으로 이동합니다.
+        
+        메모에는 삭제 표시(deleted_at)만 남기고 즉시 모든 조회에서 제외합니다.
+        파일 저장은 flush() 또는 다음 저장 시점으로 미뤄지며,
+        실제 삭제는 compact()가 수행합니다.
         
         Args:
             memo_id (int): 삭제할 메모 ID
@@ -107,12 +608,227 @@ class MemoModel:
         Returns:
             bool: 삭제 성공 여부
         """
-        for i, memo in enumerate(self.memos):
-            if memo["id"] == memo_id:
-                del self.memos[i]
+        memo = self.get_memo(memo_id)
+        if memo is None:
+            return False
+        
+        with self._lock:
+            memo["deleted_at"] = datetime.now().isoformat()
+            self._touch(memo)
+            self._dirty = True
+        self._notify("deleted", memo)
+        return True
+    
+    def restore_memo(self, memo_id: int) -> bool:
+        """
+        휴지통의 메모를 복원합니다.
+        
+        Args:
+            memo_id (int): 복원할 메모 ID
+            
+        Returns:
+            bool: 복원 성공 여부
+        """
+        memo = self._memo_index.get(memo_id)
+        if memo is None or self._is_active(memo):
+            return False
+        
+        with self._lock:
+            del memo["deleted_at"]
+            self._touch(memo)
+        self.save_memos()
+        self._notify("restored", memo)
+        return True
+    
+    def compact(self, retention_days: int = 30, notify: bool = True) -> List[Dict[str, Any]]:
+        """
+        보관 기간이 지난 휴지통 메모를 영구 삭제하고 파일을 다시 씁니다.
+        본문 저장소에 쌓인 이전 본문도 함께 정리합니다.
+        
+        리스너(인덱스, 캐시 등)는 스레드 안전하지 않으므로 백그라운드 스레드에서 호출할 때는
+        notify=False로 호출하고, 돌려받은 메모로 GUI 스레드에서 notify_purged()를 호출합니다.
+        
+        Args:
+            retention_days (int): 휴지통 보관 기간 (일)
+            notify (bool): 영구 삭제 이벤트를 바로 전달할지 여부
+            
+        Returns:
+            List[Dict[str, Any]]: 영구 삭제된 메모 리스트
+        """
+        cutoff = (datetime.now() - timedelta(days=retention_days)).isoformat()
+        with self._lock:
+            expired = [memo for memo in self.memos
+                       if not self._is_active(memo) and memo["deleted_at"] <= cutoff]
+            for memo in expired:
+                del self._memo_index[memo["id"]]
+            if expired:
+                self.memos = list(self._memo_index.values())
+            # 본문 참조가 바뀌면 바로 메타데이터를 저장해야 하므로 잠금 안에서 저장합니다
+            if self._compact_content_store() or expired:
                 self.save_memos()
-                return True
-        return False
+            self._compact_archive()
+        
+        self.history.remove_many([memo["id"] for memo in expired])
+        if notify:
+            self.notify_purged(expired)
+        
+        if expired or self._attachments_removed:
+            self._attachments_removed = False
+            with self._lock:
+                live_hashes = {ref["hash"] for memo in self.memos
+                               for ref in memo.get("attachments", [])}
+            self.attachments.collect_garbage(live_hashes)
+        return expired
+    
+    def notify_purged(self, memos: List[Dict[str, Any]]) -> None:
+        """
+        compact()로 영구 삭제된 메모의 이벤트를 리스너에게 전달합니다.
+        
+        Args:
+            memos (List[Dict[str, Any]]): 영구 삭제된 메모 리스트
+        """
+        for memo in memos:
+            self._notify("purged", memo)
+    
+    def _compact_content_store(self, threshold: float = 0.5) -> bool:
+        """본문 저장소의 사용되지 않는 영역이 임계값을 넘으면 파일을 다시 씁니다."""
+        live_refs = {memo["id"]: memo["content_ref"]
+                     for memo in self.memos if "content_ref" in memo}
+        if self.content_store.garbage_ratio(list(live_refs.values())) < threshold:
+            return False
+        try:
+            new_refs = self.content_store.rewrite(live_refs)
+        except OSError as e:
+            print(f"본문 저장소 정리 중 오류 발생: {e}")
+            return False
+        for memo_id, ref in new_refs.items():
+            self._memo_index[memo_id]["content_ref"] = ref
+        return True
+    
+    def archive_cold_memos(self, days: int = ARCHIVE_AFTER_DAYS) -> int:
+        """
+        오랫동안 수정되지 않은 메모의 본문을 압축 보관소로 옮깁니다.
+        
+        메타데이터(제목, 위치, 시각 등)는 메모리에 남아 인덱스와 목록에서 그대로 쓰이고,
+        본문은 메모를 열 때만 블록 단위로 압축을 풉니다.
+        
+        Args:
+            days (int): 이 기간(일) 동안 수정되지 않은 메모를 보관
+            
+        Returns:
+            int: 보관된 메모 수
+        """
+        cutoff = (datetime.now() - timedelta(days=days)).isoformat()
+        with self._lock:
+            cold = sorted((memo for memo in self.memos
+                           if self._is_active(memo) and not self._is_archived(memo)
+                           and memo.get("updated_at", "") <= cutoff),
+                          key=lambda memo: memo.get("updated_at", ""))
+            if not cold:
+                return 0
+            
+            try:
+                for start in range(0, len(cold), ARCHIVE_BLOCK_SIZE):
+                    chunk = cold[start:start + ARCHIVE_BLOCK_SIZE]
+                    contents = {memo["id"]: self._read_content(memo) for memo in chunk}
+                    block = self.archive.write_block(contents)
+                    for memo in chunk:
+                        content = contents[memo["id"]]
+                        memo.pop("content", None)
+                        memo.pop("content_ref", None)
+                        memo["content_length"] = len(content)
+                        memo["content_preview"] = content[:CONTENT_PREVIEW_LENGTH]
+                        memo["archive_block"] = block
+            except OSError as e:
+                print(f"메모 보관 중 오류 발생: {e}")
+                return 0
+            
+            # 보관소 색인을 먼저 저장해야 중간에 중단되어도 메모가 사라지지 않습니다
+            self._save_archive_index()
+            self.save_memos()
+        return len(cold)
+    
+    def _compact_archive(self, threshold: float = 0.5) -> bool:
+        """보관소에서 다시 수정된 메모가 차지하는 비율이 임계값을 넘으면 블록을 다시 만듭니다."""
+        live_blocks = {memo["id"]: memo["archive_block"]
+                       for memo in self.memos if self._is_archived(memo)}
+        if self.archive.garbage_ratio(live_blocks) < threshold:
+            return False
+        try:
+            new_blocks = self.archive.rewrite(live_blocks)
+        except OSError as e:
+            print(f"보관소 정리 중 오류 발생: {e}")
+            return False
+        for memo_id, block in new_blocks.items():
+            self._memo_index[memo_id]["archive_block"] = block
+        self._save_archive_index()
+        return True
+    
+    def changes_since(self, cursor: int) -> List[Dict[str, Any]]:
+        """
+        커서 이후에 바뀐 메모를 변경 순으로 가져옵니다 (휴지통의 메모 포함).
+        
+        Args:
+            cursor (int): 이전에 받은 세대 번호 (처음이면 0)
+            
+        Returns:
+            List[Dict[str, Any]]: seq가 cursor보다 큰 메모 리스트
+        """
+        changed = [memo for memo in self.memos if memo.get("seq", 0) > cursor]
+        return sorted(changed, key=lambda memo: memo.get("seq", 0))
+    
+    def merge_memo(self, fields: Dict[str, Any], memo_id: Optional[int] = None) -> Dict[str, Any]:
+        """
+        외부(동기화 등)에서 받은 메모를 작성/수정 시각을 유지한 채 반영합니다.
+        
+        Args:
+            fields (Dict[str, Any]): 메모 필드 (content, created_at, updated_at 포함 가능)
+            memo_id (Optional[int]): 갱신할 메모 ID (None이거나 없는 ID면 새로 생성)
+            
+        Returns:
+            Dict[str, Any]: 반영된 메모 데이터
+        """
+        fields = dict(fields)
+        content = fields.pop("content", None)
+        now = datetime.now().isoformat()
+        memo = self._memo_index.get(memo_id) if memo_id is not None else None
+        
+        if memo is None:
+            with self._lock:
+                self._last_id += 1
+                memo = {"id": self._last_id, "title": "", "category": "", "priority": "보통",
+                        "property_type": "", "location": "",
+                        "created_at": now, "updated_at": now}
+                memo.update(fields)
+                self._set_content(memo, content or "")
+                self._update_signature(memo, content or "")
+                self._touch(memo)
+                self.memos.append(memo)
+                self._memo_index[memo["id"]] = memo
+            self.save_memos()
+            self.history.record(memo["id"], content or "", memo["updated_at"])
+            self._notify("created", memo)
+            return memo
+        
+        was_deleted = not self._is_active(memo)
+        previous = memo.copy()
+        previous_content = self._read_content(memo)
+        with self._lock:
+            memo.update(fields)
+            memo.pop("deleted_at", None)
+            if content is not None and content != previous_content:
+                self._set_content(memo, content)
+            self._update_signature(memo, content if content is not None else previous_content)
+            self._touch(memo)
+        self.save_memos()
+        if content is not None and content != previous_content:
+            self.history.record(memo["id"], content, memo["updated_at"],
+                                previous=previous_content)
+        if was_deleted:
+            self._notify("restored", memo)
+        else:
+            self._notify("updated", memo, previous)
+        return memo
     
     def get_memo(self, memo_id: int) -> Optional[Dict[str, Any]]:
         """
@@ -122,28 +838,137 @@ class MemoModel:
             memo_id (int): 가져올 메모 ID
             
         Returns:
-            Optional[Dict[str, Any]]: 메모 데이터 또는 None
+            Optional[Dict[str, Any]]: 메모 데이터 또는 None (휴지통의 메모는 None)
         """
-        for memo in self.memos:
-            if memo["id"] == memo_id:
-                return memo
-        return None
+        memo = self._memo_index.get(memo_id)
+        if memo is None or not self._is_active(memo):
+            return None
+        return memo
+    
+    def add_attachment_file(self, source_path: str) -> Optional[Dict[str, Any]]:
+        """
+        파일을 첨부 파일 저장소에 보관하고 메모에 넣을 참조를 만듭니다.
+        
+        Args:
+            source_path (str): 첨부할 파일 경로
+            
+        Returns:
+            Optional[Dict[str, Any]]: 첨부 참조 {"hash", "name", "size"} 또는 None (실패한 경우)
+        """
+        try:
+            return self.attachments.add(source_path)
+        except OSError as e:
+            print(f"첨부 파일 저장 중 오류 발생: {e}")
+            return None
+    
+    def add_attachment(self, memo_id: int, source_path: str) -> Optional[Dict[str, Any]]:
+        """
+        메모에 파일을 첨부합니다. 메모에는 참조만 저장됩니다.
+        
+        Args:
+            memo_id (int): 메모 ID
+            source_path (str): 첨부할 파일 경로
+            
+        Returns:
+            Optional[Dict[str, Any]]: 첨부 참조 또는 None (실패한 경우)
+        """
+        memo = self.get_memo(memo_id)
+        if memo is None:
+            return None
+        ref = self.add_attachment_file(source_path)
+        if ref is None:
+            return None
+        attachments = memo.get("attachments", [])
+        if all(existing["hash"] != ref["hash"] for existing in attachments):
+            self.update_memo(memo_id, attachments=attachments + [ref])
+        return ref
+    
+    def remove_attachment(self, memo_id: int, file_hash: str) -> bool:
+        """
+        메모에서 첨부 파일을 뺍니다. 파일은 다른 메모가 참조하지 않으면 정리 때 지워집니다.
+        
+        Args:
+            memo_id (int): 메모 ID
+            file_hash (str): 첨부 파일 해시
+            
+        Returns:
+            bool: 제거 여부
+        """
+        memo = self.get_memo(memo_id)
+        if memo is None:
+            return False
+        attachments = memo.get("attachments", [])
+        remaining = [ref for ref in attachments if ref["hash"] != file_hash]
+        if len(remaining) == len(attachments):
+            return False
+        return self.update_memo(memo_id, attachments=remaining)
+    
+    def get_attachment_path(self, file_hash: str) -> str:
+        """
+        첨부 파일이 보관된 경로를 가져옵니다.
+        
+        Args:
+            file_hash (str): 첨부 파일 해시
+            
+        Returns:
+            str: 보관 파일 경로
+        """
+        return self.attachments.get_path(file_hash)
+    
+    def get_memo_history(self, memo_id: int) -> List[Dict[str, Any]]:
+        """
+        메모의 내용 변경 이력을 가져옵니다.
+        
+        Args:
+            memo_id (int): 메모 ID
+            
+        Returns:
+            List[Dict[str, Any]]: 버전 번호와 시각 목록 (오래된 순)
+        """
+        return self.history.get_versions(memo_id)
+    
+    def get_memo_version(self, memo_id: int, version: int) -> Optional[str]:
+        """
+        메모의 특정 버전 내용을 가져옵니다.
+        
+        Args:
+            memo_id (int): 메모 ID
+            version (int): 버전 번호
+            
+        Returns:
+            Optional[str]: 해당 버전의 내용 또는 None
+        """
+        return self.history.get_version(memo_id, version)
     
     def get_all_memos(self) -> List[Dict[str, Any]]:
         """
         모든 메모를 가져옵니다.
         
         Returns:
-            List[Dict[str, Any]]: 모든 메모 리스트
+            List[Dict[str, Any]]: 모든 메모 리스트 (휴지통 제외)
+        """
+        return [memo for memo in self.memos if self._is_active(memo)]
+    
+    def get_deleted_memos(self) -> List[Dict[str, Any]]:
+        """
+        휴지통의 메모를 가져옵니다.
+        
+        Returns:
+            List[Dict[str, Any]]: 삭제된 메모 리스트 (최근 삭제 순)
         """
-        return self.memos.copy()
+        deleted = [memo for memo in self.memos if not self._is_active(memo)]
+        return sorted(deleted, key=lambda memo: memo["deleted_at"], reverse=True)
     
-    def search_memos(self, query: str) -> List[Dict[str, Any]]:
+    def search_memos(self, query: str, include_archived: bool = False) -> List[Dict[str, Any]]:
         """
         메모를 검색합니다.
         
+        압축 보관된 메모는 제목, 카테고리, 유형, 위치로만 찾고, include_archived가 참일 때만
+        본문까지 찾습니다. 이때도 블록마다 한 번씩만 압축을 풉니다.
+        
         Args:
             query (str): 검색 쿼리
+            include_archived (bool): 보관된 메모의 본문도 검색할지 여부
             
         Returns:
             List[Dict[str, Any]]: 검색된 메모 리스트
@@ -152,22 +977,177 @@ class MemoModel:
             return self.get_all_memos()
         
         query_lower = query.lower()
-        results = []
+        memos = self.get_all_memos()
+        matched_ids: Set[int] = set()
+        archived_blocks: Dict[int, List[Dict[str, Any]]] = {}
         
-        for memo in self.memos:
+        for memo in memos:
             if (query_lower in memo["title"].lower() or 
-                query_lower in memo["content"].lower() or
                 query_lower in memo["category"].lower() or
                 query_lower in memo["property_type"].lower() or
                 query_lower in memo["location"].lower()):
-                results.append(memo)
+                matched_ids.add(memo["id"])
+            elif self._is_archived(memo):
+                if include_archived:
+                    archived_blocks.setdefault(memo["archive_block"], []).append(memo)
+            elif query_lower in self._read_content(memo).lower():
+                matched_ids.add(memo["id"])
+        
+        with self._lock:
+            for block, block_memos in archived_blocks.items():
+                contents = self.archive.read_block(block)
+                matched_ids.update(memo["id"] for memo in block_memos
+                                   if query_lower in contents.get(memo["id"], "").lower())
+        
+        return [memo for memo in memos if memo["id"] in matched_ids]
+    
+    def _get_time_index(self, field: str) -> TimestampIndex:
+        """필드 이름에 해당하는 시각 인덱스를 가져옵니다."""
+        return self.updated_index if field == "updated_at" else self.created_index
+    
+    def get_memo_ids_in_range(self, start: Optional[datetime] = None,
+                              end: Optional[datetime] = None,
+                              field: str = "created_at") -> Set[int]:
+        """
+        기간 [start, end)에 작성(또는 수정)된 메모 ID를 가져옵니다.
         
-        return results
+        Args:
+            start (Optional[datetime]): 시작 시각 (None이면 제한 없음)
+            end (Optional[datetime]): 종료 시각, 포함하지 않음 (None이면 제한 없음)
+            field (str): 기준 필드 ("created_at" 또는 "updated_at")
+            
+        Returns:
+            Set[int]: 메모 ID 집합
+        """
+        return self._get_time_index(field).range_ids(
+            int(start.timestamp()) if start else None,
+            int(end.timestamp()) if end else None
+        )
+    
+    def get_activity_counts(self, start: date, end: date, bucket: str = "day",
+                            field: str = "created_at") -> List[Tuple[date, int]]:
+        """
+        일별 또는 주별 메모 수를 가져옵니다.
+        
+        Args:
+            start (date): 첫 구간의 시작일 (주별이면 해당 주의 월요일로 맞춤)
+            end (date): 마지막 구간에 포함될 날짜
+            bucket (str): 구간 단위 ("day" 또는 "week")
+            field (str): 기준 필드 ("created_at" 또는 "updated_at")
+            
+        Returns:
+            List[Tuple[date, int]]: (구간 시작일, 메모 수) 리스트
+        """
+        step = timedelta(days=7 if bucket == "week" else 1)
+        if bucket == "week":
+            start -= timedelta(days=start.weekday())
+        
+        starts = []
+        current = start
+        while current <= end:
+            starts.append(current)
+            current += step
+        boundaries = [int(datetime.combine(day, datetime.min.time()).timestamp())
+                      for day in starts + [current]]
+        counts = self._get_time_index(field).bucket_counts(boundaries)
+        return list(zip(starts, counts))
+    
+    def get_memo_ids_in_region(self, region: Sequence[str]) -> Set[int]:
+        """
+        지역 경로 아래에 있는 메모 ID를 가져옵니다.
+        "강남구"처럼 상위 단계 없이 입력된 메모도 같은 이름의 지역이 있는 모든 상위 지역에 포함합니다
+        (LocationIndex.get_ids 참고).
+        
+        Args:
+            region (Sequence[str]): 시/도부터의 지역 이름 (예: ("서울특별시", "강남구"))
+            
+        Returns:
+            Set[int]: 메모 ID 집합
+        """
+        return self.location_index.get_ids(region, include_partial=True)
+    
+    def is_memo_in_region(self, memo_id: int, region: Sequence[str]) -> bool:
+        """
+        메모가 지역 경로 아래에 있는지 확인합니다 (get_memo_ids_in_region과 같은 기준).
+        
+        Args:
+            memo_id (int): 메모 ID
+            region (Sequence[str]): 시/도부터의 지역 이름
+            
+        Returns:
+            bool: 포함 여부
+        """
+        return self.location_index.contains(memo_id, region, include_partial=True)
+    
+    def get_region_counts(self, region: Sequence[str] = ()) -> List[Tuple[str, int]]:
+        """
+        지역 경로 바로 아래 단계의 지역별 메모 수를 가져옵니다 (get_memo_ids_in_region과 같은 기준).
+        
+        Args:
+            region (Sequence[str]): 시/도부터의 지역 이름 (빈 값이면 시/도별)
+            
+        Returns:
+            List[Tuple[str, int]]: (지역 이름, 메모 수) 리스트
+        """
+        return self.location_index.get_children(region, include_partial=True)
+    
+    def find_nearby_memos(self, latitude: float, longitude: float, radius_km: float,
+                          limit: int = 50,
+                          exclude_id: Optional[int] = None) -> List[Tuple[Dict[str, Any], float]]:
+        """
+        좌표에서 반경 안에 있는 가까운 메모를 찾습니다.
+        
+        Args:
+            latitude (float): 중심 위도
+            longitude (float): 중심 경도
+            radius_km (float): 반경 (km)
+            limit (int): 최대 결과 수
+            exclude_id (Optional[int]): 제외할 메모 ID (기준 메모)
+            
+        Returns:
+            List[Tuple[Dict[str, Any], float]]: (메모, 거리 km) 리스트 (가까운 순)
+        """
+        return [(self._memo_index[memo_id], distance)
+                for memo_id, distance in self.spatial_index.nearest(
+                    latitude, longitude, limit, radius_km, exclude_id=exclude_id)]
+    
+    def find_similar_memos(self, title: str, content: str, location: str = "",
+                           exclude_id: Optional[int] = None) -> List[Tuple[Dict[str, Any], float]]:
+        """
+        저장하려는 내용과 비슷한 기존 메모를 찾습니다.
+        
+        Args:
+            title (str): 제목
+            content (str): 본문
+            location (str): 위치
+            exclude_id (Optional[int]): 제외할 메모 ID (수정 중인 메모)
+            
+        Returns:
+            List[Tuple[Dict[str, Any], float]]: (메모, 유사도) 리스트 (유사도 높은 순)
+        """
+        signature = simhash(signature_text({"title": title, "location": location}, content))
+        return [(self._memo_index[memo_id], score)
+                for memo_id, score in self.duplicate_index.find_similar(signature, exclude_id=exclude_id)]
+    
+    def get_duplicate_report(self) -> List[List[Dict[str, Any]]]:
+        """
+        전체 메모에서 중복으로 보이는 메모 그룹을 찾습니다.
+        
+        메모를 저장할 때마다 갱신해 둔 서명("simhash")을 그대로 쓰므로
+        본문을 읽거나 보관된 블록의 압축을 풀지 않습니다.
+        
+        Returns:
+            List[List[Dict[str, Any]]]: 중복 그룹 리스트 (큰 그룹부터)
+        """
+        signatures = {memo["id"]: int(memo["simhash"], 16)
+                      for memo in self.get_all_memos() if memo.get("simhash")}
+        return [[self._memo_index[memo_id] for memo_id in group]
+                for group in find_duplicate_groups(signatures)]
     
     def get_categories(self) -> List[str]:
         """사용된 모든 카테고리를 가져옵니다."""
         categories = set()
-        for memo in self.memos:
+        for memo in self.get_all_memos():
             if memo["category"]:
                 categories.add(memo["category"])
         return sorted(list(categories))
@@ -175,7 +1155,7 @@ class MemoModel:
     def get_property_types(self) -> List[str]:
         """사용된 모든 부동산 유형을 가져옵니다."""
         property_types = set()
-        for memo in self.memos:
+        for memo in self.get_all_memos():
             if memo["property_type"]:
                 property_types.add(memo["property_type"])
         return sorted(list(property_types))
@@ -183,7 +1163,7 @@ class MemoModel:
     def get_locations(self) -> List[str]:
         """사용된 모든 위치를 가져옵니다."""
         locations = set()
-        for memo in self.memos:
+        for memo in self.get_all_memos():
             if memo["location"]:
                 locations.add(memo["location"])
         return sorted(list(locations))
@@ -0,0 +1,283 @@
+"""
+데스크톱 메모 저장소와 웹 앱(Next.js) 메모 형식 간 증분 동기화
+변경 순번 커서를 이용해 지난 동기화 이후 바뀐 메모만 주고받습니다.
+"""
+from datetime import datetime, timezone
+from typing import List, Optional, Dict, Any, Set, Tuple
+import json
+import os
+import sys
+
+from memo_model import MemoModel
+
+
+# 우선순위 변환 (데스크톱 → 웹)
+PRIORITY_TO_WEB = {"높음": "high", "보통": "medium", "낮음": "low"}
+
+# 우선순위 변환 (웹 → 데스크톱)
+PRIORITY_FROM_WEB = {value: key for key, value in PRIORITY_TO_WEB.items()}
+
+# 웹 형식과 데스크톱 형식에서 이름이 같은 선택 좌표 필드
+COORDINATE_FIELDS = ("latitude", "longitude")
+
+
+def _parse_time(value: str) -> datetime:
+    """ISO 시각을 시간대가 있는 datetime으로 변환합니다 (시간대가 없으면 로컬 시각)."""
+    try:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except (ValueError, AttributeError):
+        return datetime.min.replace(tzinfo=timezone.utc)
+    if parsed.tzinfo is None:
+        parsed = parsed.astimezone()
+    return parsed
+
+
+def to_web_time(value: str) -> str:
+    """데스크톱 로컬 ISO 시각을 웹 형식(UTC, 밀리초, Z)으로 변환합니다."""
+    utc = _parse_time(value).astimezone(timezone.utc)
+    return utc.isoformat(timespec='milliseconds').replace('+00:00', 'Z')
+
+
+def from_web_time(value: str) -> str:
+    """웹 형식 시각을 데스크톱 로컬 ISO 시각으로 변환합니다."""
+    return _parse_time(value).astimezone().replace(tzinfo=None).isoformat()
+
+
+def get_web_id(memo: Dict[str, Any]) -> str:
+    """데스크톱 메모에 대응하는 웹 메모 ID를 가져옵니다."""
+    return memo.get("web_id") or str(memo["id"])
+
+
+def local_change_time(memo: Dict[str, Any]) -> datetime:
+    """데스크톱 메모가 마지막으로 바뀐 시각 (휴지통 이동 포함)을 가져옵니다."""
+    return _parse_time(max(memo.get("updated_at", ""), memo.get("deleted_at") or ""))
+
+
+def to_web_memo(memo: Dict[str, Any], content: str) -> Dict[str, Any]:
+    """
+    데스크톱 메모를 웹 앱 형식(src/types/memo.ts의 Memo)으로 변환합니다.
+    
+    Args:
+        memo (Dict[str, Any]): 데스크톱 메모 데이터
+        content (str): 메모 본문
+        
+    Returns:
+        Dict[str, Any]: 웹 형식 메모
+    """
+    web_memo = {
+        "id": get_web_id(memo),
+        "title": memo.get("title", ""),
+        "content": content,
+        "category": memo.get("category", ""),
+        "propertyType": memo.get("property_type", ""),
+        "location": memo.get("location", ""),
+        "priority": PRIORITY_TO_WEB.get(memo.get("priority", "보통"), "medium"),
+        "createdAt": to_web_time(memo.get("created_at", "")),
+        "updatedAt": to_web_time(memo.get("updated_at", ""))
+    }
+    # 좌표는 입력된 메모에만 있습니다
+    for field in COORDINATE_FIELDS:
+        if memo.get(field) is not None:
+            web_memo[field] = memo[field]
+    return web_memo
+
+
+def from_web_memo(web_memo: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    웹 앱 형식 메모를 데스크톱 메모 필드로 변환합니다.
+    
+    Args:
+        web_memo (Dict[str, Any]): 웹 형식 메모
+        
+    Returns:
+        Dict[str, Any]: MemoModel.merge_memo에 전달할 필드
+    """
+    fields = {
+        "web_id": str(web_memo["id"]),
+        "title": web_memo.get("title", ""),
+        "content": web_memo.get("content", ""),
+        "category": web_memo.get("category", ""),
+        "property_type": web_memo.get("propertyType", ""),
+        "location": web_memo.get("location", ""),
+        "priority": PRIORITY_FROM_WEB.get(web_memo.get("priority", "medium"), "보통"),
+        "created_at": from_web_time(web_memo.get("createdAt", "")),
+        "updated_at": from_web_time(web_memo.get("updatedAt", ""))
+    }
+    # 좌표가 없는 웹 메모를 받아도 데스크톱에서 입력한 좌표는 지우지 않습니다
+    for field in COORDINATE_FIELDS:
+        if web_memo.get(field) is not None:
+            fields[field] = float(web_memo[field])
+    return fields
+
+
+class JsonFileRemote:
+    """웹 앱의 localStorage 데이터('memo-app-data')를 내보낸 JSON 파일 원격 저장소"""
+    
+    def __init__(self, file_path: str):
+        """
+        파일 원격 저장소 초기화
+        
+        Args:
+            file_path (str): 웹 형식 메모 배열이 담긴 JSON 파일 경로
+        """
+        self.file_path = file_path
+    
+    def _load(self) -> List[Dict[str, Any]]:
+        """원격 파일의 메모 배열을 읽습니다."""
+        if not os.path.exists(self.file_path):
+            return []
+        with open(self.file_path, 'r', encoding='utf-8') as file:
+            return json.load(file)
+    
+    def fetch_changes(self, since: str) -> Tuple[List[Dict[str, Any]], Set[str]]:
+        """
+        커서 이후에 바뀐 원격 메모와 현재 원격 메모 ID 전체를 가져옵니다.
+        
+        Args:
+            since (str): 이전 동기화의 원격 커서 (updatedAt, 처음이면 빈 문자열)
+            
+        Returns:
+            Tuple[List[Dict[str, Any]], Set[str]]: 바뀐 메모 리스트, 원격 ID 집합
+        """
+        memos = self._load()
+        since_time = _parse_time(since) if since else None
+        changed = [memo for memo in memos
+                   if since_time is None or _parse_time(memo.get("updatedAt", "")) > since_time]
+        return changed, {str(memo["id"]) for memo in memos}
+    
+    def apply_changes(self, upserts: List[Dict[str, Any]], deletions: List[str]) -> Set[str]:
+        """
+        원격 저장소에 변경 사항을 반영합니다.
+        
+        Args:
+            upserts (List[Dict[str, Any]]): 추가하거나 덮어쓸 웹 형식 메모
+            deletions (List[str]): 삭제할 웹 메모 ID
+            
+        Returns:
+            Set[str]: 반영 후 원격 메모 ID 집합
+        """
+        if not upserts and not deletions:
+            return {str(memo["id"]) for memo in self._load()}
+        
+        memos = {str(memo["id"]): memo for memo in self._load()}
+        for memo_id in deletions:
+            memos.pop(memo_id, None)
+        for memo in upserts:
+            memos[memo["id"]] = memo
+        
+        # 웹 앱과 같이 최신 메모가 앞에 오도록 정렬합니다
+        ordered = sorted(memos.values(), key=lambda memo: memo.get("createdAt", ""), reverse=True)
+        temp_path = self.file_path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            json.dump(ordered, file, ensure_ascii=False, indent=2)
+        os.replace(temp_path, self.file_path)
+        return set(memos)
+
+
+class SyncEngine:
+    """MemoModel과 웹 형식 원격 저장소 사이의 증분 동기화 엔진"""
+    
+    def __init__(self, memo_model: MemoModel, remote: JsonFileRemote,
+                 state_path: Optional[str] = None):
+        """
+        동기화 엔진 초기화
+        
+        Args:
+            memo_model (MemoModel): 로컬 메모 모델
+            remote (JsonFileRemote): 원격 저장소
+            state_path (Optional[str]): 동기화 커서를 저장할 파일 경로
+        """
+        self.memo_model = memo_model
+        self.remote = remote
+        self.state_path = state_path or memo_model.get_sidecar_path("_sync.json")
+        self.state = self.load_state()
+    
+    def load_state(self) -> Dict[str, Any]:
+        """동기화 상태(커서)를 로드합니다."""
+        state = {"local_cursor": 0, "remote_cursor": "", "remote_ids": []}
+        try:
+            if os.path.exists(self.state_path):
+                with open(self.state_path, 'r', encoding='utf-8') as file:
+                    state.update(json.load(file))
+        except (json.JSONDecodeError, OSError) as e:
+            print(f"동기화 상태 로드 중 오류 발생: {e}")
+        return state
+    
+    def save_state(self) -> None:
+        """동기화 상태(커서)를 저장합니다."""
+        try:
+            with open(self.state_path, 'w', encoding='utf-8') as file:
+                json.dump(self.state, file, ensure_ascii=False, indent=2)
+        except OSError as e:
+            print(f"동기화 상태 저장 중 오류 발생: {e}")
+    
+    def sync(self) -> Dict[str, int]:
+        """
+        양방향 증분 동기화를 실행합니다.
+        
+        양쪽에서 모두 바뀐 메모는 updated_at이 더 최근인 쪽을 따릅니다.
+        
+        Returns:
+            Dict[str, int]: pulled, pushed, deleted, conflicts 개수
+        """
+        stats = {"pulled": 0, "pushed": 0, "deleted": 0, "conflicts": 0}
+        local_changes = {get_web_id(memo): memo
+                         for memo in self.memo_model.changes_since(self.state["local_cursor"])}
+        remote_changes, remote_ids = self.remote.fetch_changes(self.state["remote_cursor"])
+        local_ids = {get_web_id(memo): memo["id"]
+                     for memo in self.memo_model.memos}
+        
+        # 원격 → 로컬
+        remote_cursor = self.state["remote_cursor"]
+        for web_memo in remote_changes:
+            web_id = str(web_memo["id"])
+            if not remote_cursor or _parse_time(web_memo["updatedAt"]) > _parse_time(remote_cursor):
+                remote_cursor = web_memo["updatedAt"]
+            local_memo = local_changes.get(web_id)
+            if local_memo is not None:
+                stats["conflicts"] += 1
+                if local_change_time(local_memo) >= _parse_time(web_memo["updatedAt"]):
+                    continue
+                del local_changes[web_id]
+            self.memo_model.merge_memo(from_web_memo(web_memo), local_ids.get(web_id))
+            stats["pulled"] += 1
+        
+        # 원격에서 사라진 메모는 로컬에서도 휴지통으로 이동
+        for web_id in set(self.state["remote_ids"]) - remote_ids:
+            if web_id in local_changes or web_id not in local_ids:
+                continue
+            if self.memo_model.delete_memo(local_ids[web_id]):
+                stats["deleted"] += 1
+        
+        # 로컬 → 원격
+        upserts = []
+        deletions = []
+        for web_id, memo in local_changes.items():
+            if memo.get("deleted_at"):
+                deletions.append(web_id)
+            else:
+                upserts.append(to_web_memo(memo, self.memo_model.get_content(memo["id"])))
+        remote_ids = self.remote.apply_changes(upserts, deletions)
+        stats["pushed"] = len(upserts) + len(deletions)
+        for web_memo in upserts:
+            if not remote_cursor or _parse_time(web_memo["updatedAt"]) > _parse_time(remote_cursor):
+                remote_cursor = web_memo["updatedAt"]
+        
+        # 이번 동기화에서 로컬에 반영한 변경은 다시 보내지 않도록 커서를 끝으로 옮깁니다
+        self.memo_model.flush()
+        self.state = {"local_cursor": self.memo_model.generation,
+                      "remote_cursor": remote_cursor,
+                      "remote_ids": sorted(remote_ids)}
+        self.save_state()
+        return stats
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("사용법: python memo_sync.py <웹 메모 JSON 파일> [메모 파일]")
+        sys.exit(1)
+    
+    model = MemoModel(sys.argv[2] if len(sys.argv) > 2 else "memos.json")
+    result = SyncEngine(model, JsonFileRemote(sys.argv[1])).sync()
+    print(f"가져옴 {result['pulled']}개, 보냄 {result['pushed']}개, "
+          f"삭제 {result['deleted']}개, 충돌 {result['conflicts']}개")
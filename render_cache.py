@@ -0,0 +1,126 @@
+"""
+메모 목록 렌더링 캐시
+메모 미리보기, 날짜 문자열, 태그 라벨, 크기 힌트를 LRU 방식으로 보관합니다.
+"""
+from collections import OrderedDict
+from datetime import datetime
+from typing import Optional, Dict, Any, Tuple
+
+
+# 미리보기로 표시할 내용 길이
+PREVIEW_LENGTH = 100
+
+
+def build_render_data(memo: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    메모 아이템 위젯에 표시할 데이터를 계산합니다.
+    
+    Args:
+        memo (Dict[str, Any]): 메모 데이터
+        
+    Returns:
+        Dict[str, Any]: 미리보기, 날짜, 태그 라벨, 크기 힌트를 담은 딕셔너리
+    """
+    content = memo.get("content")
+    if content is None:
+        # 본문이 분리 저장된 메모는 함께 보관된 미리보기를 사용합니다
+        content = memo.get("content_preview", "")
+        content_length = memo.get("content_length", len(content))
+    else:
+        content_length = len(content)
+    preview = content[:PREVIEW_LENGTH] + "..." if content_length > PREVIEW_LENGTH else content
+    
+    created_at = memo.get("created_at", "")
+    if created_at:
+        try:
+            dt = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
+            date_str = dt.strftime("%Y-%m-%d %H:%M")
+        except (ValueError, AttributeError):
+            date_str = str(created_at)
+    else:
+        date_str = "날짜 없음"
+    
+    priority = memo.get("priority", "보통")
+    return {
+        "title": memo.get("title", "제목 없음"),
+        "preview": preview,
+        "category": f"📁 {memo['category']}" if memo.get("category") else "",
+        "property_type": f"🏠 {memo['property_type']}" if memo.get("property_type") else "",
+        "priority": priority,
+        "priority_label": f"⚡ {priority}",
+        "date": date_str,
+        "size_hint": None
+    }
+
+
+class MemoRenderCache:
+    """(메모 ID, 수정 시각)을 키로 하는 LRU 렌더링 캐시"""
+    
+    def __init__(self, capacity: int = 1000):
+        """
+        렌더링 캐시 초기화
+        
+        Args:
+            capacity (int): 최대 보관 항목 수
+        """
+        self.capacity = capacity
+        self._entries: "OrderedDict[Tuple[int, str], Dict[str, Any]]" = OrderedDict()
+        self._keys_by_id: Dict[int, Tuple[int, str]] = {}
+    
+    def get(self, memo: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        메모의 렌더링 데이터를 가져옵니다. 없으면 계산해서 보관합니다.
+        
+        Args:
+            memo (Dict[str, Any]): 메모 데이터
+            
+        Returns:
+            Dict[str, Any]: 렌더링 데이터
+        """
+        key = (memo["id"], memo.get("updated_at", ""))
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            return entry
+        
+        # 같은 메모의 이전 버전 항목은 더 이상 쓰이지 않으므로 제거합니다
+        self.invalidate(memo["id"])
+        entry = build_render_data(memo)
+        self._entries[key] = entry
+        self._keys_by_id[memo["id"]] = key
+        while len(self._entries) > self.capacity:
+            old_key, _ = self._entries.popitem(last=False)
+            self._keys_by_id.pop(old_key[0], None)
+        return entry
+    
+    def invalidate(self, memo_id: int) -> None:
+        """
+        메모의 캐시 항목을 제거합니다.
+        
+        Args:
+            memo_id (int): 메모 ID
+        """
+        key = self._keys_by_id.pop(memo_id, None)
+        if key is not None:
+            self._entries.pop(key, None)
+    
+    def clear(self) -> None:
+        """모든 캐시 항목을 제거합니다."""
+        self._entries.clear()
+        self._keys_by_id.clear()
+    
+    def on_memo_changed(self, event: str, memo: Dict[str, Any],
+                        previous: Optional[Dict[str, Any]] = None) -> None:
+        """
+        MemoModel 변경 이벤트 리스너
+        
+        Args:
+            event (str): 변경 이벤트 종류
+            memo (Dict[str, Any]): 변경된 메모
+            previous (Optional[Dict[str, Any]]): 변경 전 메모
+        """
+        if event != "created":
+            self.invalidate(memo["id"])
+    
+    def __len__(self) -> int:
+        return len(self._entries)
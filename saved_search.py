@@ -0,0 +1,241 @@
+"""
+저장된 검색 (스마트 폴더)
+검색 조건별 결과 집합을 보관하고 메모 변경 이벤트로 점진적으로 갱신합니다.
+"""
+from datetime import date, timedelta
+from typing import List, Optional, Dict, Any, Set, Tuple, Callable, Sequence
+import json
+import os
+
+from memo_model import MemoModel
+
+
+# 기간 조건 프리셋
+DATE_RANGE_PRESETS = {
+    "today": "오늘",
+    "this_week": "이번 주",
+    "this_month": "이번 달"
+}
+
+
+def resolve_date_range(criteria: Dict[str, Any],
+                       today: Optional[date] = None) -> Tuple[str, str]:
+    """
+    검색 조건의 기간을 (시작일, 종료일) ISO 날짜 문자열로 변환합니다.
+    
+    Args:
+        criteria (Dict[str, Any]): 검색 조건 ("date_range" 프리셋 또는 "date_from"/"date_to")
+        today (Optional[date]): 기준 날짜 (기본값: 오늘)
+        
+    Returns:
+        Tuple[str, str]: 시작일과 종료일 (제한이 없으면 빈 문자열)
+    """
+    today = today or date.today()
+    preset = criteria.get("date_range")
+    if preset == "today":
+        return today.isoformat(), today.isoformat()
+    if preset == "this_week":
+        start = today - timedelta(days=today.weekday())
+        return start.isoformat(), (start + timedelta(days=6)).isoformat()
+    if preset == "this_month":
+        start = today.replace(day=1)
+        end = (start + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+        return start.isoformat(), end.isoformat()
+    return criteria.get("date_from") or "", criteria.get("date_to") or ""
+
+
+def memo_matches(memo: Dict[str, Any], criteria: Dict[str, Any],
+                 get_content: Callable[[Dict[str, Any]], str],
+                 in_region: Callable[[Dict[str, Any], Sequence[str]], bool],
+                 date_range: Tuple[str, str] = ("", "")) -> bool:
+    """
+    메모가 검색 조건을 만족하는지 확인합니다.
+    
+    Args:
+        memo (Dict[str, Any]): 메모 데이터
+        criteria (Dict[str, Any]): 검색 조건 (query, category, property_type, priority, region)
+        get_content (Callable): 메모 본문을 읽는 함수 (본문 검색이 필요할 때만 호출)
+        in_region (Callable): 메모가 지역 경로 아래에 있는지 확인하는 함수 (지역 필터와 같은 기준)
+        date_range (Tuple[str, str]): resolve_date_range로 구한 작성일 범위
+        
+    Returns:
+        bool: 조건 만족 여부
+    """
+    for field in ("category", "property_type", "priority"):
+        if criteria.get(field) and memo.get(field) != criteria[field]:
+            return False
+    
+    region = criteria.get("region")
+    if region and not in_region(memo, region):
+        return False
+    
+    date_from, date_to = date_range
+    created = memo.get("created_at", "")[:10]
+    if date_from and created < date_from:
+        return False
+    if date_to and created > date_to:
+        return False
+    
+    query = (criteria.get("query") or "").strip().lower()
+    if not query:
+        return True
+    for field in ("title", "category", "property_type", "location"):
+        if query in memo.get(field, "").lower():
+            return True
+    return query in get_content(memo).lower()
+
+
+class SavedSearchManager:
+    """저장된 검색과 그 결과 집합을 관리하는 클래스"""
+    
+    def __init__(self, memo_model: MemoModel):
+        """
+        저장된 검색 관리자 초기화
+        
+        Args:
+            memo_model (MemoModel): 검색 대상 메모 모델
+        """
+        self.memo_model = memo_model
+        self.file_path = memo_model.get_sidecar_path("_searches.json")
+        self.searches: List[Dict[str, Any]] = []
+        self._results: Dict[str, Set[int]] = {}
+        self._date_ranges: Dict[str, Tuple[str, str]] = {}
+        self._resolved_on = date.today()
+        self.load_searches()
+        memo_model.add_change_listener(self.on_memo_changed)
+    
+    def load_searches(self) -> None:
+        """JSON 파일에서 저장된 검색을 로드하고 결과 집합을 만듭니다."""
+        try:
+            if os.path.exists(self.file_path):
+                with open(self.file_path, 'r', encoding='utf-8') as file:
+                    self.searches = json.load(file)
+        except (json.JSONDecodeError, OSError) as e:
+            print(f"저장된 검색 로드 중 오류 발생: {e}")
+            self.searches = []
+        
+        for search in self.searches:
+            self._materialize(search)
+    
+    def save_searches(self) -> bool:
+        """저장된 검색을 JSON 파일에 저장합니다."""
+        try:
+            with open(self.file_path, 'w', encoding='utf-8') as file:
+                json.dump(self.searches, file, ensure_ascii=False, indent=2)
+            return True
+        except OSError as e:
+            print(f"저장된 검색 저장 중 오류 발생: {e}")
+            return False
+    
+    def _materialize(self, search: Dict[str, Any]) -> None:
+        """검색 조건으로 전체 메모를 한 번 훑어 결과 집합을 만듭니다."""
+        name = search["name"]
+        date_range = resolve_date_range(search["criteria"])
+        self._date_ranges[name] = date_range
+        self._results[name] = {
+            memo["id"] for memo in self.memo_model.get_all_memos()
+            if memo_matches(memo, search["criteria"], self._read_content, self._in_region, date_range)
+        }
+    
+    def _refresh_date_ranges(self) -> None:
+        """날짜가 바뀌어 "오늘", "이번 주" 같은 프리셋의 기간이 달라진 검색은 결과 집합을 다시 만듭니다."""
+        today = date.today()
+        if today == self._resolved_on:
+            return
+        self._resolved_on = today
+        for search in self.searches:
+            if resolve_date_range(search["criteria"], today) != self._date_ranges.get(search["name"]):
+                self._materialize(search)
+    
+    def _read_content(self, memo: Dict[str, Any]) -> str:
+        """메모 본문을 읽습니다 (압축 보관된 메모는 본문 없이 메타데이터로만 찾음)."""
+        return self.memo_model.get_searchable_content(memo["id"])
+    
+    def _in_region(self, memo: Dict[str, Any], region: Sequence[str]) -> bool:
+        """메모가 지역 경로 아래에 있는지 지역 인덱스로 확인합니다."""
+        return self.memo_model.is_memo_in_region(memo["id"], region)
+    
+    def add_search(self, name: str, criteria: Dict[str, Any]) -> bool:
+        """
+        검색을 저장합니다. 같은 이름이 있으면 조건을 바꿉니다.
+        
+        Args:
+            name (str): 검색 이름
+            criteria (Dict[str, Any]): 검색 조건
+            
+        Returns:
+            bool: 저장 성공 여부
+        """
+        self.searches = [search for search in self.searches if search["name"] != name]
+        search = {"name": name, "criteria": criteria}
+        self.searches.append(search)
+        self._materialize(search)
+        return self.save_searches()
+    
+    def remove_search(self, name: str) -> bool:
+        """
+        저장된 검색을 삭제합니다.
+        
+        Args:
+            name (str): 검색 이름
+            
+        Returns:
+            bool: 삭제 성공 여부
+        """
+        self.searches = [search for search in self.searches if search["name"] != name]
+        self._results.pop(name, None)
+        self._date_ranges.pop(name, None)
+        return self.save_searches()
+    
+    def get_count(self, name: str) -> int:
+        """
+        저장된 검색의 결과 수를 가져옵니다.
+        
+        Args:
+            name (str): 검색 이름
+            
+        Returns:
+            int: 결과 메모 수
+        """
+        self._refresh_date_ranges()
+        return len(self._results.get(name, ()))
+    
+    def get_results(self, name: str) -> List[Dict[str, Any]]:
+        """
+        저장된 검색의 결과 메모를 가져옵니다.
+        
+        Args:
+            name (str): 검색 이름
+            
+        Returns:
+            List[Dict[str, Any]]: 결과 메모 리스트 (작성 순)
+        """
+        self._refresh_date_ranges()
+        results = []
+        for memo_id in sorted(self._results.get(name, ())):
+            memo = self.memo_model.get_memo(memo_id)
+            if memo:
+                results.append(memo)
+        return results
+    
+    def on_memo_changed(self, event: str, memo: Dict[str, Any],
+                        previous: Optional[Dict[str, Any]] = None) -> None:
+        """
+        MemoModel 변경 이벤트 리스너 - 바뀐 메모 하나만 다시 평가합니다.
+        
+        Args:
+            event (str): 변경 이벤트 종류
+            memo (Dict[str, Any]): 변경된 메모
+            previous (Optional[Dict[str, Any]]): 변경 전 메모
+        """
+        self._refresh_date_ranges()
+        for search in self.searches:
+            name = search["name"]
+            results = self._results.setdefault(name, set())
+            if event in ("deleted", "purged"):
+                results.discard(memo["id"])
+            elif memo_matches(memo, search["criteria"], self._read_content, self._in_region,
+                              self._date_ranges.get(name, ("", ""))):
+                results.add(memo["id"])
+            else:
+                results.discard(memo["id"])
@@ -0,0 +1,306 @@
+"""
+좌표 공간 인덱스
+메모의 위도/경도를 일정 크기의 격자 칸으로 나누어 색인하고, 반경/사각형 범위 안의
+메모와 가장 가까운 메모를 지도 서비스 없이 로컬에서 찾습니다.
+"""
+from typing import List, Optional, Dict, Any, Set, Tuple, Iterator
+import math
+
+
+# 격자 칸 크기 (도, 위도 0.01도는 약 1.1km)
+GRID_CELL_DEGREES = 0.01
+
+# 지구 평균 반지름 (km)
+EARTH_RADIUS_KM = 6371.0088
+
+# 위도 1도의 거리 (km)
+KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180
+
+Cell = Tuple[int, int]
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """
+    두 좌표 사이의 대원 거리를 계산합니다.
+    
+    Args:
+        lat1 (float): 첫 번째 위도
+        lon1 (float): 첫 번째 경도
+        lat2 (float): 두 번째 위도
+        lon2 (float): 두 번째 경도
+        
+    Returns:
+        float: 거리 (km)
+    """
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lon2 - lon1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def get_coordinates(memo: Dict[str, Any]) -> Optional[Tuple[float, float]]:
+    """
+    메모의 좌표를 가져옵니다.
+    
+    Args:
+        memo (Dict[str, Any]): 메모 데이터
+        
+    Returns:
+        Optional[Tuple[float, float]]: (위도, 경도) 또는 None (좌표가 없는 경우)
+    """
+    latitude, longitude = memo.get("latitude"), memo.get("longitude")
+    if latitude is None or longitude is None:
+        return None
+    return float(latitude), float(longitude)
+
+
+def parse_coordinates(text: str) -> Optional[Tuple[float, float]]:
+    """
+    "위도, 경도" 형식의 문자열을 좌표로 바꿉니다 (지도 앱에서 복사한 값 그대로).
+    
+    Args:
+        text (str): 입력 문자열 (예: "37.4979, 127.0276")
+        
+    Returns:
+        Optional[Tuple[float, float]]: (위도, 경도) 또는 None (빈 문자열)
+        
+    Raises:
+        ValueError: 형식이 잘못되었거나 범위를 벗어난 경우
+    """
+    parts = text.replace(",", " ").split()
+    if not parts:
+        return None
+    if len(parts) != 2:
+        raise ValueError("위도와 경도를 쉼표로 구분해 입력하세요.")
+    latitude, longitude = float(parts[0]), float(parts[1])
+    if not -90 <= latitude <= 90 or not -180 <= longitude <= 180:
+        raise ValueError("위도는 -90~90, 경도는 -180~180 범위여야 합니다.")
+    return latitude, longitude
+
+
+def format_coordinates(memo: Dict[str, Any]) -> str:
+    """
+    메모의 좌표를 입력란에 표시할 문자열로 바꿉니다.
+    
+    Args:
+        memo (Dict[str, Any]): 메모 데이터
+        
+    Returns:
+        str: "위도, 경도" (좌표가 없으면 빈 문자열)
+    """
+    point = get_coordinates(memo)
+    if point is None:
+        return ""
+    return f"{point[0]:.6f}, {point[1]:.6f}"
+
+
+class SpatialIndex:
+    """위도/경도 격자 칸별로 메모 ID를 묶어 둔 공간 인덱스"""
+    
+    def __init__(self, cell_degrees: float = GRID_CELL_DEGREES):
+        """
+        공간 인덱스 초기화
+        
+        Args:
+            cell_degrees (float): 격자 칸 크기 (도)
+        """
+        self.cell_degrees = cell_degrees
+        self._cells: Dict[Cell, Set[int]] = {}
+        self._points: Dict[int, Tuple[float, float]] = {}
+    
+    def _cell(self, latitude: float, longitude: float) -> Cell:
+        """좌표가 속한 격자 칸을 구합니다."""
+        return (math.floor(latitude / self.cell_degrees),
+                math.floor(longitude / self.cell_degrees))
+    
+    def build(self, memos: List[Dict[str, Any]]) -> None:
+        """
+        메모 목록으로 인덱스를 새로 만듭니다.
+        
+        Args:
+            memos (List[Dict[str, Any]]): 인덱싱할 메모 리스트
+        """
+        self._cells = {}
+        self._points = {}
+        for memo in memos:
+            self.add(memo)
+    
+    def add(self, memo: Dict[str, Any]) -> None:
+        """메모를 인덱스에 추가합니다 (좌표가 없으면 추가하지 않음)."""
+        self.remove(memo["id"])
+        point = get_coordinates(memo)
+        if point is None:
+            return
+        self._points[memo["id"]] = point
+        self._cells.setdefault(self._cell(*point), set()).add(memo["id"])
+    
+    def remove(self, memo_id: int) -> None:
+        """메모를 인덱스에서 제거합니다."""
+        point = self._points.pop(memo_id, None)
+        if point is None:
+            return
+        cell = self._cell(*point)
+        ids = self._cells[cell]
+        ids.discard(memo_id)
+        if not ids:
+            del self._cells[cell]
+    
+    def get_state(self) -> Dict[str, Any]:
+        """
+        스냅샷에 저장할 인덱스 상태를 가져옵니다.
+        
+        Returns:
+            Dict[str, Any]: {"ids", "points", "cells"} (칸은 [행, 열, 메모 ID 리스트] 리스트)
+        """
+        return {"ids": list(self._points), "points": list(self._points.values()),
+                "cells": [[row, col, list(ids)] for (row, col), ids in self._cells.items()]}
+    
+    def set_state(self, state: Dict[str, Any]) -> None:
+        """
+        get_state()로 저장한 상태로 인덱스를 복원합니다.
+        
+        Args:
+            state (Dict[str, Any]): {"ids", "points", "cells"}
+            
+        Raises:
+            ValueError, TypeError, KeyError: 상태 형식이 잘못된 경우
+        """
+        if len(state["ids"]) != len(state["points"]):
+            raise ValueError("공간 인덱스 상태의 길이가 맞지 않습니다.")
+        self._points = {memo_id: (float(latitude), float(longitude))
+                        for memo_id, (latitude, longitude) in zip(state["ids"], state["points"])}
+        self._cells = {(row, col): set(ids) for row, col, ids in state["cells"]}
+    
+    def on_memo_changed(self, event: str, memo: Dict[str, Any],
+                        previous: Optional[Dict[str, Any]] = None) -> None:
+        """
+        MemoModel 변경 이벤트 리스너
+        
+        Args:
+            event (str): 변경 이벤트 종류
+            memo (Dict[str, Any]): 변경된 메모
+            previous (Optional[Dict[str, Any]]): 변경 전 메모
+        """
+        if event in ("deleted", "purged"):
+            self.remove(memo["id"])
+        elif event != "updated" or previous is None or \
+                get_coordinates(previous) != get_coordinates(memo):
+            self.add(memo)
+    
+    def get_point(self, memo_id: int) -> Optional[Tuple[float, float]]:
+        """인덱싱된 메모의 좌표를 가져옵니다."""
+        return self._points.get(memo_id)
+    
+    def _cells_in_bbox(self, min_lat: float, min_lon: float,
+                       max_lat: float, max_lon: float) -> Iterator[Cell]:
+        """사각형 범위와 겹치는 격자 칸 중 메모가 있는 칸을 차례로 돌려줍니다."""
+        low_row, low_col = self._cell(min_lat, min_lon)
+        high_row, high_col = self._cell(max_lat, max_lon)
+        # 범위가 넓어 칸 수가 메모가 있는 칸보다 많으면 메모가 있는 칸만 훑습니다
+        if (high_row - low_row + 1) * (high_col - low_col + 1) > len(self._cells):
+            for row, col in self._cells:
+                if low_row <= row <= high_row and low_col <= col <= high_col:
+                    yield row, col
+            return
+        for row in range(low_row, high_row + 1):
+            for col in range(low_col, high_col + 1):
+                if (row, col) in self._cells:
+                    yield row, col
+    
+    def _ids_in_cells(self, min_lat: float, min_lon: float,
+                      max_lat: float, max_lon: float) -> Set[int]:
+        """사각형 범위와 겹치는 격자 칸의 메모 ID를 모읍니다."""
+        ids: Set[int] = set()
+        for cell in self._cells_in_bbox(min_lat, min_lon, max_lat, max_lon):
+            ids |= self._cells[cell]
+        return ids
+    
+    def _radius_bbox(self, latitude: float, longitude: float,
+                     radius_km: float) -> Tuple[float, float, float, float]:
+        """중심에서 반경을 감싸는 사각형 범위 (남, 서, 북, 동)를 구합니다."""
+        lat_span = radius_km / KM_PER_DEGREE
+        # 극지방에서 경도 1도의 거리가 0에 가까워지지 않도록 제한합니다
+        cos_lat = max(math.cos(math.radians(min(abs(latitude) + lat_span, 90.0))), 1e-6)
+        lon_span = min(radius_km / (KM_PER_DEGREE * cos_lat), 180.0)
+        return latitude - lat_span, longitude - lon_span, latitude + lat_span, longitude + lon_span
+    
+    def query_bbox(self, min_lat: float, min_lon: float,
+                   max_lat: float, max_lon: float) -> Set[int]:
+        """
+        사각형 범위 안의 메모 ID를 가져옵니다.
+        
+        Args:
+            min_lat (float): 남쪽 위도
+            min_lon (float): 서쪽 경도
+            max_lat (float): 북쪽 위도
+            max_lon (float): 동쪽 경도
+            
+        Returns:
+            Set[int]: 메모 ID 집합
+        """
+        return {memo_id for memo_id in self._ids_in_cells(min_lat, min_lon, max_lat, max_lon)
+                if min_lat <= self._points[memo_id][0] <= max_lat
+                and min_lon <= self._points[memo_id][1] <= max_lon}
+    
+    def query_radius(self, latitude: float, longitude: float,
+                     radius_km: float) -> List[Tuple[int, float]]:
+        """
+        중심에서 반경 안에 있는 메모를 가까운 순으로 가져옵니다.
+        
+        반경을 감싸는 격자 칸만 훑으므로 전체 메모 수가 아닌 주변 메모 수만큼만 계산합니다.
+        
+        Args:
+            latitude (float): 중심 위도
+            longitude (float): 중심 경도
+            radius_km (float): 반경 (km)
+            
+        Returns:
+            List[Tuple[int, float]]: (메모 ID, 거리 km) 리스트 (가까운 순)
+        """
+        results = []
+        for memo_id in self._ids_in_cells(*self._radius_bbox(latitude, longitude, radius_km)):
+            distance = haversine_km(latitude, longitude, *self._points[memo_id])
+            if distance <= radius_km:
+                results.append((memo_id, distance))
+        results.sort(key=lambda item: (item[1], item[0]))
+        return results
+    
+    def nearest(self, latitude: float, longitude: float, limit: int,
+                max_distance_km: float, exclude_id: Optional[int] = None) -> List[Tuple[int, float]]:
+        """
+        중심에서 가장 가까운 메모를 찾습니다.
+        
+        격자 칸 하나 크기에서 시작해 찾은 메모가 limit개가 될 때까지 반경을 두 배씩 늘립니다.
+        반경을 늘릴 때는 새로 범위에 들어온 칸의 메모만 거리를 계산합니다.
+        반경 안의 메모는 빠짐없이 찾으므로 limit개를 찾은 시점의 앞쪽 결과가 정확한 최근접 결과입니다.
+        
+        Args:
+            latitude (float): 중심 위도
+            longitude (float): 중심 경도
+            limit (int): 최대 결과 수
+            max_distance_km (float): 최대 거리 (km)
+            exclude_id (Optional[int]): 제외할 메모 ID (기준 메모)
+            
+        Returns:
+            List[Tuple[int, float]]: (메모 ID, 거리 km) 리스트 (가까운 순)
+        """
+        radius = min(self.cell_degrees * KM_PER_DEGREE, max_distance_km)
+        visited: Set[Cell] = set()
+        candidates: List[Tuple[int, float]] = []
+        total = len(self._points) - (exclude_id in self._points)
+        while True:
+            for cell in self._cells_in_bbox(*self._radius_bbox(latitude, longitude, radius)):
+                if cell in visited:
+                    continue
+                visited.add(cell)
+                candidates.extend((memo_id, haversine_km(latitude, longitude, *self._points[memo_id]))
+                                  for memo_id in self._cells[cell] if memo_id != exclude_id)
+            results = sorted((item for item in candidates if item[1] <= radius),
+                             key=lambda item: (item[1], item[0]))
+            if len(results) >= limit or radius >= max_distance_km or len(results) >= total:
+                return results[:limit]
+            radius = min(radius * 2, max_distance_km)
+    
+    def __len__(self) -> int:
+        return len(self._points)
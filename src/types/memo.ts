@@ -7,6 +7,8 @@ export interface Memo {
   propertyType: string;
   location: string;
   priority: 'high' | 'medium' | 'low';
+  latitude?: number;
+  longitude?: number;
   createdAt: string;
   updatedAt: string;
 }
@@ -0,0 +1,144 @@
+"""
+시작 시간 측정 도구
+인터프리터 시작, 모듈 임포트, 메모 모델 로드, 첫 화면 그리기까지 걸린 시간을 기록합니다.
+"""
+from datetime import datetime
+from typing import List, Optional, Dict, Any, Tuple
+import json
+import os
+import sys
+import time
+
+
+# 측정을 켜는 환경 변수와 명령행 옵션
+PROBE_ENV = "MEMO_STARTUP_PROBE"
+PROBE_ARG = "--startup-probe"
+
+# 측정 결과를 누적 기록하는 파일 (회귀 추적용)
+PROBE_LOG_FILE = "startup_times.jsonl"
+
+# 이보다 오래된 프로세스 생성 시각은 잘못 읽은 것으로 보고 버립니다 (초)
+MAX_PROCESS_AGE = 600
+
+
+def _process_created_at(pid: int) -> Optional[float]:
+    """
+    프로세스 생성 시각을 운영체제에서 읽습니다.
+    
+    Args:
+        pid (int): 프로세스 ID
+        
+    Returns:
+        Optional[float]: 생성 시각 (epoch 초) 또는 None (지원하지 않는 환경)
+    """
+    if sys.platform == "win32":
+        import ctypes
+        from ctypes import wintypes
+        kernel32 = ctypes.windll.kernel32
+        # PROCESS_QUERY_LIMITED_INFORMATION
+        handle = kernel32.OpenProcess(0x1000, False, pid)
+        if not handle:
+            return None
+        try:
+            times = [wintypes.FILETIME() for _ in range(4)]
+            if not kernel32.GetProcessTimes(handle, *[ctypes.byref(value) for value in times]):
+                return None
+        finally:
+            kernel32.CloseHandle(handle)
+        # FILETIME은 1601-01-01부터의 100ns 단위입니다
+        created = times[0].dwHighDateTime << 32 | times[0].dwLowDateTime
+        return created / 10_000_000 - 11_644_473_600
+    try:
+        with open(f"/proc/{pid}/stat", 'r') as file:
+            # 두 번째 필드(실행 파일 이름)에 공백이 있을 수 있어 ")" 뒤부터 셉니다
+            fields = file.read().rsplit(")", 1)[1].split()
+        with open("/proc/uptime", 'r') as file:
+            uptime = float(file.read().split()[0])
+        started_after_boot = int(fields[19]) / os.sysconf("SC_CLK_TCK")
+        return time.time() - uptime + started_after_boot
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+def _launch_pid() -> int:
+    """시작 시점의 기준 프로세스를 구합니다 (단일 파일 빌드는 압축을 푸는 부트로더 프로세스)."""
+    bundle_dir = getattr(sys, "_MEIPASS", "")
+    if getattr(sys, "frozen", False) and os.path.basename(bundle_dir).startswith("_MEI"):
+        return os.getppid()
+    return os.getpid()
+
+
+class StartupProbe:
+    """
+    프로세스 시작 시점부터의 구간별 경과 시간을 재는 클래스
+    
+    프로세스 생성 시각을 읽을 수 있으면 첫 구간("interpreter")에 인터프리터 시작과
+    단일 파일 빌드의 압축 풀기 시간이 들어갑니다. 읽을 수 없는 환경에서는 이 모듈을
+    처음 임포트한 시점부터 잽니다 (보고서의 "since"가 "first_import").
+    """
+    
+    def __init__(self, enabled: bool = False):
+        """
+        시작 시간 측정기 초기화
+        
+        Args:
+            enabled (bool): 측정 결과 보고 여부
+        """
+        self.enabled = enabled
+        now = time.perf_counter()
+        created_at = _process_created_at(_launch_pid())
+        elapsed = time.time() - created_at if created_at is not None else None
+        self.since_process_start = elapsed is not None and 0 <= elapsed < MAX_PROCESS_AGE
+        self._start = now - elapsed if self.since_process_start else now
+        self._last = now
+        self.marks: List[Tuple[str, float]] = []
+        if self.since_process_start:
+            self.marks.append(("interpreter", elapsed * 1000))
+    
+    def mark(self, name: str) -> None:
+        """
+        직전 구간이 끝났음을 기록합니다.
+        
+        Args:
+            name (str): 구간 이름 (예: "import", "model_load", "first_paint")
+        """
+        now = time.perf_counter()
+        self.marks.append((name, (now - self._last) * 1000))
+        self._last = now
+    
+    def total_ms(self) -> float:
+        """지금까지 기록된 전체 경과 시간(밀리초)을 가져옵니다."""
+        return (self._last - self._start) * 1000
+    
+    def report(self, log_path: Optional[str] = PROBE_LOG_FILE) -> Dict[str, Any]:
+        """
+        측정 결과를 출력하고 기록 파일에 한 줄 추가합니다.
+        
+        Args:
+            log_path (Optional[str]): 결과를 추가할 JSON Lines 파일 (None이면 기록 안 함)
+            
+        Returns:
+            Dict[str, Any]: 구간별 시간(ms), 전체 시간과 측정 기준점("since")
+        """
+        result: Dict[str, Any] = {name: round(elapsed, 1) for name, elapsed in self.marks}
+        result["total"] = round(self.total_ms(), 1)
+        since = "process_start" if self.since_process_start else "first_import"
+        if not self.enabled:
+            return {**result, "since": since}
+        
+        print(f"시작 시간 ({'프로세스 시작' if self.since_process_start else '첫 임포트'} 기준): " +
+              ", ".join(f"{name} {elapsed}ms" for name, elapsed in result.items()))
+        result["since"] = since
+        if log_path:
+            entry = {"measured_at": datetime.now().isoformat(),
+                     "frozen": bool(getattr(sys, "frozen", False)), **result}
+            try:
+                with open(log_path, 'a', encoding='utf-8') as file:
+                    file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            except OSError as e:
+                print(f"시작 시간 기록 중 오류 발생: {e}")
+        return result
+
+
+# 프로세스 생성 시각을 읽지 못하는 환경에서도 가능한 한 이른 시점을 잡도록 모듈 수준에서 생성합니다
+probe = StartupProbe(os.environ.get(PROBE_ENV) == "1" or PROBE_ARG in sys.argv)
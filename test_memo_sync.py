@@ -0,0 +1,42 @@
+"""
+메모 동기화 테스트
+seq가 없는 이전 형식 메모 파일도 첫 동기화에서 모두 내보내는지 확인합니다.
+"""
+import json
+
+from memo_model import MemoModel
+from memo_sync import SyncEngine, JsonFileRemote
+
+
+def write_legacy_store(path):
+    """seq 필드가 없는 이전 형식 메모 파일을 만듭니다."""
+    memos = [
+        {"id": memo_id, "title": f"매물 {memo_id}", "content": f"내용 {memo_id}",
+         "category": "아파트", "priority": "보통", "property_type": "매매",
+         "location": "서울 강남구 역삼동",
+         "created_at": f"2024-01-0{memo_id}T09:00:00", "updated_at": f"2024-01-0{memo_id}T09:00:00"}
+        for memo_id in (1, 2, 3)
+    ]
+    memos[2]["deleted_at"] = "2024-02-01T09:00:00"
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(memos, file, ensure_ascii=False)
+
+
+def test_first_sync_exports_legacy_memos(tmp_path):
+    store_path = tmp_path / "memos.json"
+    remote_path = tmp_path / "web.json"
+    write_legacy_store(store_path)
+    
+    model = MemoModel(str(store_path))
+    stats = SyncEngine(model, JsonFileRemote(str(remote_path))).sync()
+    
+    with open(remote_path, 'r', encoding='utf-8') as file:
+        remote = {memo["id"]: memo for memo in json.load(file)}
+    # 휴지통의 메모는 원격에서 삭제로 반영되고 나머지는 모두 올라갑니다
+    assert set(remote) == {"1", "2"}
+    assert remote["2"]["content"] == "내용 2"
+    assert stats["pushed"] == 3
+    
+    # 다시 열어서 동기화해도 바뀐 것이 없으므로 다시 보내지 않습니다
+    reopened = MemoModel(str(store_path))
+    assert SyncEngine(reopened, JsonFileRemote(str(remote_path))).sync()["pushed"] == 0
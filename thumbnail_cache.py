@@ -0,0 +1,129 @@
+"""
+첨부 썸네일 디스크 캐시
+첨부 파일 해시별로 만든 썸네일을 폴더에 보관하고, 전체 크기가 한도를 넘으면
+가장 오래 쓰지 않은 썸네일부터 지웁니다 (LRU, 파일 수정 시각을 사용 시각으로 씀).
+"""
+from typing import Optional, Dict
+import os
+import threading
+import time
+
+
+# 썸네일 긴 변 길이 (픽셀)
+THUMBNAIL_SIZE = 128
+
+# 썸네일 캐시 최대 크기 (바이트)
+THUMBNAIL_CACHE_LIMIT = 64 * 1024 * 1024
+
+
+class ThumbnailCache:
+    """크기 제한이 있는 썸네일 디스크 캐시 클래스 (여러 스레드에서 사용 가능)"""
+    
+    def __init__(self, cache_dir: str, max_bytes: int = THUMBNAIL_CACHE_LIMIT):
+        """
+        썸네일 캐시 초기화
+        
+        Args:
+            cache_dir (str): 썸네일을 보관할 폴더 경로
+            max_bytes (int): 캐시 최대 크기 (바이트)
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._sizes: Optional[Dict[str, int]] = None
+    
+    def get_path(self, file_hash: str, size: int = THUMBNAIL_SIZE) -> str:
+        """
+        썸네일 파일 경로를 만듭니다.
+        
+        Args:
+            file_hash (str): 첨부 파일 해시
+            size (int): 썸네일 크기
+            
+        Returns:
+            str: 썸네일 PNG 경로
+        """
+        return os.path.join(self.cache_dir, f"{file_hash}_{size}.png")
+    
+    def _scan(self) -> Dict[str, int]:
+        """처음 사용할 때 캐시 폴더의 파일 크기를 읽어 둡니다."""
+        if self._sizes is None:
+            self._sizes = {}
+            if os.path.isdir(self.cache_dir):
+                for name in os.listdir(self.cache_dir):
+                    if name.endswith(".png"):
+                        try:
+                            self._sizes[name] = os.path.getsize(os.path.join(self.cache_dir, name))
+                        except OSError:
+                            continue
+        return self._sizes
+    
+    def get(self, file_hash: str, size: int = THUMBNAIL_SIZE) -> Optional[str]:
+        """
+        캐시된 썸네일 경로를 가져오고 사용 시각을 갱신합니다.
+        
+        Args:
+            file_hash (str): 첨부 파일 해시
+            size (int): 썸네일 크기
+            
+        Returns:
+            Optional[str]: 썸네일 경로 또는 None (캐시에 없는 경우)
+        """
+        path = self.get_path(file_hash, size)
+        try:
+            os.utime(path)
+            return path
+        except OSError:
+            return None
+    
+    def put(self, file_hash: str, data: bytes, size: int = THUMBNAIL_SIZE) -> Optional[str]:
+        """
+        썸네일을 캐시에 저장하고 한도를 넘으면 오래된 썸네일을 지웁니다.
+        
+        Args:
+            file_hash (str): 첨부 파일 해시
+            data (bytes): PNG 데이터
+            size (int): 썸네일 크기
+            
+        Returns:
+            Optional[str]: 저장된 썸네일 경로 또는 None (저장 실패)
+        """
+        path = self.get_path(file_hash, size)
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(temp_path, 'wb') as file:
+                file.write(data)
+            os.replace(temp_path, path)
+        except OSError as e:
+            print(f"썸네일 저장 중 오류 발생: {e}")
+            return None
+        
+        with self._lock:
+            self._scan()[os.path.basename(path)] = len(data)
+            self._evict(keep=os.path.basename(path))
+        return path
+    
+    def _evict(self, keep: str) -> None:
+        """전체 크기가 한도 이하가 될 때까지 가장 오래 쓰지 않은 썸네일을 지웁니다."""
+        sizes = self._scan()
+        total = sum(sizes.values())
+        if total <= self.max_bytes:
+            return
+        
+        def last_used(name: str) -> float:
+            try:
+                return os.path.getmtime(os.path.join(self.cache_dir, name))
+            except OSError:
+                return time.time()
+        
+        for name in sorted(sizes, key=last_used):
+            if total <= self.max_bytes:
+                break
+            if name == keep:
+                continue
+            try:
+                os.remove(os.path.join(self.cache_dir, name))
+            except OSError:
+                pass
+            total -= sizes.pop(name)
@@ -0,0 +1,165 @@
+"""
+작성/수정 시각 정렬 인덱스
+메모의 ISO 시각 필드를 정수 타임스탬프로 정렬해 두고 이진 탐색으로 기간 조회를 처리합니다.
+"""
+from bisect import bisect_left, insort
+from datetime import datetime
+from typing import List, Optional, Dict, Any, Set, Tuple
+
+
+def to_timestamp(value: str) -> Optional[int]:
+    """
+    ISO 형식 시각 문자열을 정수 타임스탬프(초)로 변환합니다.
+    
+    Args:
+        value (str): ISO 형식 시각
+        
+    Returns:
+        Optional[int]: 타임스탬프 또는 None (형식이 잘못된 경우)
+    """
+    if not value:
+        return None
+    try:
+        return int(datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp())
+    except (ValueError, TypeError):
+        return None
+
+
+class TimestampIndex:
+    """(타임스탬프, 메모 ID) 정렬 리스트로 된 기간 조회 인덱스"""
+    
+    def __init__(self, field: str):
+        """
+        시각 인덱스 초기화
+        
+        Args:
+            field (str): 인덱싱할 필드 이름 ("created_at" 또는 "updated_at")
+        """
+        self.field = field
+        self._entries: List[Tuple[int, int]] = []
+        self._timestamps: Dict[int, int] = {}
+    
+    def build(self, memos: List[Dict[str, Any]]) -> None:
+        """
+        메모 목록으로 인덱스를 새로 만듭니다.
+        
+        Args:
+            memos (List[Dict[str, Any]]): 인덱싱할 메모 리스트
+        """
+        self._timestamps = {}
+        for memo in memos:
+            timestamp = to_timestamp(memo.get(self.field, ""))
+            if timestamp is not None:
+                self._timestamps[memo["id"]] = timestamp
+        self._entries = sorted((timestamp, memo_id)
+                               for memo_id, timestamp in self._timestamps.items())
+    
+    def add(self, memo: Dict[str, Any]) -> None:
+        """메모를 인덱스에 추가합니다."""
+        self.remove(memo["id"])
+        timestamp = to_timestamp(memo.get(self.field, ""))
+        if timestamp is None:
+            return
+        self._timestamps[memo["id"]] = timestamp
+        insort(self._entries, (timestamp, memo["id"]))
+    
+    def remove(self, memo_id: int) -> None:
+        """메모를 인덱스에서 제거합니다."""
+        timestamp = self._timestamps.pop(memo_id, None)
+        if timestamp is None:
+            return
+        position = bisect_left(self._entries, (timestamp, memo_id))
+        if position < len(self._entries) and self._entries[position] == (timestamp, memo_id):
+            del self._entries[position]
+    
+    def on_memo_changed(self, event: str, memo: Dict[str, Any],
+                        previous: Optional[Dict[str, Any]] = None) -> None:
+        """
+        MemoModel 변경 이벤트 리스너
+        
+        Args:
+            event (str): 변경 이벤트 종류
+            memo (Dict[str, Any]): 변경된 메모
+            previous (Optional[Dict[str, Any]]): 변경 전 메모
+        """
+        if event in ("deleted", "purged"):
+            self.remove(memo["id"])
+        elif event != "updated" or previous is None or \
+                previous.get(self.field) != memo.get(self.field):
+            self.add(memo)
+    
+    def get_state(self) -> Dict[str, List[int]]:
+        """
+        스냅샷에 저장할 인덱스 상태를 가져옵니다.
+        
+        Returns:
+            Dict[str, List[int]]: 정렬 순서의 {"timestamps", "ids"} 리스트
+        """
+        return {"timestamps": [entry[0] for entry in self._entries],
+                "ids": [entry[1] for entry in self._entries]}
+    
+    def set_state(self, state: Dict[str, List[int]]) -> None:
+        """
+        get_state()로 저장한 상태로 인덱스를 복원합니다 (정렬하지 않음).
+        
+        Args:
+            state (Dict[str, List[int]]): {"timestamps", "ids"} 리스트
+            
+        Raises:
+            ValueError, TypeError, KeyError: 상태 형식이 잘못된 경우
+        """
+        timestamps, ids = state["timestamps"], state["ids"]
+        if len(timestamps) != len(ids):
+            raise ValueError("시각 인덱스 상태의 길이가 맞지 않습니다.")
+        self._entries = list(zip(timestamps, ids))
+        self._timestamps = dict(zip(ids, timestamps))
+    
+    def _bounds(self, start: Optional[int], end: Optional[int]) -> Tuple[int, int]:
+        """[start, end) 범위에 해당하는 리스트 위치를 구합니다."""
+        low = 0 if start is None else bisect_left(self._entries, (start, -1))
+        high = len(self._entries) if end is None else bisect_left(self._entries, (end, -1))
+        return low, max(low, high)
+    
+    def range_ids(self, start: Optional[int] = None, end: Optional[int] = None) -> Set[int]:
+        """
+        기간 [start, end)에 속하는 메모 ID를 가져옵니다.
+        
+        Args:
+            start (Optional[int]): 시작 타임스탬프 (None이면 제한 없음)
+            end (Optional[int]): 종료 타임스탬프, 포함하지 않음 (None이면 제한 없음)
+            
+        Returns:
+            Set[int]: 메모 ID 집합
+        """
+        low, high = self._bounds(start, end)
+        return {memo_id for _, memo_id in self._entries[low:high]}
+    
+    def count_range(self, start: Optional[int] = None, end: Optional[int] = None) -> int:
+        """
+        기간 [start, end)에 속하는 메모 수를 가져옵니다.
+        
+        Args:
+            start (Optional[int]): 시작 타임스탬프
+            end (Optional[int]): 종료 타임스탬프 (포함하지 않음)
+            
+        Returns:
+            int: 메모 수
+        """
+        low, high = self._bounds(start, end)
+        return high - low
+    
+    def bucket_counts(self, boundaries: List[int]) -> List[int]:
+        """
+        연속된 구간별 메모 수를 가져옵니다.
+        
+        Args:
+            boundaries (List[int]): 오름차순 구간 경계 타임스탬프 (n+1개)
+            
+        Returns:
+            List[int]: 각 구간 [boundaries[i], boundaries[i+1])의 메모 수 (n개)
+        """
+        positions = [bisect_left(self._entries, (boundary, -1)) for boundary in boundaries]
+        return [positions[i + 1] - positions[i] for i in range(len(positions) - 1)]
+    
+    def __len__(self) -> int:
+        return len(self._entries)
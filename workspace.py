@@ -0,0 +1,191 @@
+"""
+워크스페이스 관리
+지점별 메모 저장소를 워크스페이스로 등록하고, 최근에 사용한 몇 개는
+모델과 인덱스, 캐시를 만든 상태 그대로 메모리에 유지해 바로 전환합니다.
+"""
+from collections import OrderedDict
+from typing import List, Optional, Dict
+import json
+import os
+
+from analytics import MemoAggregates
+from autocomplete import AutocompleteService
+from draft_journal import DraftJournal
+from memo_model import MemoModel
+from render_cache import MemoRenderCache
+from saved_search import SavedSearchManager
+from thumbnail_cache import ThumbnailCache
+
+
+# 메모리에 유지하는 최대 워크스페이스 수 (현재 워크스페이스 포함)
+WARM_WORKSPACE_LIMIT = 3
+
+# 등록된 워크스페이스 목록 파일
+WORKSPACE_REGISTRY_FILE = "workspaces.json"
+
+# 기본 워크스페이스 메모 파일
+DEFAULT_STORE_PATH = "memos.json"
+
+
+class Workspace:
+    """메모 저장소 하나와 그에 딸린 인덱스, 캐시, 통계, 초안 저널 묶음"""
+    
+    def __init__(self, name: str, file_path: str):
+        """
+        워크스페이스 열기 (메모 로드와 인덱스 구축)
+        
+        Args:
+            name (str): 워크스페이스 이름
+            file_path (str): 메모 JSON 파일 경로
+        """
+        self.name = name
+        self.file_path = file_path
+        self.memo_model = MemoModel(file_path)
+        self.render_cache = MemoRenderCache()
+        self.memo_model.add_change_listener(self.render_cache.on_memo_changed)
+        self.saved_searches = SavedSearchManager(self.memo_model)
+        self.autocomplete = AutocompleteService(self.memo_model)
+        self.analytics = MemoAggregates(self.memo_model)
+        self.thumbnails = ThumbnailCache(self.memo_model.get_sidecar_path("_thumbnails"))
+        self.draft_journal = DraftJournal(self.memo_model.get_sidecar_path("_drafts.jsonl"))
+    
+    def close(self) -> None:
+        """초안 기록을 마치고 미저장 변경 사항과 인덱스 스냅샷을 저장합니다."""
+        self.draft_journal.close()
+        self.memo_model.flush()
+        self.memo_model.save_index_snapshot()
+
+
+class WorkspaceManager:
+    """등록된 워크스페이스 목록과 메모리에 유지 중인 워크스페이스(LRU)를 관리하는 클래스"""
+    
+    def __init__(self, registry_path: str = WORKSPACE_REGISTRY_FILE,
+                 capacity: int = WARM_WORKSPACE_LIMIT):
+        """
+        워크스페이스 관리자 초기화
+        
+        Args:
+            registry_path (str): 워크스페이스 목록 파일 경로
+            capacity (int): 메모리에 유지할 최대 워크스페이스 수
+        """
+        self.registry_path = registry_path
+        self.capacity = max(1, capacity)
+        self.workspaces: List[Dict[str, str]] = []
+        self._warm: "OrderedDict[str, Workspace]" = OrderedDict()
+        self.load_registry()
+    
+    def load_registry(self) -> None:
+        """워크스페이스 목록을 로드합니다 (없으면 기본 메모 파일을 등록)."""
+        try:
+            if os.path.exists(self.registry_path):
+                with open(self.registry_path, 'r', encoding='utf-8') as file:
+                    self.workspaces = json.load(file)
+        except (json.JSONDecodeError, OSError) as e:
+            print(f"워크스페이스 목록 로드 중 오류 발생: {e}")
+            self.workspaces = []
+        
+        if not self.workspaces:
+            self.workspaces = [{"name": "기본", "path": DEFAULT_STORE_PATH}]
+    
+    def save_registry(self) -> bool:
+        """워크스페이스 목록을 저장합니다 (최근 사용 순)."""
+        try:
+            with open(self.registry_path, 'w', encoding='utf-8') as file:
+                json.dump(self.workspaces, file, ensure_ascii=False, indent=2)
+            return True
+        except OSError as e:
+            print(f"워크스페이스 목록 저장 중 오류 발생: {e}")
+            return False
+    
+    def _find(self, file_path: str) -> Optional[Dict[str, str]]:
+        """경로로 등록된 워크스페이스 항목을 찾습니다."""
+        key = os.path.abspath(file_path)
+        for entry in self.workspaces:
+            if os.path.abspath(entry["path"]) == key:
+                return entry
+        return None
+    
+    def get_last_path(self) -> str:
+        """마지막으로 사용한 워크스페이스의 메모 파일 경로를 가져옵니다."""
+        return self.workspaces[0]["path"]
+    
+    def add(self, name: str, file_path: str) -> Dict[str, str]:
+        """
+        워크스페이스를 등록합니다 (이미 있으면 이름만 바꿈).
+        
+        Args:
+            name (str): 워크스페이스 이름
+            file_path (str): 메모 JSON 파일 경로
+            
+        Returns:
+            Dict[str, str]: 등록된 항목 {"name", "path"}
+        """
+        entry = self._find(file_path)
+        if entry is None:
+            entry = {"name": name, "path": file_path}
+            self.workspaces.append(entry)
+        else:
+            entry["name"] = name
+        self.save_registry()
+        return entry
+    
+    def remove(self, file_path: str) -> bool:
+        """
+        워크스페이스를 목록에서 제거합니다 (메모 파일은 지우지 않음).
+        
+        Args:
+            file_path (str): 메모 JSON 파일 경로
+            
+        Returns:
+            bool: 제거 여부 (마지막 하나는 제거할 수 없음)
+        """
+        entry = self._find(file_path)
+        if entry is None or len(self.workspaces) == 1:
+            return False
+        self.workspaces.remove(entry)
+        workspace = self._warm.pop(os.path.abspath(file_path), None)
+        if workspace is not None:
+            workspace.close()
+        self.save_registry()
+        return True
+    
+    def open(self, file_path: str) -> Workspace:
+        """
+        워크스페이스를 엽니다. 메모리에 남아 있으면 로드 없이 그대로 돌려줍니다.
+        
+        Args:
+            file_path (str): 메모 JSON 파일 경로
+            
+        Returns:
+            Workspace: 열린 워크스페이스
+        """
+        entry = self._find(file_path) or self.add(
+            os.path.splitext(os.path.basename(file_path))[0], file_path)
+        # 최근 사용 순서를 목록 파일에도 반영
+        self.workspaces.remove(entry)
+        self.workspaces.insert(0, entry)
+        self.save_registry()
+        
+        key = os.path.abspath(file_path)
+        workspace = self._warm.get(key)
+        if workspace is not None:
+            self._warm.move_to_end(key)
+            workspace.name = entry["name"]
+            return workspace
+        
+        workspace = Workspace(entry["name"], entry["path"])
+        self._warm[key] = workspace
+        while len(self._warm) > self.capacity:
+            _, evicted = self._warm.popitem(last=False)
+            evicted.close()
+        return workspace
+    
+    def is_warm(self, file_path: str) -> bool:
+        """워크스페이스가 메모리에 유지 중인지 확인합니다."""
+        return os.path.abspath(file_path) in self._warm
+    
+    def close_all(self) -> None:
+        """메모리에 유지 중인 모든 워크스페이스를 닫습니다."""
+        while self._warm:
+            _, workspace = self._warm.popitem(last=False)
+            workspace.close()